@@ -9,8 +9,15 @@ from typing import List, Dict, Optional
 from urllib.parse import urlencode
 import os
 import sys
+import threading
 from dotenv import load_dotenv
 import boto3 
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 #s3 env variables
@@ -48,7 +55,11 @@ class ArcGISOnlineClient:
             token: Authentication token (if required for private services)
         """
         self.token = token
+        self.token_expires = None
         self.session = requests.Session()
+        # requests.Session is not documented as thread-safe, so paged-query workers each get their own
+        self._local = threading.local()
+        self._local.session = self.session
     
     def generate_token(self, username: str, password: str, 
                       portal_url: str = None) -> str:
@@ -82,10 +93,18 @@ class ArcGISOnlineClient:
         result = response.json()
         if 'token' in result:
             self.token = result['token']
+            self.token_expires = result.get('expires')
             return result['token']
         else:
             raise Exception(f"Token generation failed: {result}")
     
+    def _thread_session(self) -> requests.Session:
+        """HTTP session for the calling thread (the client's own session on the creating thread)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
     def _make_request(self, url: str, params: Dict = None) -> Dict:
         """Make a request to ArcGIS REST API"""
         if params is None:
@@ -101,7 +120,7 @@ class ArcGISOnlineClient:
         
         try:
             headers = {'Referer': 'https://services6.arcgis.com'}
-            response = self.session.get(url, params=params, headers=headers)
+            response = self._thread_session().get(url, params=params, headers=headers)
             response.raise_for_status()
             result = response.json()
             
@@ -117,7 +136,8 @@ class ArcGISOnlineClient:
             raise
     
     def query_layer(self, service_url: str, where_clause: str = "1=1", 
-                   return_geometry: bool = False, max_records: int = 1000) -> List[Dict]:
+                   return_geometry: bool = False, max_records: int = 1000,
+                   result_offset: int = 0, order_by: Optional[str] = None) -> List[Dict]:
         """
         Query a feature layer or table
         
@@ -126,6 +146,8 @@ class ArcGISOnlineClient:
             where_clause: SQL where clause for filtering
             return_geometry: Whether to return geometry (for feature layers)
             max_records: Maximum number of records to return
+            result_offset: Number of records to skip (for paging)
+            order_by: orderByFields value, e.g. "OBJECTID ASC" (needed for stable paging)
             
         Returns:
             List of feature attributes
@@ -139,6 +161,10 @@ class ArcGISOnlineClient:
             'outSR': '4326',
             'resultRecordCount': max_records
         }
+        if result_offset:
+            params['resultOffset'] = result_offset
+        if order_by:
+            params['orderByFields'] = order_by
         
         result = self._make_request(query_url, params)
         
@@ -148,6 +174,47 @@ class ArcGISOnlineClient:
             print(f"No features found or error: {result}")
             return []
     
+    def query_count(self, service_url: str, where_clause: str = "1=1") -> int:
+        """Return the number of records matching the where clause"""
+        result = self._make_request(f"{service_url}/query", {
+            'where': where_clause,
+            'returnCountOnly': 'true'
+        })
+        return result.get('count', 0)
+    
+    def query_layer_paged(self, service_url: str, where_clause: str = "1=1",
+                          page_size: int = 1000, max_workers: int = 4) -> List[Dict]:
+        """
+        Query all matching records, fetching server pages concurrently
+        
+        Args:
+            service_url: URL to the feature service layer
+            where_clause: SQL where clause for filtering
+            page_size: Records requested per page (keep at or below the service maxRecordCount)
+            max_workers: Maximum number of pages fetched at once
+            
+        Returns:
+            List of feature attributes (in object ID order when more than one page is fetched)
+        """
+        total = self.query_count(service_url, where_clause)
+        offsets = list(range(0, total, page_size))
+        if len(offsets) <= 1:
+            return self.query_layer(service_url, where_clause, max_records=page_size)
+        
+        # Offset paging needs a fixed order, or pages can overlap or skip records; the
+        # object ID field is named per layer (OBJECTID, FID, OBJECTID_1, ...)
+        object_id_field = self.get_service_info(service_url).get('objectIdField')
+        order_by = f"{object_id_field} ASC" if object_id_field else None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            pages = executor.map(
+                lambda offset: self.query_layer(service_url, where_clause,
+                                                max_records=page_size, result_offset=offset,
+                                                order_by=order_by),
+                offsets
+            )
+            return [record for page in pages for record in page]
+    
     def get_service_info(self, service_url: str) -> Dict:
         """Get information about a service"""
         return self._make_request(service_url)
@@ -441,14 +508,24 @@ def main():
         # print(f"\n✓ Results saved to: {output_file}")
         # print(f"✓ Found {len(project_details)} projects for resource '{resource_name}'")
         s3object = s3.Object(AWS_S3_BUCKET, PROJECTS_PATH)
-        s3object.put(Body=(bytes(json.dumps(project_details, indent=2, default=str).encode('UTF-8'))))
+        if orjson:
+            body = orjson.dumps(project_details, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            body = json.dumps(project_details, indent=2, default=str).encode('UTF-8')
+        s3object.put(Body=body)
         print(f"\n✓ Results uploaded to S3 at: s3://{AWS_S3_BUCKET}/{PROJECTS_PATH}")
         print(f"✓ Found {len(project_details)} projects for resource '{resource_name}'")
+        return len(project_details)
     except Exception as e:
         print(f"Error occurred: {e}")
         import traceback
         traceback.print_exc()
 
 
+def refresh_from_s3() -> int:
+    """Refresh the projects JSON in S3 in-process; returns the number of projects uploaded (0 on failure)"""
+    return main() or 0
+
+
 if __name__ == "__main__":
     main()
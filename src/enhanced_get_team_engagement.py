@@ -16,58 +16,100 @@ Author: Generated for Cole Folkers
 Date: August 2025
 """
 
-import requests
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Tuple
 from collections import defaultdict
+import heapq
 from dotenv import load_dotenv
 import os
 import sys
-import importlib.util
-from typing import List, Dict, Any, Optional
+import threading
+import time
 
 
 load_dotenv()
 
+# Project metadata fields checked (in order) for the coordinator fallback
+COORDINATOR_FIELDS = ('Project_Manager', 'Coordinator', 'Project_Lead', 'Lead_Scientist')
+
+# Role recorded when a project has no assigned resources and its coordinator is assumed;
+# interned and shared by every fallback record so role comparisons hit the identity fast path
+DEFAULT_COORDINATOR_ROLE = sys.intern('Coordinator (default)')
+
+# Roles counted as coordination work in the role distribution
+COORDINATOR_ROLES = frozenset({'Coordinator', DEFAULT_COORDINATOR_ROLE})
+
+# Workload bucket label indexed by min(project count, 5)
+WORKLOAD_BUCKETS = ('1 project', '1 project', '2 projects', '3 projects', '4 projects', '5+ projects')
+
+# (name, status) used when a resource references a project outside the CRP set
+UNKNOWN_PROJECT_INFO = ('Unknown Project', 'Unknown')
+
+# Authenticated ArcGIS client shared by all analyzer instances
+_SHARED_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# Regenerate the shared token when it is this close to expiring
+TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+
+
+def _token_expiring(client) -> bool:
+    """Check whether the client's token is missing or expires within the refresh margin"""
+    if not client.token:
+        return True
+    expires = getattr(client, 'token_expires', None)
+    if not expires:
+        return False
+    # ArcGIS reports token expiry as epoch milliseconds
+    return expires / 1000 - time.time() <= TOKEN_REFRESH_MARGIN_SECONDS
+
+
 class TeamEngagementAnalyzer:
     """Analyzer for team engagement across CRP/Caribou projects"""
     
     def __init__(self):
         """Initialize the analyzer with ArcGIS client"""
         self.client = None
+        
+        # Bumped whenever analyze_engagement_data rebuilds the summary; keys the distribution caches
+        self._engagement_version = 0
+        self._distribution_cache = None
         self._initialize_arcgis_client()
     
     def _initialize_arcgis_client(self):
-        """Initialize ArcGIS client using the same logic as enhanced_get_projects.py"""
-        try:
-            # Import the ArcGIS client from the working enhanced_get_projects.py
-            spec = importlib.util.spec_from_file_location(
-                "enhanced_get_projects", 
-                "/home/cfolkers/caribou_portal/enhanced_get_projects.py"
-            )
-            enhanced_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(enhanced_module)
-            
-            # Use the same ArcGISOnlineClient class
-            self.client = enhanced_module.ArcGISOnlineClient()
-            
-            # Get credentials from environment (same as enhanced_get_projects.py)
-            username = os.getenv('ARCGIS_USERNAME')
-            password = os.getenv('ARCGIS_PASSWORD')
-            
-            if username and password:
-                print("Generating ArcGIS authentication token for team engagement analysis...")
-                self.client.generate_token(username, password)
-                print("✓ ArcGIS token generated successfully")
-            else:
-                print("❌ ArcGIS credentials not found in environment")
-                print("Please ensure ARCGIS_USERNAME and ARCGIS_PASSWORD are set in .env file")
-                self.client = None
+        """Initialize ArcGIS client using the same logic as enhanced_get_projects_s3.py"""
+        global _SHARED_CLIENT
+        
+        with _CLIENT_LOCK:
+            # Reuse the authenticated client from a previous analyzer while its token is still valid
+            if _SHARED_CLIENT is not None and not _token_expiring(_SHARED_CLIENT):
+                self.client = _SHARED_CLIENT
+                return
+            
+            try:
+                # Reuse the ArcGISOnlineClient from the sibling module (cached in sys.modules after first import)
+                from enhanced_get_projects_s3 import ArcGISOnlineClient
                 
-        except Exception as e:
-            print(f"Error initializing ArcGIS client for team engagement: {e}")
-            import traceback
-            traceback.print_exc()
-            self.client = None
+                self.client = _SHARED_CLIENT or ArcGISOnlineClient()
+                
+                # Get credentials from environment (same as enhanced_get_projects_s3.py)
+                username = os.getenv('ARCGIS_USERNAME')
+                password = os.getenv('ARCGIS_PASSWORD')
+                
+                if username and password:
+                    print("Generating ArcGIS authentication token for team engagement analysis...")
+                    self.client.generate_token(username, password)
+                    print("✓ ArcGIS token generated successfully")
+                    _SHARED_CLIENT = self.client
+                else:
+                    print("❌ ArcGIS credentials not found in environment")
+                    print("Please ensure ARCGIS_USERNAME and ARCGIS_PASSWORD are set in .env file")
+                    self.client = None
+                    
+            except Exception as e:
+                print(f"Error initializing ArcGIS client for team engagement: {e}")
+                import traceback
+                traceback.print_exc()
+                self.client = None
     
     def get_all_crp_projects(self) -> List[Dict]:
         """Get all CRP/Caribou projects from ArcGIS Online (current and completed)"""
@@ -82,8 +124,8 @@ class TeamEngagementAnalyzer:
             
             print("Querying all projects from ArcGIS...")
             
-            # Get ALL projects regardless of status (current and completed)
-            all_projects = self.client.query_layer(projects_url, "1=1", max_records=2000)
+            # Get ALL projects regardless of status (current and completed), pages fetched concurrently
+            all_projects = self.client.query_layer_paged(projects_url, "1=1")
             
             # Filter for CRP/Caribou projects by name
             crp_projects = []
@@ -190,8 +232,15 @@ class TeamEngagementAnalyzer:
             crp_resources = self.get_all_crp_resources(crp_projects)
             
             # Step 3: Create project lookup by Project_ID for coordinator fallback
+            # (name/status resolved once per project instead of once per resource)
             print("Step 3: Building project coordinator lookup...")
-            projects_by_project_id = {project.get('Project_ID'): project for project in crp_projects}
+            project_info_by_id = {
+                project.get('Project_ID'): (
+                    project.get('Project_Name', 'Unknown Project'),
+                    project.get('Project_Status', 'Unknown')
+                )
+                for project in crp_projects
+            }
             
             # Step 4: Analyze engagement data with coordinator fallback logic
             print("Step 4: Analyzing engagement data...")
@@ -205,6 +254,9 @@ class TeamEngagementAnalyzer:
             # Track which projects have assigned resources
             projects_with_resources = set()
             
+            # (person, project) pairs already counted, so multiple roles on one project count once
+            seen_pairs = set()
+            
             # Process assigned resources first
             for resource in crp_resources:
                 person_name = resource.get('Resource_Name')
@@ -214,10 +266,13 @@ class TeamEngagementAnalyzer:
                 if person_name and project_id:
                     projects_with_resources.add(project_id)
                     
+                    if (person_name, project_id) in seen_pairs:
+                        engagement_by_person[person_name]['roles'].add(resource_type)
+                        continue
+                    seen_pairs.add((person_name, project_id))
+                    
                     # Get project details
-                    project = projects_by_project_id.get(project_id, {})
-                    project_name = project.get('Project_Name', 'Unknown Project')
-                    project_status = project.get('Project_Status', 'Unknown')
+                    project_name, project_status = project_info_by_id.get(project_id, UNKNOWN_PROJECT_INFO)
                     
                     engagement_by_person[person_name]['total_projects'] += 1
                     engagement_by_person[person_name]['projects'].append({
@@ -231,39 +286,42 @@ class TeamEngagementAnalyzer:
             
             # Step 5: Apply coordinator fallback logic (only if no resources found)
             print("Step 5: Applying coordinator fallback logic...")
-            for project in crp_projects:
+            # If project has no assigned resources, assume coordinator is working on it
+            unassigned_projects = [
+                project for project in crp_projects
+                if project.get('Project_ID') and project.get('Project_ID') not in projects_with_resources
+            ]
+            for project in unassigned_projects:
                 project_id = project.get('Project_ID')
                 
-                # If project has no assigned resources, assume coordinator is working on it
-                if project_id and project_id not in projects_with_resources:
-                    # Try to find the coordinator from project metadata
-                    coordinator_name = None
-                    
-                    # Look for coordinator in various possible fields (excluding client fields)
-                    possible_coordinator_fields = ['Project_Manager', 'Coordinator', 'Project_Lead', 'Lead_Scientist']
-                    for field in possible_coordinator_fields:
-                        if project.get(field):
-                            coordinator_name = project.get(field)
-                            break
+                # Look for coordinator in various possible fields (excluding client fields)
+                coordinator_name = next(
+                    (project[field] for field in COORDINATOR_FIELDS if project.get(field)),
+                    None
+                )
+                
+                # If no coordinator found in metadata, skip this project
+                if coordinator_name:
+                    project_name, project_status = project_info_by_id[project_id]
                     
-                    # If no coordinator found in metadata, skip this project
-                    if coordinator_name:
-                        project_name = project.get('Project_Name', 'Unknown Project')
-                        project_status = project.get('Project_Status', 'Unknown')
-                        
-                        engagement_by_person[coordinator_name]['total_projects'] += 1
-                        engagement_by_person[coordinator_name]['projects'].append({
-                            'name': project_name,
-                            'project_id': project_id,
-                            'status': project_status,
-                            'role': 'Coordinator (default)'
-                        })
-                        engagement_by_person[coordinator_name]['roles'].add('Coordinator (default)')
-                        engagement_by_person[coordinator_name]['project_statuses'][project_status] += 1
-            
-            # Convert sets to lists for JSON serialization
+                    engagement_by_person[coordinator_name]['total_projects'] += 1
+                    engagement_by_person[coordinator_name]['projects'].append({
+                        'name': project_name,
+                        'project_id': project_id,
+                        'status': project_status,
+                        'role': DEFAULT_COORDINATOR_ROLE
+                    })
+                    engagement_by_person[coordinator_name]['roles'].add(DEFAULT_COORDINATOR_ROLE)
+                    engagement_by_person[coordinator_name]['project_statuses'][project_status] += 1
+            
+            # Classify each person once (explicit vs fallback work), then convert sets to lists for JSON serialization
             for person_data in engagement_by_person.values():
-                person_data['roles'] = list(person_data['roles'])
+                roles = person_data['roles']
+                person_data['has_actual_role'] = bool(roles - {DEFAULT_COORDINATOR_ROLE})
+                person_data['explicit_projects'] = sum(
+                    1 for project in person_data['projects'] if project['role'] != DEFAULT_COORDINATOR_ROLE
+                )
+                person_data['roles'] = list(roles)
             
             print(f"Step 6: Analysis complete!")
             print(f"  - {len(crp_projects)} CRP/Caribou projects found (current and completed)")
@@ -272,94 +330,7 @@ class TeamEngagementAnalyzer:
             print(f"  - {len(crp_projects) - len(projects_with_resources)} projects using coordinator fallback")
             print(f"  - {len(engagement_by_person)} people engaged")
             
-            return {
-                'engagement_summary': engagement_by_person,
-                'total_projects': len(crp_projects),
-                'total_people': len(engagement_by_person),
-                'error': None
-            }
-            
-            if not project_ids:
-                return {
-                    'engagement_summary': {},
-                    'total_projects': len(crp_projects),
-                    'total_people': 0,
-                    'error': 'No valid Project_IDs found in CRP/Caribou projects'
-                }
-            
-            # Get all resource assignments
-            print("Step 2: Getting resource assignments...")
-            crp_resources = self.get_all_crp_resources(project_ids)
-            
-            if not crp_resources:
-                return {
-                    'engagement_summary': {},
-                    'total_projects': len(crp_projects),
-                    'total_people': 0,
-                    'error': 'No resource assignments found for CRP/Caribou projects'
-                }
-            
-            # Create project lookup for efficiency
-            project_lookup = {str(p.get('Project_ID', '')): p for p in crp_projects}
-            
-            # Analyze by person
-            print("Step 3: Analyzing engagement by person...")
-            engagement_by_person = {}
-            
-            for resource in crp_resources:
-                person_name = resource.get('Resource_Name', 'Unknown')
-                project_id = str(resource.get('Resource_Project_ID', ''))
-                resource_type = resource.get('Resource_Type', 'Unknown')
-                
-                # Skip if essential data is missing
-                if not person_name or person_name == 'Unknown' or not project_id:
-                    continue
-                
-                # Initialize person data if not exists
-                if person_name not in engagement_by_person:
-                    engagement_by_person[person_name] = {
-                        'total_projects': 0,
-                        'coordinator_projects': 0,
-                        'team_member_projects': 0,
-                        'projects': [],
-                        'roles': set()
-                    }
-                
-                person_data = engagement_by_person[person_name]
-                
-                # Check if this project is already counted for this person
-                # (avoid double-counting if person has multiple roles on same project)
-                existing_project_ids = [p['project_id'] for p in person_data['projects']]
-                if project_id not in existing_project_ids:
-                    person_data['total_projects'] += 1
-                    
-                    # Add project details
-                    project_info = project_lookup.get(project_id, {})
-                    person_data['projects'].append({
-                        'project_id': project_id,
-                        'project_name': project_info.get('Project_Name', 'Unknown'),
-                        'project_number': project_info.get('Project_Number', 'N/A'),
-                        'role': resource_type,
-                        'project_status': project_info.get('Project_Status', 'Unknown')
-                    })
-                
-                # Track roles
-                person_data['roles'].add(resource_type)
-                
-                # Count by role type
-                if resource_type == 'Coordinator':
-                    person_data['coordinator_projects'] += 1
-                else:
-                    person_data['team_member_projects'] += 1
-            
-            # Convert sets to lists for JSON serialization
-            for person in engagement_by_person:
-                engagement_by_person[person]['roles'] = list(engagement_by_person[person]['roles'])
-            
-            print(f"Step 4: Analysis complete!")
-            print(f"  - {len(crp_projects)} CRP/Caribou projects found")
-            print(f"  - {len(crp_resources)} resource assignments found")
-            print(f"  - {len(engagement_by_person)} people engaged")
+            self._engagement_version += 1
             
             return {
                 'engagement_summary': engagement_by_person,
@@ -367,7 +338,7 @@ class TeamEngagementAnalyzer:
                 'total_people': len(engagement_by_person),
                 'error': None
             }
-            
+
         except Exception as e:
             print(f"Error analyzing engagement data: {e}")
             import traceback
@@ -379,49 +350,46 @@ class TeamEngagementAnalyzer:
                 'error': str(e)
             }
     
-    def get_workload_distribution(self, engagement_data: Dict) -> Dict[str, int]:
-        """Analyze workload distribution by project count"""
-        workload_counts = {}
-        
-        for person_name, person_data in engagement_data.items():
-            total = person_data['total_projects']
-            if total <= 1:
-                category = '1 project'
-            elif total <= 2:
-                category = '2 projects'
-            elif total <= 3:
-                category = '3 projects'
-            elif total <= 4:
-                category = '4 projects'
-            else:
-                category = '5+ projects'
-            
-            workload_counts[category] = workload_counts.get(category, 0) + 1
+    def get_engagement_distributions(self, engagement_data: Dict) -> Dict[str, Dict[str, int]]:
+        """Workload and role distributions built together in one pass over the people"""
+        cache_key = (self._engagement_version, id(engagement_data))
+        if self._distribution_cache and self._distribution_cache[0] == cache_key:
+            return self._distribution_cache[1]
         
-        return workload_counts
-    
-    def get_role_distribution(self, engagement_data: Dict) -> Dict[str, int]:
-        """Analyze role distribution across people"""
+        workload_counts = {}
         role_stats = {'Coordinator': 0, 'Other': 0, 'Both': 0}
         
         for person_name, person_data in engagement_data.items():
-            roles = person_data['roles']
-            if 'Coordinator' in roles and 'Other' in roles:
+            # Workload bucket by project count (every person has at least one project)
+            category = WORKLOAD_BUCKETS[min(person_data['total_projects'], 5)]
+            workload_counts[category] = workload_counts.get(category, 0) + 1
+            
+            # Coordination vs other roles
+            roles = set(person_data['roles'])
+            has_coordinator = not roles.isdisjoint(COORDINATOR_ROLES)
+            has_other = bool(roles - COORDINATOR_ROLES)
+            if has_coordinator and has_other:
                 role_stats['Both'] += 1
-            elif 'Coordinator' in roles:
+            elif has_coordinator:
                 role_stats['Coordinator'] += 1
             else:
                 role_stats['Other'] += 1
         
-        return role_stats
+        distributions = {'workload': workload_counts, 'roles': role_stats}
+        self._distribution_cache = (cache_key, distributions)
+        return distributions
+    
+    def get_workload_distribution(self, engagement_data: Dict) -> Dict[str, int]:
+        """Analyze workload distribution by project count"""
+        return self.get_engagement_distributions(engagement_data)['workload']
+    
+    def get_role_distribution(self, engagement_data: Dict) -> Dict[str, int]:
+        """Analyze role distribution across people"""
+        return self.get_engagement_distributions(engagement_data)['roles']
     
     def get_top_engaged_people(self, engagement_data: Dict, limit: int = 10) -> List[tuple]:
         """Get the most engaged people sorted by project count"""
-        return sorted(
-            engagement_data.items(), 
-            key=lambda x: x[1]['total_projects'], 
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, engagement_data.items(), key=lambda x: x[1]['total_projects'])
     
     def validate_configuration(self) -> Dict[str, Any]:
         """Validate that all required configuration is available"""
@@ -520,9 +488,7 @@ class TeamEngagementAnalyzer:
     
     def get_top_clients(self, client_data: Dict, top_n: int = 10) -> List[Tuple[str, Dict]]:
         """Get the top N clients by project count"""
-        clients = [(name, data) for name, data in client_data.items()]
-        clients.sort(key=lambda x: x[1]['total_projects'], reverse=True)
-        return clients[:top_n]
+        return heapq.nlargest(top_n, client_data.items(), key=lambda x: x[1]['total_projects'])
 
 
 def main():
@@ -4,16 +4,26 @@ PMBOK-Aligned Project Management Dashboard for Caribou Portal
 Implements PMI PMBOK 7th Edition standards with 10 Knowledge Areas and 5 Process Groups
 """
 
+import atexit
 import json
+import logging
 import os
-import sys
-import glob
+import re
+import threading
+import time
+from functools import lru_cache, partial
+import inspect
+from html import escape
+import itertools
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from nicegui import ui
+from nicegui import app, run, ui
 import requests
 from dotenv import load_dotenv
 import boto3 
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import enhanced_get_projects_s3
 
 # Optional imports
 try:
@@ -22,6 +32,34 @@ except ImportError:
     yaml = None
     print("PyYAML not installed, Dendron integration features will be limited")
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', None) or getattr(yaml, 'SafeLoader', None)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyromark
+except ImportError:
+    pyromark = None
+
+# Same GFM extensions ui.markdown renders (tables, strikethrough, task lists); pyromark releases
+# without html()/Options fall back to ui.markdown. NiceGUI 3 requires an explicit sanitize choice for ui.html
+_PYROMARK_HTML = None
+if hasattr(pyromark, 'html') and hasattr(pyromark, 'Options'):
+    _PYROMARK_HTML = partial(pyromark.html, options=pyromark.Options.ENABLE_TABLES
+                             | pyromark.Options.ENABLE_STRIKETHROUGH | pyromark.Options.ENABLE_TASKLISTS)
+_UI_HTML_KWARGS = {'sanitize': False} if 'sanitize' in inspect.signature(ui.html).parameters else {}
+
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 #s3 env variables
 AWS_ACCESS_KEY_ID = os.environ["AWS_ACCESS_KEY_ID"]
@@ -31,130 +69,672 @@ AWS_S3_BUCKET = os.environ["AWS_S3_BUCKET"]
 STATUS_PATH= os.environ["STATUS_PATH"]
 PROJECTS_PATH= os.environ["PROJECTS_PATH"]
 
+# Single shared client (boto3 clients are thread-safe); larger pool + keep-alive so
+# concurrent page handlers reuse connections instead of waiting on the default pool of 10
 s3_client = boto3.client(
     "s3",
     endpoint_url=AWS_S3_ENDPOINT,
     aws_access_key_id=AWS_ACCESS_KEY_ID,
     aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    config=Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 3, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+    ),
 )
 bucket = AWS_S3_BUCKET
 
+# Date part of Date_Required/Required_Date strings: ISO (YYYY-MM-DD) or US (MM/DD/YYYY),
+# optionally followed by a 'T' or ' ' time component
+DUE_DATE_RE = re.compile(r'(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4}))(?:[T ]|$)')
+
+# Keyword fallbacks for statuses outside the predefined categories, checked in order
+STATUS_KEYWORD_RULES = tuple(
+    (re.compile('|'.join(keywords), re.IGNORECASE), category_key)
+    for keywords, category_key in (
+        (('progress', 'active', 'working'), 'in_progress'),
+        (('client', 'feedback', 'review'), 'awaiting_client'),
+        (('hold', 'pause', 'suspend'), 'on_hold'),
+        (('complete', 'done', 'finish'), 'completed'),
+        (('cancel', 'terminate'), 'cancelled'),
+    )
+)
+
+# Action-item text helpers: non-blank lines (captured without surrounding whitespace),
+# line starts lacking a bullet, and the bullet prefix itself
+_ACTION_LINE_RE = re.compile(r'^[^\S\n]*(\S[^\n]*?)[^\S\n]*$', re.MULTILINE)
+_UNBULLETED_LINE_RE = re.compile(r'^(?=[^•])', re.MULTILINE)
+_BULLET_PREFIX_RE = re.compile(r'^• ', re.MULTILINE)
+
+# Dendron wiki links: [[note.name|Display Name]] or [[note.name]]
+_DENDRON_LINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
+
+# Opening/closing line of a fenced code block (``` or ~~~, up to three spaces of indent)
+_CODE_FENCE_RE = re.compile(r' {0,3}(`{3,}|~{3,})')
+
+# Sentinel for "not computed yet" where None is a valid cached result
+_UNSET = object()
+
+# Seconds to wait after a status-override edit before writing to S3, so bursts share one PutObject
+OVERRIDES_FLUSH_DELAY_S = 1.0
+
+# Longest wait between retries of a failed status-override write (the delay doubles per failure)
+OVERRIDES_RETRY_MAX_S = 60.0
+
+# Height of the portfolio table's scroll viewport (rows outside it are not rendered)
+TABLE_VIEWPORT_PX = 720
+
+# Seconds the dashboard waits after a status save before rebuilding; saves within it share one rebuild
+DASHBOARD_REFRESH_DEBOUNCE_S = 0.25
+
+# Characters of notes/actions shown in a portfolio table cell before it is opened for editing
+EDITOR_PREVIEW_CHARS = 40
+
+# Seconds a page load may reuse the last data refresh instead of re-checking S3
+PAGE_REFRESH_TTL_S = 5.0
+
+# Seconds a Dendron status (permissions and note counts) stays valid before the vault is probed again
+DENDRON_NOTE_COUNT_TTL_S = 60.0
+
+# Projects files larger than this are stream-parsed (with ijson) instead of read into memory whole
+PROJECTS_STREAM_THRESHOLD_BYTES = 8_000_000
+
+
+# PMBOK Process Groups
+_PROCESS_GROUPS = {
+    'initiating': 'Initiating',
+    'planning': 'Planning', 
+    'executing': 'Executing',
+    'monitoring': 'Monitoring & Controlling',
+    'closing': 'Closing'
+}
+
+# Process group tooltips on the dashboard
+_PROCESS_TOOLTIPS = {
+    'initiating': 'Initiating: Projects in the early startup phase, defining project scope, objectives, and stakeholders',
+    'planning': 'Planning: Projects developing detailed project management plans, schedules, budgets, and resource allocation',
+    'executing': 'Executing: Projects actively performing the work defined in the project management plan',
+    'monitoring': 'Monitoring & Controlling: Projects tracking progress, managing changes, and ensuring deliverables meet quality standards',
+    'closing': 'Closing: Projects completing final deliverables, obtaining stakeholder approval, and formal project closure'
+}
+
+# Enhanced Project Status Categories
+_PROJECT_STATUS_CATEGORIES = {
+    'not_assigned': {
+        'name': 'Not Assigned',
+        'description': 'Projects without assigned team members or lead',
+        'color': 'red',
+        'icon': 'person_off',
+        'statuses': ['Not Assigned', 'Unassigned', 'Pending Assignment']
+    },
+    'not_started': {
+        'name': 'Not Started',
+        'description': 'Projects assigned but work not yet begun',
+        'color': 'gray',
+        'icon': 'schedule',
+        'statuses': ['Assigned', 'New', 'Queued']
+    },
+    'in_progress': {
+        'name': 'In Progress',
+        'description': 'Active project work underway',
+        'color': 'blue',
+        'icon': 'play_arrow',
+        'statuses': ['In Progress', 'Active', 'Working']
+    },
+    'awaiting_client': {
+        'name': 'Awaiting Client Feedback',
+        'description': 'Waiting for client input or approval',
+        'color': 'yellow',
+        'icon': 'feedback',
+        'statuses': ['Awaiting Client Feedback', 'Client Review', 'Pending Client']
+    },
+    'awaiting_resources': {
+        'name': 'Awaiting Resources',
+        'description': 'Blocked waiting for team members or tools',
+        'color': 'orange',
+        'icon': 'people',
+        'statuses': ['Awaiting Resources', 'Resource Blocked', 'Team Unavailable']
+    },
+    'on_hold': {
+        'name': 'On Hold',
+        'description': 'Temporarily paused projects',
+        'color': 'red',
+        'icon': 'pause',
+        'statuses': ['On Hold', 'Paused', 'Suspended']
+    },
+    'quality_review': {
+        'name': 'Quality Review',
+        'description': 'Under quality assurance or technical review',
+        'color': 'purple',
+        'icon': 'fact_check',
+        'statuses': ['Quality Review', 'QA Review', 'Technical Review']
+    },
+    'completed': {
+        'name': 'Completed',
+        'description': 'Successfully completed projects',
+        'color': 'green',
+        'icon': 'check_circle',
+        'statuses': ['Completed', 'Done', 'Finished', 'Delivered']
+    },
+    'cancelled': {
+        'name': 'Cancelled',
+        'description': 'Cancelled or terminated projects',
+        'color': 'gray',
+        'icon': 'cancel',
+        'statuses': ['Cancelled', 'Terminated', 'Discontinued']
+    }
+}
+
+# Reverse lookup: exact status string -> category key
+_STATUS_TO_CATEGORY = {
+    status: category_key
+    for category_key, category_info in _PROJECT_STATUS_CATEGORIES.items()
+    for status in category_info['statuses']
+}
+
+# Every predefined status, labelled with its category, for the status picker
+_STATUS_SELECT_OPTIONS = {
+    status: f"{status} ({category_info['name']})"
+    for category_info in _PROJECT_STATUS_CATEGORIES.values()
+    for status in category_info['statuses']
+}
+
+# Statuses offered by the dashboard's quick status-update dialog
+_DIALOG_STATUS_OPTIONS = [
+    'Not Assigned',
+    'Not Started',
+    'In Progress', 
+    'Client Review',
+    'Awaiting Resources',
+    'On Hold',
+    'Completed'
+]
+
+# Portfolio table row and status button classes per status category color. Spelled out in full
+# so Tailwind can see every class name (no f-string class names)
+_STATUS_ROW_CLASSES = {
+    'red': 'hover:bg-red-100 border-l-4 border-red-500 bg-red-50 transition-colors',
+    'gray': 'hover:bg-gray-100 border-l-4 border-gray-500 bg-gray-50 transition-colors',
+    'blue': 'hover:bg-blue-100 border-l-4 border-blue-500 bg-blue-50 transition-colors',
+    'yellow': 'hover:bg-yellow-100 border-l-4 border-yellow-500 bg-yellow-50 transition-colors',
+    'orange': 'hover:bg-orange-100 border-l-4 border-orange-500 bg-orange-50 transition-colors',
+    'purple': 'hover:bg-purple-100 border-l-4 border-purple-500 bg-purple-50 transition-colors',
+    'green': 'hover:bg-green-100 border-l-4 border-green-500 bg-green-50 transition-colors',
+}
+_STATUS_BUTTON_CLASSES = {
+    'red': 'px-2 py-1 text-xs font-semibold rounded-full bg-red-500 text-white hover:bg-red-600 transition-colors border-0',
+    'gray': 'px-2 py-1 text-xs font-semibold rounded-full bg-gray-500 text-white hover:bg-gray-600 transition-colors border-0',
+    'blue': 'px-2 py-1 text-xs font-semibold rounded-full bg-blue-500 text-white hover:bg-blue-600 transition-colors border-0',
+    'yellow': 'px-2 py-1 text-xs font-semibold rounded-full bg-yellow-500 text-white hover:bg-yellow-600 transition-colors border-0',
+    'orange': 'px-2 py-1 text-xs font-semibold rounded-full bg-orange-500 text-white hover:bg-orange-600 transition-colors border-0',
+    'purple': 'px-2 py-1 text-xs font-semibold rounded-full bg-purple-500 text-white hover:bg-purple-600 transition-colors border-0',
+    'green': 'px-2 py-1 text-xs font-semibold rounded-full bg-green-500 text-white hover:bg-green-600 transition-colors border-0',
+}
+
+# Portfolio table cell classes, and the full class set per row style (built once, shared by all rows).
+# "Not Assigned" projects get extra prominent bright red styling
+_PORTFOLIO_NAME_CELL_CLASSES = 'px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900 cursor-pointer'
+_PORTFOLIO_CELL_CLASSES = 'px-6 py-4 whitespace-nowrap text-sm text-gray-900 cursor-pointer'
+_PORTFOLIO_CLASSES_BY_COLOR = {
+    color: {
+        'tr': _STATUS_ROW_CLASSES[color],
+        'name_cell': _PORTFOLIO_NAME_CELL_CLASSES,
+        'cell': _PORTFOLIO_CELL_CLASSES,
+        'status_button': _STATUS_BUTTON_CLASSES[color],
+    }
+    for color in _STATUS_ROW_CLASSES
+}
+_PORTFOLIO_NOT_ASSIGNED_CLASSES = {
+    'tr': 'hover:bg-red-200 border-l-4 border-red-600 bg-red-100 transition-colors',
+    'name_cell': 'px-6 py-4 whitespace-nowrap text-sm font-medium text-red-900 cursor-pointer',
+    'cell': 'px-6 py-4 whitespace-nowrap text-sm text-red-900 cursor-pointer',
+    'status_button': 'px-2 py-1 text-xs font-bold rounded-full bg-red-600 text-white hover:bg-red-700 transition-colors border-0 shadow-lg',
+}
+
+# Effective statuses (lowercased) offered for quick note creation on the Dendron page
+_ACTIVE_STATUSES = frozenset({'in progress', 'active'})
+
+# Full-width section card on the project pages, and the notes/actions save buttons
+_SECTION_CARD_CLASSES = 'w-full p-6 mb-6'
+
+# Title of a knowledge-area/detail card and the field captions inside it
+_CARD_TITLE_CLASSES = 'text-xl font-bold mb-4 text-blue-700'
+_FIELD_LABEL_CLASSES = 'font-semibold text-gray-700 mb-2'
+_SAVE_NOTES_BUTTON_CLASSES = 'bg-blue-500 text-white px-4 py-2 self-start'
+_SAVE_ACTIONS_BUTTON_CLASSES = 'bg-green-500 text-white px-4 py-2 self-start'
+
+# Schedule Management rows on the PMBOK project page: (label, schedule performance key)
+_SCHEDULE_ROW_KEYS = (
+    ('Schedule Performance Index (SPI)', 'spi'),
+    ('Schedule Status', 'status'),
+    ('Variance (Days)', 'variance_days'),
+    ('Total Duration (Days)', 'total_duration'),
+    ('Elapsed Duration (Days)', 'elapsed_duration'),
+    ('Remaining Duration (Days)', 'remaining_duration'),
+)
+
+# PMBOK Knowledge Areas
+_KNOWLEDGE_AREAS = {
+    'integration': 'Project Integration Management',
+    'scope': 'Project Scope Management',
+    'schedule': 'Project Schedule Management',
+    'cost': 'Project Cost Management',
+    'quality': 'Project Quality Management',
+    'resource': 'Project Resource Management',
+    'communications': 'Project Communications Management',
+    'risk': 'Project Risk Management',
+    'procurement': 'Project Procurement Management',
+    'stakeholder': 'Project Stakeholder Management'
+}
+
+def json_loads_bytes(data: bytes):
+    """Parse JSON from raw bytes (orjson when available, skips the utf-8 decode copy)"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _frontmatter_yaml(frontmatter: Dict[str, Any]) -> str:
+    """Emit note frontmatter (str/int values and lists of str) as block-style YAML, keys sorted like yaml.dump"""
+    lines = []
+    for key in sorted(frontmatter):
+        value = frontmatter[key]
+        if isinstance(value, list):
+            if value:
+                lines.append(f"{key}:")
+                lines.extend(f"- {json.dumps(str(item), ensure_ascii=False)}" for item in value)
+            else:
+                lines.append(f"{key}: []")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f"{key}: {value}")
+        else:
+            # JSON double-quoted strings are valid YAML scalars and escape anything special
+            lines.append(f"{key}: {json.dumps(str(value), ensure_ascii=False)}")
+    return '\n'.join(lines)
+
+def _read_text_file(path: str) -> str:
+    """Read a UTF-8 text file in one binary read (newlines normalized like text mode)"""
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _read_note_body(path: str) -> str:
+    """Read a note without its YAML frontmatter: the header is skipped line by line and only the body is read in"""
+    with open(path, 'rb') as f:
+        first = f.readline()
+        if first.startswith(b'---'):
+            for line in f:
+                if line.startswith(b'---'):
+                    # Rewind to just past the closing fence and read the rest in one go
+                    f.seek(3 - len(line), os.SEEK_CUR)
+                    text = f.read().decode('utf-8').strip()
+                    break
+            else:
+                # No closing fence: the whole file is the note
+                f.seek(0)
+                text = f.read().decode('utf-8')
+        else:
+            text = (first + f.read()).decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _write_text_file(path: str, content: str):
+    """Write a UTF-8 text file with raw os.write calls, bypassing TextIOWrapper"""
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+@lru_cache(maxsize=1024)
+def _status_category_for(status: str) -> str:
+    """Map a status string to its category key; portfolios reuse a handful of statuses, so this is cached"""
+    project_status = status.strip()
+    
+    if not project_status:
+        return 'not_started'
+        
+    # Check for an exact match against the predefined category statuses
+    category_key = _STATUS_TO_CATEGORY.get(project_status)
+    if category_key:
+        return category_key
+            
+    # If status doesn't match predefined categories, try to infer (first matching rule wins)
+    for keyword_re, inferred_category in STATUS_KEYWORD_RULES:
+        if keyword_re.search(project_status):
+            return inferred_category
+    return 'not_started'  # Default category
+
+@lru_cache(maxsize=1024)
+def _bulleted_actions(actions_text: str) -> str:
+    """Coordinator actions as a bulleted list; cached since every dashboard refresh rebuilds the same rows"""
+    # Keep non-blank lines and add bullets
+    lines = '\n'.join(_ACTION_LINE_RE.findall(actions_text))
+    return _UNBULLETED_LINE_RE.sub('• ', lines)
+
+@lru_cache(maxsize=4096)
+def _format_epoch_ms_date(timestamp_ms) -> str:
+    """Format an ArcGIS epoch-milliseconds value as a local YYYY-MM-DD date (raises like fromtimestamp)"""
+    dt = datetime.fromtimestamp(timestamp_ms / 1000)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+def _iter_markdown_names(root: str):
+    """Yield names of visible .md files under root, one scandir per directory"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_markdown_names(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry.name
+
+@lru_cache(maxsize=4096)
+def _read_note_cached(note_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read and split a Dendron note; keyed on mtime/size so edited notes are re-read"""
+    content = _read_text_file(note_path)
+    
+    # Parse frontmatter if it exists
+    frontmatter = {}
+    content_body = content
+    
+    if content.startswith('---\n'):
+        try:
+            end_index = content.find('\n---\n', 4)
+            if end_index != -1:
+                frontmatter_text = content[4:end_index]
+                frontmatter = yaml.load(frontmatter_text, Loader=_YAML_SAFE_LOADER) or {}
+                content_body = content[end_index + 5:]
+        except Exception as e:
+            print(f"Error parsing frontmatter: {e}")
+    
+    return {
+        'content': content_body.strip(),
+        'frontmatter': frontmatter,
+        'full_content': content
+    }
+
+def _lazy_expansion(title: str, build, icon: Optional[str] = None):
+    """Collapsed ui.expansion whose content is built by build() the first time it is opened"""
+    built = []
+    
+    def build_once(e):
+        if e.value and not built:
+            built.append(True)
+            with expansion:
+                build()
+    
+    expansion = ui.expansion(title, icon=icon, on_value_change=build_once).props('header-class="text-xl font-bold text-blue-700"')
+    return expansion
+
+def _split_note_sections(text: str) -> list:
+    """Split a note before each top-level "## " heading that is not inside a fenced code block"""
+    sections = []
+    start = pos = 0
+    fence = None
+    for line in text.splitlines(keepends=True):
+        match = _CODE_FENCE_RE.match(line)
+        if match:
+            marker = match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and not line[match.end():].strip():
+                fence = None
+        elif fence is None and line.startswith('## '):
+            sections.append(text[start:pos])
+            start = pos
+        pos += len(line)
+    sections.append(text[start:])
+    return sections
+
+def _note_markdown(text: str):
+    """Show note markdown, pre-rendered to HTML by pyromark when it is installed"""
+    if _PYROMARK_HTML is None:
+        return ui.markdown(text).classes('prose max-w-none')
+    return ui.html(_PYROMARK_HTML(text), **_UI_HTML_KWARGS).classes('prose max-w-none')
+
+def _cell_preview(text: str) -> str:
+    """One-line preview of notes/actions text for a table cell"""
+    preview = ' '.join(text.split())
+    if len(preview) > EDITOR_PREVIEW_CHARS:
+        preview = preview[:EDITOR_PREVIEW_CHARS] + '…'
+    return preview
+
+def _iter_project_people(project: Dict[str, Any]):
+    """Yield the names of everyone on a project: the lead, then each team member"""
+    lead = project.get('Project_Team_Lead', '') or project.get('Team_Member', '')
+    if lead and lead != 'N/A':
+        yield lead
+    team_members = project.get('Team_Members')
+    if isinstance(team_members, list):
+        for member in team_members:
+            if isinstance(member, dict):
+                yield member.get('Resource_Name', '').strip()
+            elif isinstance(member, str):
+                yield member.strip()
+    elif isinstance(team_members, str):
+        for member in team_members.split(','):
+            yield member.strip()
+
+def _build_portfolio_row(viewer, status_categories: Dict[str, Any], project: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the display row for one project in the portfolio table"""
+    # Get status category for color coding
+    status_category = viewer.get_project_status_category(project)
+    project_id = project.get('Project_ID', '')
+    notes = viewer.get_project_notes(project_id)
+    actions = viewer.get_coordinator_actions(project_id)
+    
+    row = {
+        'Project Name': project.get('Project_Name', 'N/A'),
+        'Project Number': project.get('Project_Number', 'N/A'),
+        'Required Date': viewer.get_required_date_display(project) or "Not specified",
+        'Staff Assigned': viewer.get_people_display(project),
+        'Status': viewer.get_project_effective_status(project),
+        'status_color': status_categories[status_category]['color'],
+        'project_id': project_id,
+        'notes': notes,
+        'notes_preview': _cell_preview(notes),
+        'actions': actions,
+        'actions_preview': _cell_preview(actions),
+        'actions_bullets': viewer.format_actions_as_bullets(actions),
+    }
+    row['classes'] = _portfolio_row_classes(row)
+    return row
+
+def _portfolio_row_classes(row: Dict[str, Any]) -> Dict[str, str]:
+    """Tailwind classes for a portfolio table row, its cells and its status button (shared, do not modify)"""
+    if row['Status'] in _PROJECT_STATUS_CATEGORIES['not_assigned']['statuses']:
+        return _PORTFOLIO_NOT_ASSIGNED_CLASSES
+    return _PORTFOLIO_CLASSES_BY_COLOR[row['status_color']]
+
+def _dendron_link_to_markdown(match) -> str:
+    """Replacement for a _DENDRON_LINK_RE match: portal notes become /note links, others bold text"""
+    note_ref = match.group(1)
+    display_text = match.group(2) if match.group(2) else note_ref
+    
+    # If no explicit display text, show only the part after the last dot
+    if not match.group(2) and '.' in display_text:
+        display_text = display_text.split('.')[-1]
+    
+    # Convert to our note view URL
+    if note_ref.startswith('WLRS.LUP.CRP.caribou-portal'):
+        note_url = f"/note/{note_ref}"
+        return f'[{display_text}]({note_url})'
+    else:
+        return f'**{display_text}**'  # Non-caribou notes as bold text
+
+@lru_cache(maxsize=256)
+def _render_note_markdown(note_path: str, mtime_ns: int, size: int) -> str:
+    """Note body as display markdown (frontmatter dropped, Dendron links converted); keyed on mtime/size"""
+    content = _read_note_body(note_path)
+    
+    # Convert internal Dendron links to clickable links (most notes have none)
+    if '[[' not in content:
+        return content
+    return _DENDRON_LINK_RE.sub(_dendron_link_to_markdown, content)
+
 class PMBOKProjectViewer:
     """PMI PMBOK-aligned project management viewer"""
     
     def __init__(self):
         # self.json_file_path = json_file_path
         # self.status_overrides_file = '/home/cfolkers/caribou_portal/project_status_overrides.json'
-        self.projects = self.load_projects()
-        self.status_overrides = self.load_status_overrides()
         
-        # PMBOK Process Groups
-        self.process_groups = {
-            'initiating': 'Initiating',
-            'planning': 'Planning', 
-            'executing': 'Executing',
-            'monitoring': 'Monitoring & Controlling',
-            'closing': 'Closing'
-        }
+        # Last parsed S3 objects and their ETags, so unchanged objects are not re-downloaded
+        self._projects_etag = None
+        self._projects_cache = []
+        self._status_etag = None
+        self._status_cache = {}
         
-        # Enhanced Project Status Categories
-        self.project_status_categories = {
-            'not_assigned': {
-                'name': 'Not Assigned',
-                'description': 'Projects without assigned team members or lead',
-                'color': 'red',
-                'icon': 'person_off',
-                'statuses': ['Not Assigned', 'Unassigned', 'Pending Assignment']
-            },
-            'not_started': {
-                'name': 'Not Started',
-                'description': 'Projects assigned but work not yet begun',
-                'color': 'gray',
-                'icon': 'schedule',
-                'statuses': ['Assigned', 'New', 'Queued']
-            },
-            'in_progress': {
-                'name': 'In Progress',
-                'description': 'Active project work underway',
-                'color': 'blue',
-                'icon': 'play_arrow',
-                'statuses': ['In Progress', 'Active', 'Working']
-            },
-            'awaiting_client': {
-                'name': 'Awaiting Client Feedback',
-                'description': 'Waiting for client input or approval',
-                'color': 'yellow',
-                'icon': 'feedback',
-                'statuses': ['Awaiting Client Feedback', 'Client Review', 'Pending Client']
-            },
-            'awaiting_resources': {
-                'name': 'Awaiting Resources',
-                'description': 'Blocked waiting for team members or tools',
-                'color': 'orange',
-                'icon': 'people',
-                'statuses': ['Awaiting Resources', 'Resource Blocked', 'Team Unavailable']
-            },
-            'on_hold': {
-                'name': 'On Hold',
-                'description': 'Temporarily paused projects',
-                'color': 'red',
-                'icon': 'pause',
-                'statuses': ['On Hold', 'Paused', 'Suspended']
-            },
-            'quality_review': {
-                'name': 'Quality Review',
-                'description': 'Under quality assurance or technical review',
-                'color': 'purple',
-                'icon': 'fact_check',
-                'statuses': ['Quality Review', 'QA Review', 'Technical Review']
-            },
-            'completed': {
-                'name': 'Completed',
-                'description': 'Successfully completed projects',
-                'color': 'green',
-                'icon': 'check_circle',
-                'statuses': ['Completed', 'Done', 'Finished', 'Delivered']
-            },
-            'cancelled': {
-                'name': 'Cancelled',
-                'description': 'Cancelled or terminated projects',
-                'color': 'gray',
-                'icon': 'cancel',
-                'statuses': ['Cancelled', 'Terminated', 'Discontinued']
-            }
-        }
+        # Pending status-override writes are coalesced and flushed after a short delay
+        self._overrides_lock = threading.Lock()
+        self._overrides_dirty = False
+        self._flush_timer = None
+        # Consecutive failed writes and the last error; a failed write is retried with backoff
+        self._flush_failures = 0
+        self._flush_error = None
+        atexit.register(self.flush_overrides)
         
-        # PMBOK Knowledge Areas
-        self.knowledge_areas = {
-            'integration': 'Project Integration Management',
-            'scope': 'Project Scope Management',
-            'schedule': 'Project Schedule Management',
-            'cost': 'Project Cost Management',
-            'quality': 'Project Quality Management',
-            'resource': 'Project Resource Management',
-            'communications': 'Project Communications Management',
-            'risk': 'Project Risk Management',
-            'procurement': 'Project Procurement Management',
-            'stakeholder': 'Project Stakeholder Management'
-        }
+        # Serializes refresh_data and the metrics pass (startup warm-up and page refreshes run in worker threads)
+        self._refresh_lock = threading.RLock()
+        
+        # Dendron vault location doesn't change while the app runs; resolved on first use
+        self._dendron_vault_path = _UNSET
+        
+        # Schedule performance per (Project_ID, Date_Requested, Date_Required); cleared on refresh
+        self._sched_cache = {}
+        
+        # (monotonic time, status dict) from the last Dendron vault probe
+        self._dendron_status = None
+        
+        # Projects bucketed by status category (each bucket sorted by due date); rebuilt lazily
+        # after a reload or status change
+        self._by_status_category = None
+        
+        # Projects whose effective status is active (in data order); rebuilt lazily like the buckets
+        self._active_projects = None
+        
+        # All projects sorted by due date; rebuilt lazily after a reload
+        self._projects_by_due = None
+        
+        # Effective status per Project_ID; cleared on refresh and on status edits
+        self._effective_status_cache = {}
+        
+        # Parsed due date (or None) per raw Date_Required/Required_Date value
+        self._due_date_cache = {}
+        
+        # Display string (or None) for each project's due date, per Project_ID; cleared on refresh
+        self._required_date_display_cache = {}
+        
+        # Comma-separated lead and team member names per Project_ID; cleared on refresh
+        self._people_display_cache = {}
+        
+        # PMBOK phase, schedule performance and risk per Project_ID (filled by the metrics pass); cleared on refresh
+        self._analysis_cache = {}
+        
+        # Portfolio metrics built from the analysis pass; cleared on refresh
+        self._metrics_cache = None
+        
+        # Stakeholder analysis per Project_ID; cleared when a refresh brings new data
+        self._stakeholder_cache = {}
+        
+        # Monotonic time of the last refresh_data, for page loads that accept slightly older data
+        self._last_refresh = time.monotonic()
+        
+        self.projects = self.load_projects()
+        self._projects_by_id = self._build_project_index(self.projects)
+        self.status_overrides = self.load_status_overrides()
+        
+        # Static PMBOK reference data, shared by all instances
+        self.process_groups = _PROCESS_GROUPS
+        self.project_status_categories = _PROJECT_STATUS_CATEGORIES
+        self._status_to_category = _STATUS_TO_CATEGORY
+        self.knowledge_areas = _KNOWLEDGE_AREAS
+    
+    def _get_object_if_changed(self, key: str, etag: Optional[str]):
+        """Get an S3 object, or None if it still matches the given ETag (HTTP 304)"""
+        params = {'Bucket': bucket, 'Key': key}
+        if etag:
+            params['IfNoneMatch'] = etag
+        try:
+            return s3_client.get_object(**params)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+                return None
+            raise
     
     def load_projects(self) -> List[Dict[str, Any]]:
         """Load projects from JSON file"""
         # if not os.path.exists(self.json_file_path):
         #     return []
-        resp = s3_client.get_object(Bucket=bucket, Key=PROJECTS_PATH)
-        body_bytes = resp['Body'].read()
+        resp = self._get_object_if_changed(PROJECTS_PATH, self._projects_etag)
+        if resp is None:
+            return self._projects_cache
         try:
-            return json.loads(body_bytes.decode('utf-8'))
+            if ijson and int(resp.get('ContentLength') or 0) > PROJECTS_STREAM_THRESHOLD_BYTES:
+                # Root is a JSON array; parse it record by record straight off the stream
+                projects = list(ijson.items(resp['Body'], 'item', use_float=True))
+            else:
+                projects = json_loads_bytes(resp['Body'].read())
         except Exception as e:
             print(f"Error loading JSON file: {e}")
             return []
+        self._projects_etag = resp.get('ETag')
+        self._projects_cache = projects
+        return projects
+    
+    def _build_project_index(self, projects: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Index projects by stringified Project_ID for O(1) lookups"""
+        return {str(p.get('Project_ID', '')): p for p in projects}
     
     def refresh_data(self):
         """Refresh project data from file"""
-        self.projects = self.load_projects()
-        self.status_overrides = self.load_status_overrides()
-        return len(self.projects)
+        with self._refresh_lock:
+            # Push any pending edits first so the reload doesn't discard them
+            self.flush_overrides()
+            projects = self.load_projects()
+            status_overrides = self.load_status_overrides()
+            self._last_refresh = time.monotonic()
+            
+            # Schedule figures depend on today's date, so they never outlive a refresh
+            self._sched_cache.clear()
+            self._analysis_cache.clear()
+            self._metrics_cache = None
+            
+            # Both objects unchanged in S3 (304): indexes and derived values are still valid
+            if projects is self.projects and status_overrides is self.status_overrides:
+                return len(self.projects)
+            
+            self.projects = projects
+            self._projects_by_id = self._build_project_index(self.projects)
+            self.status_overrides = status_overrides
+            self._by_status_category = None
+            self._active_projects = None
+            self._projects_by_due = None
+            self._effective_status_cache.clear()
+            self._due_date_cache.clear()
+            self._required_date_display_cache.clear()
+            self._people_display_cache.clear()
+            self._stakeholder_cache.clear()
+            return len(self.projects)
+    
+    def refresh_if_stale(self, max_age_s: float = PAGE_REFRESH_TTL_S) -> int:
+        """Refresh unless the data was refreshed within max_age_s seconds (for page loads)"""
+        if time.monotonic() - self._last_refresh < max_age_s:
+            return len(self.projects)
+        return self.refresh_data()
     
     def load_status_overrides(self):
         """Load local status overrides from JSON file"""
@@ -168,17 +748,22 @@ class PMBOKProjectViewer:
         # except json.JSONDecodeError:
         #     print(f"Error: Invalid JSON in {self.status_overrides_file}")
         #     return {}
-        resp = s3_client.get_object(Bucket=bucket, Key=STATUS_PATH)
+        resp = self._get_object_if_changed(STATUS_PATH, self._status_etag)
+        if resp is None:
+            return self._status_cache
         body_bytes = resp['Body'].read()
         try:
-            return json.loads(body_bytes.decode('utf-8'))
+            overrides = json_loads_bytes(body_bytes)
         except Exception as e:
             print(f"Error loading JSON file: {e}")
             return []
+        self._status_etag = resp.get('ETag')
+        self._status_cache = overrides
+        return overrides
         
     
     def save_status_overrides(self):
-        """Save status overrides to JSON file"""
+        """Save status overrides to JSON file (coalesced: rapid edits share one S3 write)"""
         # try:
         #     with open(self.status_overrides_file, 'w') as f:
         #         json.dump(self.status_overrides, f, indent=2)
@@ -186,44 +771,105 @@ class PMBOKProjectViewer:
         # except Exception as e:
         #     print(f"Error saving status overrides: {e}")
         #     return False
-        try:
-            # Convert the overrides dict to JSON bytes
-            json_bytes = json.dumps(self.status_overrides, indent=2).encode('utf-8')
-            # Put object to S3
-            s3_client.put_object(Bucket=bucket, Key=STATUS_PATH, Body=json_bytes, ContentType='application/json')
+        # The edit is queued either way; False tells the caller S3 writes are currently failing
+        with self._overrides_lock:
+            self._overrides_dirty = True
+            if self._flush_timer is None:
+                self._schedule_flush(OVERRIDES_FLUSH_DELAY_S)
+            return self._flush_error is None
+    
+    def _schedule_flush(self, delay: float):
+        """Arm the flush timer (caller holds _overrides_lock)"""
+        self._flush_timer = threading.Timer(delay, self.flush_overrides)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def overrides_save_state(self) -> str:
+        """'saved', 'pending' (queued for the next flush) or 'failed' (last S3 write failed, retrying)"""
+        if self._flush_error is not None:
+            return 'failed'
+        return 'pending' if self._overrides_dirty else 'saved'
+    
+    def flush_overrides(self):
+        """Write pending status overrides to S3 now"""
+        with self._overrides_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._overrides_dirty:
+                return True
+            try:
+                # Convert the overrides dict to JSON bytes
+                json_bytes = json_dumps_bytes(self.status_overrides)
+                # Put object to S3
+                resp = s3_client.put_object(Bucket=bucket, Key=STATUS_PATH, Body=json_bytes, ContentType='application/json')
+            except Exception as e:
+                # Keep the edits pending and try again later, backing off while S3 keeps failing
+                self._flush_failures += 1
+                self._flush_error = str(e)
+                delay = min(OVERRIDES_FLUSH_DELAY_S * 2 ** self._flush_failures, OVERRIDES_RETRY_MAX_S)
+                logger.warning("Error saving status overrides to S3 (attempt %d, retrying in %.0fs): %s",
+                               self._flush_failures, delay, e)
+                self._schedule_flush(delay)
+                return False
+            # What we just wrote is the current object, so the next load can be a 304
+            self._status_etag = resp.get('ETag')
+            self._status_cache = self.status_overrides
+            self._overrides_dirty = False
+            if self._flush_error is not None:
+                logger.info("Status overrides saved to S3 after %d failed attempts", self._flush_failures)
+            self._flush_failures = 0
+            self._flush_error = None
             return True
-        except Exception as e:
-            print(f"Error saving status overrides to S3: {e}")
-            return False
     
     def get_project_effective_status(self, project):
         """Get the effective status for a project (override or original)"""
-        project_id = project.get('Project_ID', '')
-        if str(project_id) in self.status_overrides:
-            return self.status_overrides[str(project_id)]['status']
-        return project.get('Project_Status', 'Unknown')
+        pid = str(project.get('Project_ID', ''))
+        status = self._effective_status_cache.get(pid)
+        if status is None:
+            override = self.status_overrides.get(pid)
+            if override and 'status' in override:
+                status = override['status']
+            else:
+                status = project.get('Project_Status', 'Unknown')
+            self._effective_status_cache[pid] = status
+        return status
     
     def update_project_status(self, project_id: str, new_status: str, updated_by: str = 'User'):
         """Update a project's status locally"""
-        from datetime import datetime
-        if str(project_id) not in self.status_overrides:
-            self.status_overrides[str(project_id)] = {}
-        
-        self.status_overrides[str(project_id)].update({
+        pid = str(project_id)
+        # Re-selecting the current status is a no-op: no timestamp bump, no S3 write
+        if self.status_overrides.get(pid, {}).get('status') == new_status:
+            return True
+        self._by_status_category = None
+        self._active_projects = None
+        self._effective_status_cache.pop(pid, None)
+        self.status_overrides.setdefault(pid, {}).update({
             'status': new_status,
             'updated_by': updated_by,
             'updated_at': datetime.now().isoformat(),
-            'original_status': next((p.get('Project_Status', 'Unknown') for p in self.projects if str(p.get('Project_ID', '')) == str(project_id)), 'Unknown')
+            'original_status': self._projects_by_id.get(pid, {}).get('Project_Status', 'Unknown')
         })
         return self.save_status_overrides()
     
+    def reset_project_status(self, project_id: str) -> bool:
+        """Drop a project's local override so the original ArcGIS status applies again"""
+        pid = str(project_id)
+        if pid not in self.status_overrides:
+            return False
+        del self.status_overrides[pid]
+        self._by_status_category = None
+        self._active_projects = None
+        self._effective_status_cache.pop(pid, None)
+        # The reset is applied and queued even while S3 writes fail; callers check overrides_save_state()
+        self.save_status_overrides()
+        return True
+    
     def update_project_notes(self, project_id: str, notes: str, updated_by: str = 'User'):
         """Update a project's notes locally"""
-        from datetime import datetime
-        if str(project_id) not in self.status_overrides:
-            self.status_overrides[str(project_id)] = {}
-        
-        self.status_overrides[str(project_id)].update({
+        if self.get_project_notes(project_id) == notes:
+            return True
+        self.status_overrides.setdefault(str(project_id), {}).update({
             'notes': notes,
             'notes_updated_by': updated_by,
             'notes_updated_at': datetime.now().isoformat()
@@ -232,17 +878,13 @@ class PMBOKProjectViewer:
     
     def get_project_notes(self, project_id: str) -> str:
         """Get notes for a project"""
-        if str(project_id) in self.status_overrides:
-            return self.status_overrides[str(project_id)].get('notes', '')
-        return ''
+        return self.status_overrides.get(str(project_id), {}).get('notes', '')
     
     def update_coordinator_actions(self, project_id: str, actions: str, updated_by: str = 'User'):
         """Update a project's coordinator actions locally"""
-        from datetime import datetime
-        if str(project_id) not in self.status_overrides:
-            self.status_overrides[str(project_id)] = {}
-        
-        self.status_overrides[str(project_id)].update({
+        if self.get_coordinator_actions(project_id) == actions:
+            return True
+        self.status_overrides.setdefault(str(project_id), {}).update({
             'coordinator_actions': actions,
             'coordinator_actions_updated_by': updated_by,
             'coordinator_actions_updated_at': datetime.now().isoformat()
@@ -251,18 +893,13 @@ class PMBOKProjectViewer:
     
     def get_coordinator_actions(self, project_id: str) -> str:
         """Get coordinator actions for a project"""
-        if str(project_id) in self.status_overrides:
-            return self.status_overrides[str(project_id)].get('coordinator_actions', '')
-        return ''
+        return self.status_overrides.get(str(project_id), {}).get('coordinator_actions', '')
     
     def format_actions_as_bullets(self, actions_text: str) -> str:
         """Format actions text as bulleted list for display"""
         if not actions_text:
             return ''
-        
-        # Split by lines and add bullets
-        lines = [line.strip() for line in actions_text.split('\n') if line.strip()]
-        return '\n'.join([f'• {line}' if not line.startswith('•') else line for line in lines])
+        return _bulleted_actions(actions_text)
     
     def parse_actions_from_bullets(self, bulleted_text: str) -> str:
         """Parse bulleted text back to plain text for editing"""
@@ -270,51 +907,87 @@ class PMBOKProjectViewer:
             return ''
         
         # Remove bullets for editing
-        lines = [line.strip() for line in bulleted_text.split('\n') if line.strip()]
-        return '\n'.join([line[2:] if line.startswith('• ') else line for line in lines])
+        lines = '\n'.join(_ACTION_LINE_RE.findall(bulleted_text))
+        return _BULLET_PREFIX_RE.sub('', lines)
     
-    def calculate_days_until_due(self, project):
-        """Calculate days until project due date"""
-        from datetime import datetime
+    def _parse_due_date(self, project) -> Optional[datetime]:
+        """Parse the project's due date (cached per raw value); None if missing or unparseable"""
         due_date_str = project.get('Date_Required', '') or project.get('Required_Date', '')
         
         if not due_date_str or due_date_str == 'None':
             return None
         
+        if due_date_str in self._due_date_cache:
+            return self._due_date_cache[due_date_str]
+        
         try:
             # Handle epoch milliseconds (ArcGIS format)
             if isinstance(due_date_str, (int, float)):
                 # Convert milliseconds to seconds and create datetime
                 due_date = datetime.fromtimestamp(due_date_str / 1000)
             else:
-                # Try multiple date formats for string dates
-                date_formats = [
-                    '%Y-%m-%d',
-                    '%m/%d/%Y', 
-                    '%Y-%m-%d %H:%M:%S',
-                    '%Y-%m-%dT%H:%M:%S',
-                    '%Y-%m-%dT%H:%M:%S.%f'
-                ]
-                
-                due_date = None
-                for fmt in date_formats:
-                    try:
-                        due_date = datetime.strptime(str(due_date_str).split('T')[0].split(' ')[0], fmt.split(' ')[0])
-                        break
-                    except ValueError:
-                        continue
-                
-                if due_date is None:
-                    return None
-            
-            today = datetime.now()
-            delta = (due_date - today).days
-            return delta
+                # String dates: YYYY-MM-DD or MM/DD/YYYY, optionally followed by a time part
+                match = DUE_DATE_RE.match(str(due_date_str))
+                if not match:
+                    due_date = None
+                else:
+                    iso_year, iso_month, iso_day, us_month, us_day, us_year = match.groups()
+                    if iso_year:
+                        due_date = datetime(int(iso_year), int(iso_month), int(iso_day))
+                    else:
+                        due_date = datetime(int(us_year), int(us_month), int(us_day))
+            self._due_date_cache[due_date_str] = due_date
+            return due_date
             
         except Exception as e:
             print(f"Error parsing date {due_date_str}: {e}")
             return None
     
+    def calculate_days_until_due(self, project):
+        """Calculate days until project due date"""
+        due_date = self._parse_due_date(project)
+        if due_date is None:
+            return None
+        return (due_date - datetime.now()).days
+    
+    def get_required_date_display(self, project) -> Optional[str]:
+        """Due date formatted as YYYY-MM-DD for display (cached per project); None if missing or invalid"""
+        pid = project.get('Project_ID')
+        if pid in self._required_date_display_cache:
+            return self._required_date_display_cache[pid]
+        
+        due_date_raw = project.get('Date_Required', '') or project.get('Required_Date', '')
+        if isinstance(due_date_raw, (int, float)):
+            try:
+                display = _format_epoch_ms_date(due_date_raw)
+            except:
+                display = None
+        else:
+            display = str(due_date_raw).split("T")[0] if due_date_raw else None
+        
+        self._required_date_display_cache[pid] = display
+        return display
+    
+    def get_people_display(self, project) -> str:
+        """Lead and team member names, de-duplicated in order (cached per project); 'Unassigned' if none"""
+        pid = project.get('Project_ID')
+        display = self._people_display_cache.get(pid)
+        if display is None:
+            seen = set()
+            people = []
+            for name in _iter_project_people(project):
+                if name and name not in seen:
+                    seen.add(name)
+                    people.append(name)
+            display = ', '.join(people) if people else 'Unassigned'
+            self._people_display_cache[pid] = display
+        return display
+    
+    def _due_sort_key(self, project) -> float:
+        """Sort key for nearest/overdue first; projects without due dates go to the end"""
+        due_date = self._parse_due_date(project)
+        return due_date.timestamp() if due_date else float('inf')
+    
     def get_team_members_list(self, project):
         """Get formatted list of team members"""
         team_members = []
@@ -325,7 +998,7 @@ class PMBOKProjectViewer:
             team_members.append(f"{lead} (Lead)")
         
         # Add other team members if available
-        other_members = project.get('Team_Members', [])
+        other_members = project.get('Team_Members')
         if isinstance(other_members, list):
             for member in other_members:
                 # Only add string members, skip dict objects
@@ -336,13 +1009,8 @@ class PMBOKProjectViewer:
             members = [m.strip() for m in other_members.split(',') if m.strip()]
             team_members.extend(members)
         
-        # Remove duplicates while preserving order (only for strings)
-        seen = set()
-        unique_members = []
-        for member in team_members:
-            if isinstance(member, str) and member not in seen:
-                seen.add(member)
-                unique_members.append(member)
+        # Remove duplicates while preserving order
+        unique_members = list(dict.fromkeys(team_members))
         
         return unique_members if unique_members else ['Cole Folkers (Lead)']
     
@@ -363,32 +1031,28 @@ class PMBOKProjectViewer:
     
     def sort_projects_by_due_date(self, projects):
         """Sort projects by due date (nearest/overdue first)"""
-        def get_sort_key(project):
-            days_until_due = self.calculate_days_until_due(project)
-            if days_until_due is None:
-                return float('inf')  # Projects without due dates go to the end
-            return days_until_due
-        
-        return sorted(projects, key=get_sort_key)
-        return len(self.projects)
+        return sorted(projects, key=self._due_sort_key)
+    
+    def get_projects_sorted_by_due_date(self):
+        """All projects sorted by due date, sorted once per refresh"""
+        if self._projects_by_due is None:
+            self._projects_by_due = self.sort_projects_by_due_date(self.projects)
+        return self._projects_by_due
     
     def get_project_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific project by ID"""
-        for project in self.projects:
-            if project.get('Project_ID') == project_id:
-                return project
-        return None
+        return self._projects_by_id.get(str(project_id))
     
     def format_date(self, timestamp: int) -> str:
         """Convert timestamp to readable date"""
         if not timestamp:
             return "N/A"
         try:
-            return datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
+            return _format_epoch_ms_date(timestamp)
         except:
             return "Invalid Date"
     
-    def get_project_phase(self, project: Dict[str, Any]) -> str:
+    def get_project_phase(self, project: Dict[str, Any], now: Optional[datetime] = None) -> str:
         """Determine PMBOK Process Group based on project status and dates"""
         status = project.get('Project_Status', '').lower()
         date_requested = project.get('Date_Requested', 0)
@@ -398,7 +1062,7 @@ class PMBOKProjectViewer:
             # Check if recently assigned (within 2 weeks) - likely still initiating/planning
             if date_requested:
                 request_date = datetime.fromtimestamp(date_requested / 1000)
-                if (datetime.now() - request_date).days <= 14:
+                if ((now or datetime.now()) - request_date).days <= 14:
                     return 'initiating'
                 else:
                     return 'executing'
@@ -412,22 +1076,29 @@ class PMBOKProjectViewer:
         else:
             return 'initiating'
     
-    def calculate_schedule_performance(self, project: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_schedule_performance(self, project: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Calculate Schedule Performance Index (SPI) and variance"""
         date_requested = project.get('Date_Requested', 0)
         date_required = project.get('Date_Required', 0)
         
+        cache_key = (project.get('Project_ID'), date_requested, date_required)
+        cached = self._sched_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         if not date_requested or not date_required:
-            return {
+            result = {
                 'status': 'Unknown',
                 'variance_days': 0,
                 'health': 'gray',
                 'spi': 'N/A'
             }
+            self._sched_cache[cache_key] = result
+            return result
         
         start_date = datetime.fromtimestamp(date_requested / 1000)
         end_date = datetime.fromtimestamp(date_required / 1000)
-        current_date = datetime.now()
+        current_date = now or datetime.now()
         
         total_duration = (end_date - start_date).days
         elapsed_duration = (current_date - start_date).days
@@ -456,7 +1127,7 @@ class PMBOKProjectViewer:
             health = 'green'
             status = 'On Track'
         
-        return {
+        result = {
             'status': status,
             'variance_days': remaining_duration,
             'health': health,
@@ -465,10 +1136,14 @@ class PMBOKProjectViewer:
             'elapsed_duration': elapsed_duration,
             'remaining_duration': remaining_duration
         }
+        self._sched_cache[cache_key] = result
+        return result
     
-    def get_risk_level(self, project: Dict[str, Any]) -> Dict[str, str]:
+    def get_risk_level(self, project: Dict[str, Any], schedule_perf: Optional[Dict[str, Any]] = None,
+                       now: Optional[datetime] = None) -> Dict[str, str]:
         """Assess project risk level based on PMBOK risk management"""
-        schedule_perf = self.calculate_schedule_performance(project)
+        if schedule_perf is None:
+            schedule_perf = self.calculate_schedule_performance(project, now=now)
         priority = project.get('Priority_Level', 'Normal').lower()
         
         risk_factors = 0
@@ -486,7 +1161,7 @@ class PMBOKProjectViewer:
             risk_factors += 1
         
         # Team size risk (larger teams = more complexity)
-        team_size = len(project.get('Team_Members', [])) + 1  # +1 for coordinator
+        team_size = len(project.get('Team_Members') or ()) + 1  # +1 for coordinator
         if team_size == 1:
             risk_factors += 1  # Single person risk
         elif team_size > 4:
@@ -500,7 +1175,47 @@ class PMBOKProjectViewer:
         else:
             return {'level': 'Low', 'color': 'green', 'score': risk_factors}
     
+    def get_project_analysis(self, project: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """PMBOK phase, schedule performance and risk level for a project (cached per project until refresh)"""
+        pid = project.get('Project_ID')
+        analysis = self._analysis_cache.get(pid)
+        if analysis is None:
+            now = now or datetime.now()
+            schedule_perf = self.calculate_schedule_performance(project, now=now)
+            analysis = {
+                'phase': self.get_project_phase(project, now=now),
+                'schedule_perf': schedule_perf,
+                'risk': self.get_risk_level(project, schedule_perf=schedule_perf),
+            }
+            self._analysis_cache[pid] = analysis
+        return analysis
+    
+    def get_analysis_rows(self, project: Dict[str, Any]):
+        """Formatted (label, value) rows for the schedule and risk cards (kept with the cached analysis)"""
+        analysis = self.get_project_analysis(project)
+        rows = analysis.get('rows')
+        if rows is None:
+            schedule_perf = analysis['schedule_perf']
+            risk = analysis['risk']
+            schedule_rows = tuple((label, str(schedule_perf.get(key, 'N/A'))) for label, key in _SCHEDULE_ROW_KEYS)
+            risk_rows = (
+                ('Overall Risk Level', risk['level']),
+                ('Risk Score', f"{risk['score']}/10"),
+                ('Schedule Risk', schedule_perf['health'].title()),
+            )
+            rows = analysis['rows'] = (schedule_rows, risk_rows)
+        return rows
+    
     def get_stakeholder_analysis(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Stakeholder analysis for a project (cached per project until the data changes)"""
+        pid = project.get('Project_ID')
+        stakeholders = self._stakeholder_cache.get(pid)
+        if stakeholders is None:
+            stakeholders = self._analyze_stakeholders(project)
+            self._stakeholder_cache[pid] = stakeholders
+        return stakeholders
+    
+    def _analyze_stakeholders(self, project: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze project stakeholders per PMBOK stakeholder management"""
         stakeholders = {
             'primary': [],
@@ -527,7 +1242,7 @@ class PMBOKProjectViewer:
         })
         
         # Team members
-        for member in project.get('Team_Members', []):
+        for member in project.get('Team_Members') or ():
             stakeholders['primary'].append({
                 'name': member.get('Resource_Name', 'Unknown'),
                 'role': 'Team Member',
@@ -545,57 +1260,56 @@ class PMBOKProjectViewer:
                 'interest': 'Medium'
             })
         
-        # Classify internal vs external
-        for category in ['primary', 'secondary']:
-            for stakeholder in stakeholders[category]:
-                if 'gov.bc.ca' in project.get('Client_Email', '') or 'Ministry' in stakeholder.get('role', ''):
-                    stakeholders['internal'].append(stakeholder)
-                else:
-                    stakeholders['external'].append(stakeholder)
+        # Classify internal vs external (a government client makes everyone internal)
+        client_internal = 'gov.bc.ca' in (project.get('Client_Email') or '')
+        for stakeholder in itertools.chain(stakeholders['primary'], stakeholders['secondary']):
+            if client_internal or 'Ministry' in stakeholder.get('role', ''):
+                stakeholders['internal'].append(stakeholder)
+            else:
+                stakeholders['external'].append(stakeholder)
         
         return stakeholders
     
     def get_project_status_category(self, project):
         """Determine which status category a project belongs to"""
-        project_status = self.get_project_effective_status(project).strip()
-        
-        if not project_status:
-            return 'not_started'
-            
-        # Check each category for matching status
-        for category_key, category_info in self.project_status_categories.items():
-            if project_status in category_info['statuses']:
-                return category_key
-                
-        # If status doesn't match predefined categories, try to infer
-        status_lower = project_status.lower()
-        
-        if any(word in status_lower for word in ['progress', 'active', 'working']):
-            return 'in_progress'
-        elif any(word in status_lower for word in ['client', 'feedback', 'review']):
-            return 'awaiting_client'
-        elif any(word in status_lower for word in ['hold', 'pause', 'suspend']):
-            return 'on_hold'
-        elif any(word in status_lower for word in ['complete', 'done', 'finish']):
-            return 'completed'
-        elif any(word in status_lower for word in ['cancel', 'terminate']):
-            return 'cancelled'
-        else:
-            return 'not_started'  # Default category
+        return _status_category_for(self.get_project_effective_status(project))
+    
+    def _status_category_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Projects bucketed by status category, built in a single pass and reused until invalidated"""
+        if self._by_status_category is None:
+            buckets = {category_key: [] for category_key in self.project_status_categories}
+            for project in self.projects:
+                buckets[self.get_project_status_category(project)].append(project)
+            # Category pages list projects nearest-deadline first; sort once here rather than per render
+            for bucket in buckets.values():
+                bucket.sort(key=self._due_sort_key)
+            self._by_status_category = buckets
+        return self._by_status_category
+    
+    def get_active_projects(self) -> List[Dict[str, Any]]:
+        """Projects whose effective status is In Progress or Active, in data order"""
+        if self._active_projects is None:
+            self._active_projects = [
+                p for p in self.projects
+                if self.get_project_effective_status(p).lower() in _ACTIVE_STATUSES
+            ]
+        return self._active_projects
     
     def get_projects_by_status_category(self, category_key):
-        """Get all projects in a specific status category"""
-        return [p for p in self.projects if self.get_project_status_category(p) == category_key]
+        """Get all projects in a specific status category (sorted by due date)"""
+        return list(self._status_category_index().get(category_key, []))
     
     def get_status_category_summary(self):
         """Get count of projects in each status category"""
+        buckets = self._status_category_index()
+        
         summary = {}
         for category_key, category_info in self.project_status_categories.items():
-            projects = self.get_projects_by_status_category(category_key)
+            projects = buckets[category_key]
             summary[category_key] = {
                 'count': len(projects),
                 'info': category_info,
-                'projects': projects
+                'projects': list(projects)
             }
         return summary
     
@@ -618,53 +1332,64 @@ class PMBOKProjectViewer:
         return color_map.get(category_info['color'], 'bg-gray-500')
     
     def get_project_metrics(self) -> Dict[str, Any]:
-        """Calculate portfolio-level metrics per PMBOK"""
-        if not self.projects:
-            return {}
-        
-        total = len(self.projects)
-        
-        # Process Group distribution
-        process_distribution = {group: 0 for group in self.process_groups.keys()}
-        risk_distribution = {'Low': 0, 'Medium': 0, 'High': 0}
-        schedule_health = {'green': 0, 'yellow': 0, 'red': 0}
-        
-        overdue_count = 0
-        at_risk_count = 0
-        
-        for project in self.projects:
-            # Process group
-            phase = self.get_project_phase(project)
-            process_distribution[phase] += 1
-            
-            # Risk analysis
-            risk = self.get_risk_level(project)
-            risk_distribution[risk['level']] += 1
-            
-            # Schedule health
-            schedule_perf = self.calculate_schedule_performance(project)
-            schedule_health[schedule_perf['health']] += 1
-            
-            if schedule_perf['variance_days'] < 0:
-                overdue_count += 1
-            elif schedule_perf['variance_days'] <= 7:
-                at_risk_count += 1
-        
-        return {
-            'total_projects': total,
-            'process_distribution': process_distribution,
-            'risk_distribution': risk_distribution,
-            'schedule_health': schedule_health,
-            'overdue_count': overdue_count,
-            'at_risk_count': at_risk_count,
-            'on_track_count': total - overdue_count - at_risk_count
-        }
+        """Calculate portfolio-level metrics per PMBOK (cached until the next refresh)"""
+        with self._refresh_lock:
+            if self._metrics_cache is not None:
+                return self._metrics_cache
+            if not self.projects:
+                return {}
+            
+            total = len(self.projects)
+            
+            # Process Group distribution
+            process_distribution = {group: 0 for group in self.process_groups.keys()}
+            risk_distribution = {'Low': 0, 'Medium': 0, 'High': 0}
+            schedule_health = {'green': 0, 'yellow': 0, 'red': 0, 'gray': 0}
+            
+            overdue_count = 0
+            at_risk_count = 0
+            
+            # One clock read for the whole pass
+            now = datetime.now()
+            
+            for project in self.projects:
+                # Phase, schedule and risk in one go; cached so cards and project pages reuse them
+                analysis = self.get_project_analysis(project, now=now)
+                
+                # Process group
+                process_distribution[analysis['phase']] += 1
+                
+                # Schedule health
+                schedule_perf = analysis['schedule_perf']
+                schedule_health[schedule_perf['health']] += 1
+                
+                # Risk analysis
+                risk_distribution[analysis['risk']['level']] += 1
+                
+                if schedule_perf['variance_days'] < 0:
+                    overdue_count += 1
+                elif schedule_perf['variance_days'] <= 7:
+                    at_risk_count += 1
+            
+            self._metrics_cache = {
+                'total_projects': total,
+                'process_distribution': process_distribution,
+                'risk_distribution': risk_distribution,
+                'schedule_health': schedule_health,
+                'overdue_count': overdue_count,
+                'at_risk_count': at_risk_count,
+                'on_track_count': total - overdue_count - at_risk_count
+            }
+            return self._metrics_cache
     
     def get_dendron_vault_path(self):
-        """Get the user's Dendron vault path from DENDRON environment variable or common locations"""
-        import os
-        from pathlib import Path
-        
+        """Get the user's Dendron vault path (discovered once, then cached for the process)"""
+        if self._dendron_vault_path is _UNSET:
+            self._dendron_vault_path = self._discover_dendron_vault_path()
+        return self._dendron_vault_path
+    
+    def _discover_dendron_vault_path(self):
+        """Find the Dendron vault from DENDRON environment variable or common locations"""
         # First check DENDRON environment variable
         dendron_env_path = os.getenv('DENDRON')
         if dendron_env_path:
@@ -699,12 +1424,12 @@ class PMBOKProjectViewer:
                     
                 # Also check subdirectories for vaults
                 try:
-                    for item in os.listdir(path):
-                        subpath = os.path.join(path, item)
-                        if os.path.isdir(subpath):
-                            subdendron_config = os.path.join(subpath, "dendron.yml")
-                            if os.path.exists(subdendron_config):
-                                return subpath
+                    with os.scandir(path) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                subdendron_config = os.path.join(entry.path, "dendron.yml")
+                                if os.path.exists(subdendron_config):
+                                    return entry.path
                 except PermissionError:
                     continue
         
@@ -717,46 +1442,44 @@ class PMBOKProjectViewer:
             if not vault_path:
                 return []
         
-        import os
-        import glob
-        
-        project_notes = []
-        
-        # Search patterns for project-related notes using the new hierarchy
-        search_patterns = [
-            f"WLRS.LUP.CRP.caribou-portal.{project_id}*",
-            f"*{project_id}*",  # Fallback for any existing notes
-        ]
+        project_notes = {}
         
         try:
+            # Match note stems against the WLRS.LUP.CRP hierarchy prefixes, plus any note
+            # mentioning the project ID as a fallback for existing notes
+            prefixes = [f"WLRS.LUP.CRP.caribou-portal.{project_id}"]
+            
             # Get project name for additional search
             project = self.get_project_by_id(project_id)
             if project and project.get('Project_Name'):
                 project_name = project['Project_Name'].lower().replace(' ', '-')
-                search_patterns.extend([
-                    f"WLRS.LUP.CRP.caribou-portal.{project_name}*",
-                ])
-            
-            # Search for markdown files
-            for pattern in search_patterns:
-                md_files = glob.glob(os.path.join(vault_path, f"{pattern}.md"), recursive=False)
-                for file_path in md_files:
-                    if os.path.isfile(file_path):
-                        rel_path = os.path.relpath(file_path, vault_path)
-                        project_notes.append({
-                            'path': file_path,
-                            'relative_path': rel_path,
-                            'name': os.path.basename(file_path),
-                            'modified': os.path.getmtime(file_path)
-                        })
+                prefixes.append(f"WLRS.LUP.CRP.caribou-portal.{project_name}")
+            prefixes = tuple(prefixes)
+            
+            # Single directory pass; scandir entries carry the stat data we need
+            with os.scandir(vault_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.') or not name.endswith('.md'):
+                        continue
+                    stem = name[:-3]
+                    if not (stem.startswith(prefixes) or project_id in stem):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    project_notes[entry.path] = {
+                        'path': entry.path,
+                        'relative_path': name,
+                        'name': name,
+                        'modified': entry.stat().st_mtime
+                    }
         
         except Exception as e:
             print(f"Error searching Dendron vault: {e}")
             return []
         
-        # Remove duplicates and sort by modification time
-        unique_notes = {note['path']: note for note in project_notes}.values()
-        return sorted(unique_notes, key=lambda x: x['modified'], reverse=True)
+        # Sort by modification time (already unique by path)
+        return sorted(project_notes.values(), key=lambda x: x['modified'], reverse=True)
     
     def create_main_caribou_portal_note(self, vault_path: str = None):
         """Create the main WLRS.LUP.CRP.caribou-portal note with links to all project notes"""
@@ -765,10 +1488,6 @@ class PMBOKProjectViewer:
             if not vault_path:
                 return None
         
-        import os
-        from datetime import datetime
-        import yaml
-        
         try:
             # Main note filename
             note_filename = "WLRS.LUP.CRP.caribou-portal.md"
@@ -787,9 +1506,20 @@ class PMBOKProjectViewer:
             }
             
             # Get all active projects
-            active_projects = [p for p in self.projects if p.get('Status', '').lower() in ['active', 'in progress']]
+            active_statuses = {'active', 'in progress'}
+            active_projects = [p for p in self.projects if p.get('Status', '').lower() in active_statuses]
             metrics = self.get_project_metrics()
             
+            # Active Projects section (built here because f-string expressions can't hold '\n' before 3.12)
+            active_section = '\n'.join(
+                f"### [[WLRS.LUP.CRP.caribou-portal.{pid}|{pid}: {p.get('Project_Name', 'Unnamed Project')}]]\n"
+                f"- **Status**: {p.get('Status', 'Unknown')}\n"
+                f"- **Lead**: {p.get('Project_Team_Lead', 'Unassigned')}\n"
+                f"- **Due**: {p.get('Required_Date', 'Not specified')}\n"
+                for p in active_projects[:10]
+                for pid in (p.get('Project_ID', ''),)
+            )
+            
             # Add children references
             for project in active_projects:
                 project_id = project.get('Project_ID', '')
@@ -797,7 +1527,7 @@ class PMBOKProjectViewer:
                     frontmatter['children'].append(f'wlrs.lup.crp.caribou-portal.{project_id}')
             
             content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False).strip() if yaml else '# YAML frontmatter unavailable'}
+{_frontmatter_yaml(frontmatter)}
 ---
 
 # Caribou Portal - PMBOK Project Management System
@@ -821,7 +1551,7 @@ class PMBOKProjectViewer:
 
 ## 🎯 Active Projects
 
-{chr(10).join([f"### [[WLRS.LUP.CRP.caribou-portal.{p.get('Project_ID', '')}|{p.get('Project_ID', '')}: {p.get('Project_Name', 'Unnamed Project')}]]" + chr(10) + f"- **Status**: {p.get('Status', 'Unknown')}" + chr(10) + f"- **Lead**: {p.get('Project_Team_Lead', 'Unassigned')}" + chr(10) + f"- **Due**: {p.get('Required_Date', 'Not specified')}" + chr(10) for p in active_projects[:10]])}
+{active_section}
 
 {f'*...and {len(active_projects) - 10} more projects*' if len(active_projects) > 10 else ''}
 
@@ -894,8 +1624,7 @@ Create standardized project notes:
 """
             
             # Write the note file
-            with open(note_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _write_text_file(note_path, content)
             
             return note_path
         
@@ -906,83 +1635,40 @@ Create standardized project notes:
     def read_dendron_note(self, note_path: str):
         """Read content from a Dendron note file"""
         try:
-            with open(note_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse frontmatter if it exists
-            frontmatter = {}
-            content_body = content
-            
-            if content.startswith('---\n'):
-                try:
-                    end_index = content.find('\n---\n', 4)
-                    if end_index != -1:
-                        import yaml
-                        frontmatter_text = content[4:end_index]
-                        frontmatter = yaml.safe_load(frontmatter_text) or {}
-                        content_body = content[end_index + 5:]
-                except Exception as e:
-                    print(f"Error parsing frontmatter: {e}")
-            
-            return {
-                'content': content_body.strip(),
-                'frontmatter': frontmatter,
-                'full_content': content
-            }
+            st = os.stat(note_path)
+            # Copy so callers can't mutate the cached entry
+            return dict(_read_note_cached(note_path, st.st_mtime_ns, st.st_size))
         
         except Exception as e:
             print(f"Error reading Dendron note {note_path}: {e}")
             return None
     
-    def create_dendron_project_note(self, project_id: str, vault_path: str = None):
-        """Create a new Dendron note for a project using WLRS.LUP.CRP.caribou-portal hierarchy"""
-        if not vault_path:
-            vault_path = self.get_dendron_vault_path()
-            if not vault_path:
-                return None
+    def _render_project_note(self, project: Dict[str, Any], project_id: str, now: datetime) -> str:
+        """Build the markdown (with frontmatter) for a project's Dendron note"""
+        project_name = project.get('Project_Name', f'Project {project_id}')
+        
+        # Note content with frontmatter
+        frontmatter = {
+            'id': f'wlrs.lup.crp.caribou-portal.{project_id}',
+            'title': f'Caribou Portal - Project {project_id}: {project_name}',
+            'desc': f'PMBOK project management for {project_name} (ID: {project_id})',
+            'updated': int(now.timestamp()),
+            'created': int(now.timestamp()),
+            'project_id': project_id,
+            'project_name': project_name,
+            'status': project.get('Status', 'Active'),
+            'tags': ['caribou-portal', 'pmbok', 'project', project_id.lower()],
+            'parent': 'WLRS.LUP.CRP.caribou-portal'
+        }
         
-        import os
-        from datetime import datetime
-        import yaml
+        # Get additional project details
+        team_members = self.get_team_members_list(project)
+        due_date = project.get('Required_Date', 'Not specified')
+        team_lead = project.get('Project_Team_Lead', 'Unassigned')
+        team_section = '\n'.join(f'- {member}' for member in team_members) if team_members else '- No team members assigned'
         
-        try:
-            project = self.get_project_by_id(project_id)
-            if not project:
-                return None
-            
-            project_name = project.get('Project_Name', f'Project {project_id}')
-            safe_project_name = project_name.lower().replace(' ', '-').replace('/', '-')
-            
-            # Use hierarchical structure: WLRS.LUP.CRP.caribou-portal.{project-id}
-            note_filename = f"WLRS.LUP.CRP.caribou-portal.{project_id}.md"
-            note_path = os.path.join(vault_path, note_filename)
-            
-            # Check if note already exists
-            if os.path.exists(note_path):
-                return note_path
-            
-            # Create note content with frontmatter
-            now = datetime.now()
-            frontmatter = {
-                'id': f'wlrs.lup.crp.caribou-portal.{project_id}',
-                'title': f'Caribou Portal - Project {project_id}: {project_name}',
-                'desc': f'PMBOK project management for {project_name} (ID: {project_id})',
-                'updated': int(now.timestamp()),
-                'created': int(now.timestamp()),
-                'project_id': project_id,
-                'project_name': project_name,
-                'status': project.get('Status', 'Active'),
-                'tags': ['caribou-portal', 'pmbok', 'project', project_id.lower()],
-                'parent': 'WLRS.LUP.CRP.caribou-portal'
-            }
-            
-            # Get additional project details
-            team_members = self.get_team_members_list(project)
-            due_date = project.get('Required_Date', 'Not specified')
-            team_lead = project.get('Project_Team_Lead', 'Unassigned')
-            
-            content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False).strip() if yaml else '# YAML frontmatter unavailable'}
+        return f"""---
+{_frontmatter_yaml(frontmatter)}
 ---
 
 # Caribou Portal - Project {project_id}: {project_name}
@@ -1002,7 +1688,7 @@ Create standardized project notes:
 - **PMBOK Phase**: {self.get_project_phase(project)}
 
 ## Team Members
-{chr(10).join([f'- {member}' for member in team_members]) if team_members else '- No team members assigned'}
+{team_section}
 
 ## Project Details
 - **Description**: {project.get('Description', 'No description available')}
@@ -1054,10 +1740,31 @@ Create standardized project notes:
 
 *Generated by Caribou Portal PMBOK System on {now.strftime("%Y-%m-%d %H:%M:%S")}*
 """
+    
+    def create_dendron_project_note(self, project_id: str, vault_path: str = None):
+        """Create a new Dendron note for a project using WLRS.LUP.CRP.caribou-portal hierarchy"""
+        if not vault_path:
+            vault_path = self.get_dendron_vault_path()
+            if not vault_path:
+                return None
+        
+        try:
+            project = self.get_project_by_id(project_id)
+            if not project:
+                return None
+            
+            # Use hierarchical structure: WLRS.LUP.CRP.caribou-portal.{project-id}
+            note_filename = f"WLRS.LUP.CRP.caribou-portal.{project_id}.md"
+            note_path = os.path.join(vault_path, note_filename)
+            
+            # Check if note already exists
+            if os.path.exists(note_path):
+                return note_path
+            
+            content = self._render_project_note(project, project_id, datetime.now())
             
             # Write the note file
-            with open(note_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _write_text_file(note_path, content)
             
             return note_path
         
@@ -1066,7 +1773,11 @@ Create standardized project notes:
             return None
     
     def get_dendron_integration_status(self):
-        """Check Dendron integration status and capabilities"""
+        """Check Dendron integration status and capabilities (re-probed at most every DENDRON_NOTE_COUNT_TTL_S)"""
+        now = time.monotonic()
+        if self._dendron_status is not None and now - self._dendron_status[0] <= DENDRON_NOTE_COUNT_TTL_S:
+            return dict(self._dendron_status[1])
+        
         vault_path = self.get_dendron_vault_path()
         
         status = {
@@ -1079,33 +1790,29 @@ Create standardized project notes:
         }
         
         if vault_path:
-            import os
-            
-            # Check read permissions
-            try:
-                status['can_read'] = os.access(vault_path, os.R_OK)
-            except:
-                pass
-            
-            # Check write permissions
+            # Check read/write permissions (a single access() call in the usual case where both are granted)
             try:
-                status['can_write'] = os.access(vault_path, os.W_OK)
+                if os.access(vault_path, os.R_OK | os.W_OK):
+                    status['can_read'] = status['can_write'] = True
+                else:
+                    status['can_read'] = os.access(vault_path, os.R_OK)
+                    status['can_write'] = os.access(vault_path, os.W_OK)
             except:
                 pass
             
-            # Count notes
+            # Count notes (and project-related notes) in one walk
             try:
-                import glob
-                all_notes = glob.glob(os.path.join(vault_path, "**", "*.md"), recursive=True)
-                status['note_count'] = len(all_notes)
-                
-                # Count project-related notes
-                project_notes = [n for n in all_notes if 'project' in os.path.basename(n).lower()]
-                status['project_notes'] = len(project_notes)
+                note_count = project_notes = 0
+                for name in _iter_markdown_names(vault_path):
+                    note_count += 1
+                    if 'project' in name.lower():
+                        project_notes += 1
+                status['note_count'], status['project_notes'] = note_count, project_notes
             except:
                 pass
         
-        return status
+        self._dendron_status = (now, status)
+        return dict(status)
 
     # def get_team_engagement_analyzer(self):
     #     """Get team engagement analyzer instance"""
@@ -1211,7 +1918,7 @@ def status_category_view(category: str):
     
     category_info = pmbok_viewer.project_status_categories[category]
     projects = pmbok_viewer.get_projects_by_status_category(category)
-    sorted_projects = pmbok_viewer.sort_projects_by_due_date(projects)
+    sorted_projects = projects  # already in due-date order
     
     ui.page_title(f"{category_info['name']} Projects")
     
@@ -1231,53 +1938,72 @@ def status_category_view(category: str):
         ui.button('Status Dashboard', on_click=lambda: ui.navigate.to('/status-dashboard')).classes('bg-purple-500 text-white')
         ui.button('PMBOK Analysis', on_click=lambda: ui.navigate.to('/pmbok-report')).classes('bg-green-500 text-white')
     
-    # Project cards
-    if sorted_projects:
-        with ui.grid(columns=2).classes('w-full gap-4'):
-            for project in sorted_projects:
-                project_id = project.get('Project_ID', 'N/A')
-                project_name = project.get('Project_Name', 'Unnamed Project')
-                assigned_to = project.get('Project_Team_Lead', 'Unassigned')
-                status = pmbok_viewer.get_project_effective_status(project)
-                due_date_raw = project.get('Required_Date', 'Not specified')
-                
-                # Format due date for display
-                if isinstance(due_date_raw, (int, float)):
-                    from datetime import datetime
-                    try:
-                        due_date = datetime.fromtimestamp(due_date_raw / 1000).strftime('%Y-%m-%d')
-                    except:
-                        due_date = "Not specified"
-                else:
-                    due_date = str(due_date_raw) if due_date_raw else "Not specified"
-                
-                # Calculate days until due
-                days_until_due = pmbok_viewer.calculate_days_until_due(project)
-                due_status, due_color = pmbok_viewer.get_due_date_status(days_until_due)
-                
-                with ui.card().classes(f'hover:shadow-lg transition-shadow border-l-4 border-{category_info["color"]}-500'):
-                    with ui.card_section():
-                        # Show Project Number instead of Project ID
-                        project_number = project.get('Project_Number', 'N/A')
-                        ui.label(f"{project_number}: {project_name}").classes('text-lg font-bold')
-                        ui.label(f"Status: {status}").classes(f'text-{category_info["color"]}-600 font-medium')
-                        ui.label(f"Lead: {assigned_to}").classes('text-gray-700')
-                        ui.label(f"Due: {due_date}").classes('text-gray-600')
-                        
-                        # Due date status badge
-                        if days_until_due is not None:
-                            ui.badge(due_status).classes(f'bg-{due_color}-500 text-white text-sm mt-1')
-                        
-                        with ui.row().classes('gap-2 mt-3'):
-                            ui.button('View Details', 
-                                    on_click=lambda pid=project_id: ui.navigate.to(f'/project/{pid}')
-                            ).classes('bg-blue-500 text-white')
-                            ui.button('PMBOK Analysis', 
-                                    on_click=lambda pid=project_id: ui.navigate.to(f'/pmbok/{pid}')
-                            ).classes('bg-green-500 text-white')
-                            ui.button('Edit Status', 
-                                    on_click=lambda pid=project_id: ui.navigate.to(f'/edit-status/{pid}')
-                            ).classes('bg-orange-500 text-white')
+    # Derive every card's display values in one pass so the UI loop below only reads them
+    rows = []
+    for project in sorted_projects:
+        due_date_raw = project.get('Required_Date', 'Not specified')
+        
+        # Format due date for display (numeric values are epoch milliseconds)
+        if isinstance(due_date_raw, (int, float)):
+            try:
+                due_date = _format_epoch_ms_date(due_date_raw)
+            except (OverflowError, OSError, ValueError):
+                due_date = "Not specified"
+        else:
+            due_date = str(due_date_raw) if due_date_raw else "Not specified"
+        
+        # Calculate days until due
+        days_until_due = pmbok_viewer.calculate_days_until_due(project)
+        due_status, due_color = pmbok_viewer.get_due_date_status(days_until_due)
+        
+        rows.append({
+            'project_id': project.get('Project_ID', 'N/A'),
+            'project_number': project.get('Project_Number', 'N/A'),
+            'project_name': project.get('Project_Name', 'Unnamed Project'),
+            'assigned_to': project.get('Project_Team_Lead', 'Unassigned'),
+            'status': pmbok_viewer.get_project_effective_status(project),
+            'due_date': due_date,
+            'days_until_due': days_until_due,
+            'due_status': due_status,
+            'due_color': due_color
+        })
+    
+    # Project table: one widget for the whole category; rows render and sort client-side
+    if rows:
+        columns = [
+            {'name': 'project', 'label': 'Project', 'field': 'project_label', 'align': 'left', 'sortable': True},
+            {'name': 'status', 'label': 'Status', 'field': 'status', 'align': 'left', 'sortable': True},
+            {'name': 'lead', 'label': 'Lead', 'field': 'assigned_to', 'align': 'left', 'sortable': True},
+            {'name': 'due', 'label': 'Due', 'field': 'due_date', 'align': 'left'},
+            {'name': 'due_status', 'label': 'Due Status', 'field': 'days_until_due', 'align': 'left', 'sortable': True},
+            {'name': 'actions', 'label': '', 'field': 'project_id', 'align': 'right'},
+        ]
+        for row in rows:
+            # Show Project Number instead of Project ID
+            row['project_label'] = f"{row['project_number']}: {row['project_name']}"
+        
+        table = ui.table(columns=columns, rows=rows, row_key='project_id', pagination=25).classes(
+            f'w-full border-l-4 border-{category_info["color"]}-500')
+        table.add_slot('body-cell-status', f'''
+            <q-td :props="props" class="text-{category_info["color"]}-600 font-medium">{{{{ props.value }}}}</q-td>
+        ''')
+        table.add_slot('body-cell-due_status', r'''
+            <q-td :props="props">
+                <q-badge v-if="props.row.days_until_due !== null" :label="props.row.due_status"
+                         :class="'bg-' + props.row.due_color + '-500 text-white text-sm'" />
+            </q-td>
+        ''')
+        table.add_slot('body-cell-actions', r'''
+            <q-td :props="props">
+                <q-btn size="sm" no-caps label="View Details" class="bg-blue-500 text-white q-mr-xs"
+                       @click="$parent.$emit('navigate', '/project/' + props.row.project_id)" />
+                <q-btn size="sm" no-caps label="PMBOK Analysis" class="bg-green-500 text-white q-mr-xs"
+                       @click="$parent.$emit('navigate', '/pmbok/' + props.row.project_id)" />
+                <q-btn size="sm" no-caps label="Edit Status" class="bg-orange-500 text-white"
+                       @click="$parent.$emit('navigate', '/edit-status/' + props.row.project_id)" />
+            </q-td>
+        ''')
+        table.on('navigate', lambda e: ui.navigate.to(e.args))
     else:
         with ui.card().classes('w-full text-center'):
             ui.label(f"No projects currently in {category_info['name']} status").classes('text-gray-500 text-lg')
@@ -1288,7 +2014,7 @@ def edit_project_status(project_id: str):
     """Edit project status page"""
     
     # Find the project
-    project = next((p for p in pmbok_viewer.projects if str(p.get('Project_ID', '')) == str(project_id)), None)
+    project = pmbok_viewer.get_project_by_id(project_id)
     if not project:
         ui.label(f"Project {project_id} not found").classes('text-red-500 text-xl')
         return
@@ -1322,19 +2048,16 @@ def edit_project_status(project_id: str):
             # Status selection
             ui.label("Select New Status:").classes('text-lg font-semibold mt-4')
             
-            with ui.column().classes('gap-2 mt-2'):
+            with ui.column().classes('gap-2 mt-2 w-full'):
                 selected_status = {'value': current_status}
                 
-                for category_key, category_info in pmbok_viewer.project_status_categories.items():
-                    with ui.expansion(category_info['name']).classes('w-full'):
-                        with ui.column().classes('gap-1 p-2'):
-                            ui.label(category_info['description']).classes('text-sm text-gray-600 mb-2')
-                            
-                            for status in category_info['statuses']:
-                                with ui.row().classes('items-center gap-2'):
-                                    ui.radio([status], value=current_status if status == current_status else None, 
-                                           on_change=lambda e, s=status: selected_status.update({'value': s})).classes('flex-none')
-                                    ui.label(status).classes('flex-1')
+                # A status from ArcGIS outside the predefined set stays selectable as the current value
+                status_options = _STATUS_SELECT_OPTIONS
+                if current_status not in status_options:
+                    status_options = {current_status: current_status, **status_options}
+                
+                ui.select(status_options, value=current_status,
+                          on_change=lambda e: selected_status.update({'value': e.value})).classes('w-full')
             
             ui.separator()
             
@@ -1358,10 +2081,9 @@ def edit_project_status(project_id: str):
                 
                 # Reset to original button
                 def reset_status():
-                    if str(project_id) in pmbok_viewer.status_overrides:
-                        del pmbok_viewer.status_overrides[str(project_id)]
-                        pmbok_viewer.save_status_overrides()
+                    if pmbok_viewer.reset_project_status(project_id):
                         ui.notify('Status reset to original ArcGIS value', type='positive')
+                        _warn_if_save_fails()
                         ui.navigate.to(f'/project/{project_id}')
                     else:
                         ui.notify('No override to reset', type='info')
@@ -1389,37 +2111,26 @@ def pmbok_dashboard():
     # Main project grid
     projects_container = ui.column().classes('w-full px-4')
     
-    def update_dashboard():
+    async def update_dashboard():
         """Update dashboard with latest PMBOK metrics"""
-        import subprocess
-        import os
-        
         try:
             # First show notification before any UI changes
             print('🔄 Refreshing portfolio data...')
             
-            # Run enhanced_get_projects_s3.py to get latest data
-            script_path = os.path.join(os.path.dirname(__file__), 'enhanced_get_projects_s3.py')
-            if os.path.exists(script_path):
-                try:
-                    # Use the same Python environment that's running this dashboard
-                    result = subprocess.run([sys.executable, script_path], 
-                                          capture_output=True, text=True, timeout=120)
-                    if result.returncode == 0:
-                        print(f"✅ enhanced_get_projects_s3.py executed successfully")
-                        print(f"Output: {result.stdout[-200:]}")  # Show last 200 chars of output
-                    else:
-                        print(f"Warning: enhanced_get_projects_s3.py failed: {result.stderr}")
-                except subprocess.TimeoutExpired:
-                    print("Warning: enhanced_get_projects_s3.py timed out")
-                except Exception as e:
-                    print(f"Warning: Could not run enhanced_get_projects_s3.py: {e}")
-            else:
-                print(f"Warning: enhanced_get_projects_s3.py not found at {script_path}")
+            # Pull latest data from ArcGIS into S3 in-process (keeps imports and S3 connections warm);
+            # runs on a worker thread so the event loop keeps serving other clients meanwhile
+            try:
+                uploaded = await run.io_bound(enhanced_get_projects_s3.refresh_from_s3)
+                if uploaded:
+                    print(f"✅ enhanced_get_projects_s3 refresh uploaded {uploaded} projects")
+                else:
+                    print("Warning: enhanced_get_projects_s3 refresh did not upload any projects")
+            except Exception as e:
+                print(f"Warning: Could not run enhanced_get_projects_s3 refresh: {e}")
             
-            # Refresh the PMBOK viewer data
-            count = pmbok_viewer.refresh_data()
-            metrics = pmbok_viewer.get_project_metrics()
+            # Refresh the PMBOK viewer data off the event loop (it may wait on the startup warm-up's lock)
+            count = await run.io_bound(pmbok_viewer.refresh_data)
+            metrics = await run.io_bound(pmbok_viewer.get_project_metrics)
             
             # Clear containers
             metrics_container.clear()
@@ -1444,20 +2155,11 @@ def pmbok_dashboard():
             with process_container:
                 ui.label('PMBOK Process Groups Distribution:').classes('text-xl font-bold text-gray-700 w-full text-center mb-2')
                 
-                # Process group tooltip definitions
-                process_tooltips = {
-                    'initiating': 'Initiating: Projects in the early startup phase, defining project scope, objectives, and stakeholders',
-                    'planning': 'Planning: Projects developing detailed project management plans, schedules, budgets, and resource allocation',
-                    'executing': 'Executing: Projects actively performing the work defined in the project management plan',
-                    'monitoring': 'Monitoring & Controlling: Projects tracking progress, managing changes, and ensuring deliverables meet quality standards',
-                    'closing': 'Closing: Projects completing final deliverables, obtaining stakeholder approval, and formal project closure'
-                }
-                
                 process_dist = metrics.get('process_distribution', {})
                 for process_key, count in process_dist.items():
                     if count > 0:
                         process_name = pmbok_viewer.process_groups.get(process_key, process_key)
-                        tooltip_text = process_tooltips.get(process_key, f'{process_name}: PMBOK process group')
+                        tooltip_text = _PROCESS_TOOLTIPS.get(process_key, f'{process_name}: PMBOK process group')
                         
                         with ui.card().classes('p-3 bg-gray-50 cursor-help').tooltip(tooltip_text):
                             ui.label(f'{process_name}: {count}').classes('text-sm font-medium text-gray-700')
@@ -1465,14 +2167,16 @@ def pmbok_dashboard():
             # Project cards
             display_pmbok_projects()
             
-            # Update Dendron main note if vault is available
-            try:
-                dendron_status = pmbok_viewer.get_dendron_integration_status()
-                if dendron_status.get('vault_found') and dendron_status.get('can_read'):
-                    pmbok_viewer.create_main_caribou_portal_note(dendron_status['vault_path'])
-                    print("✅ Updated Dendron main note")
-            except Exception as e:
-                print(f"Warning: Could not update Dendron note: {e}")
+            # Update Dendron main note if vault is available (in the background; nothing on screen needs it)
+            def update_main_note():
+                try:
+                    dendron_status = pmbok_viewer.get_dendron_integration_status()
+                    if dendron_status.get('vault_found') and dendron_status.get('can_read'):
+                        pmbok_viewer.create_main_caribou_portal_note(dendron_status['vault_path'])
+                        print("✅ Updated Dendron main note")
+                except Exception as e:
+                    print(f"Warning: Could not update Dendron note: {e}")
+            threading.Thread(target=update_main_note, daemon=True).start()
             
             # Final success notification
             print(f'✅ Portfolio refreshed! {count} projects loaded')
@@ -1481,32 +2185,45 @@ def pmbok_dashboard():
             print(f'❌ Error refreshing portfolio: {str(e)}')
             print(f"Error in update_dashboard: {e}")
     
+    # One-shot timer for a pending coalesced refresh, if any
+    pending_refresh = {'timer': None}
+    
+    def schedule_refresh():
+        """Refresh the dashboard once edits settle, so a burst of saves costs a single rebuild"""
+        if pending_refresh['timer'] is not None:
+            pending_refresh['timer'].cancel()
+        pending_refresh['timer'] = ui.timer(DASHBOARD_REFRESH_DEBOUNCE_S, update_dashboard, once=True)
+    
+    # Rows of the current portfolio table by project ID, and the table showing them
+    portfolio_rows = {}
+    portfolio_table = {'table': None}
+    
+    def refresh_portfolio_row(project_id):
+        """Rebuild one project's table row after an edit instead of rebuilding the dashboard"""
+        row = portfolio_rows.get(project_id)
+        project = pmbok_viewer.get_project_by_id(project_id)
+        if row is None or project is None:
+            schedule_refresh()
+            return
+        
+        row.update(_build_portfolio_row(pmbok_viewer, pmbok_viewer.project_status_categories, project))
+        portfolio_table['table'].update()
+    
     def open_status_update_dialog(project_id: str):
         """Open a dialog to update project status"""
         project = pmbok_viewer.get_project_by_id(project_id)
         if not project:
             ui.notify(f'Project not found', type='negative')
-            print(f"DEBUG: Project {project_id} not found")  # Debug line
+            logger.debug("Project %s not found", project_id)
             return
         
         project_number = project.get('Project_Number', 'N/A')
-        print(f"DEBUG: Opening status dialog for project {project_number} (ID: {project_id})")  # Debug line
+        logger.debug("Opening status dialog for project %s (ID: %s)", project_number, project_id)
         
         current_status = pmbok_viewer.get_project_effective_status(project)
         project_name = project.get('Project_Name', 'Unknown Project')
         
-        print(f"DEBUG: Project found - {project_name}, current status: {current_status}")  # Debug line
-        
-        # Define available status options
-        status_options = [
-            'Not Assigned',
-            'Not Started',
-            'In Progress', 
-            'Client Review',
-            'Awaiting Resources',
-            'On Hold',
-            'Completed'
-        ]
+        logger.debug("Project found - %s, current status: %s", project_name, current_status)
         
         # First show a notification to confirm the function is being called
         ui.notify(f'Opening status update for {project_name}', type='info')
@@ -1520,8 +2237,8 @@ def pmbok_dashboard():
             
             status_select = ui.select(
                 label='New Status',
-                options=status_options,
-                value=current_status if current_status in status_options else status_options[0]
+                options=_DIALOG_STATUS_OPTIONS,
+                value=current_status if current_status in _DIALOG_STATUS_OPTIONS else _DIALOG_STATUS_OPTIONS[0]
             ).classes('w-full mb-4')
             
             with ui.row().classes('w-full justify-end gap-2'):
@@ -1529,22 +2246,23 @@ def pmbok_dashboard():
                 
                 def save_status():
                     new_status = status_select.value
-                    print(f"DEBUG: Saving status change from {current_status} to {new_status}")  # Debug line
+                    logger.debug("Saving status change from %s to %s", current_status, new_status)
                     
                     if new_status and new_status != current_status:
                         try:
                             success = pmbok_viewer.update_project_status(project_id, new_status)
-                            print(f"DEBUG: Update result: {success}")  # Debug line
+                            logger.debug("Update result: %s", success)
                             
                             if success:
                                 ui.notify(f'✅ Status updated to: {new_status}', type='positive')
+                                _warn_if_save_fails()
                                 dialog.close()
-                                # Refresh the dashboard to show updated status
-                                update_dashboard()
+                                # Show the updated status in its row; the rest of the dashboard is unaffected
+                                refresh_portfolio_row(project_id)
                             else:
                                 ui.notify('❌ Failed to save status update', type='negative')
                         except Exception as e:
-                            print(f"DEBUG: Error updating status: {e}")  # Debug line
+                            logger.debug("Error updating status: %s", e)
                             ui.notify(f'❌ Error: {str(e)}', type='negative')
                     else:
                         ui.notify('No changes made', type='info')
@@ -1552,7 +2270,7 @@ def pmbok_dashboard():
                 
                 ui.button('Save', on_click=save_status).classes('bg-blue-500 text-white')
         
-        print("DEBUG: Opening dialog")  # Debug line
+        logger.debug("Opening dialog")
         dialog.open()
 
     def display_pmbok_projects():
@@ -1572,288 +2290,202 @@ def pmbok_dashboard():
                 ui.button('📝 GSS Caribou Support Information', on_click=lambda: ui.navigate.to('/dendron-integration')).classes('bg-indigo-500 text-white px-6 py-2')
             
             # Project grid with PMBOK metrics (sorted by due date)
-            sorted_projects = pmbok_viewer.sort_projects_by_due_date(pmbok_viewer.projects)
+            sorted_projects = pmbok_viewer.get_projects_sorted_by_due_date()
             
             # Add sorting indicator
             ui.label('Projects sorted by due date (nearest deadlines first)').classes('text-sm text-gray-600 text-center w-full mb-2')
             
-            # Table view for projects (NiceGUI expects columns and rows arguments)
-            table_rows = []
-            for project in sorted_projects:
-                    project_name = project.get('Project_Name', 'N/A')
-                    date_required_raw = project.get('Date_Required', None)
-                    if isinstance(date_required_raw, (int, float)):
-                        from datetime import datetime
-                        try:
-                            required_date = datetime.fromtimestamp(date_required_raw / 1000).strftime('%Y-%m-%d')
-                        except:
-                            required_date = "Not specified"
-                    else:
-                        required_date = str(date_required_raw) if date_required_raw else "Not specified"
-
-                    # Get all people associated: lead and team members
-                    people = []
-                    lead = project.get('Project_Team_Lead', '') or project.get('Team_Member', '')
-                    if lead and lead != 'N/A':
-                        people.append(lead)
-                    team_members = project.get('Team_Members', [])
-                    if isinstance(team_members, list):
-                        for member in team_members:
-                            if isinstance(member, dict):
-                                name = member.get('Resource_Name', '').strip()
-                                if name:
-                                    people.append(name)
-                            elif isinstance(member, str) and member.strip():
-                                people.append(member.strip())
-                    elif isinstance(team_members, str) and team_members:
-                        people.extend([m.strip() for m in team_members.split(',') if m.strip()])
-                    # Remove duplicates
-                    people_display = ', '.join(dict.fromkeys(people)) if people else 'Unassigned'
-                    status = pmbok_viewer.get_project_effective_status(project)
-                    
-                    # Get status category for color coding
-                    status_category = pmbok_viewer.get_project_status_category(project)
-                    status_color = pmbok_viewer.project_status_categories[status_category]['color']
-                    
-                    table_rows.append({
-                        'Project Name': project_name,
-                        'Required Date': required_date,
-                        'Staff Assigned': people_display,
-                        'Status': status,
-                        'status_color': status_color,
-                        'project_id': project.get('Project_ID', '')
-                    })
+            # Table view for projects: one pass over the sorted projects builds every row
+            status_categories = pmbok_viewer.project_status_categories
+            table_rows = [_build_portfolio_row(pmbok_viewer, status_categories, project) for project in sorted_projects]
+            portfolio_rows.clear()
+            portfolio_rows.update((row['project_id'], row) for row in table_rows)
             
             # Create a custom table with color-coded rows
-            ui.label('Click on project name/date/people to view details • Click on status to update • Hover over notes field to see full text • Edit notes directly in the field • Add action items (one per line) in Coordinator Actions').classes('text-sm text-gray-600 text-center w-full mb-3 italic')
-            with ui.element('div').classes('w-full overflow-x-auto'):
-                with ui.element('table').classes('w-full border-collapse bg-white shadow-sm rounded-lg'):
-                    # Table header
-                    with ui.element('thead').classes('bg-gray-50'):
-                        with ui.element('tr'):
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Project Name')
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Required Date')
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Staff Assigned')
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Status')
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Notes')
-                            with ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider border-b'):
-                                ui.html('Coordinator Actions')
-                    
-                    # Table body
-                    with ui.element('tbody').classes('divide-y divide-gray-200'):
-                        for row in table_rows:
-                            color = row['status_color']
-                            project_id = row['project_id']
-                            
-                            # Make "Not Assigned" projects extra prominent with bright red styling
-                            if row['Status'] in ['Not Assigned', 'Unassigned', 'Pending Assignment']:
-                                row_classes = 'hover:bg-red-200 border-l-4 border-red-600 bg-red-100 transition-colors'
-                                text_classes = 'text-red-900'
-                            else:
-                                row_classes = f'hover:bg-{color}-100 border-l-4 border-{color}-500 bg-{color}-50 transition-colors'
-                                text_classes = 'text-gray-900'
-                            
-                            # Create clickable row that navigates to project detail
-                            with ui.element('tr').classes(row_classes):
-                                with ui.element('td').classes(f'px-6 py-4 whitespace-nowrap text-sm font-medium {text_classes} cursor-pointer').on('click', lambda pid=project_id: ui.navigate.to(f'/pmbok/{pid}')):
-                                    ui.html(row['Project Name'])
-                                    # Show Project Number instead of Project ID
-                                    project_number = next((p.get('Project_Number', 'N/A') for p in pmbok_viewer.projects if str(p.get('Project_ID', '')) == str(project_id)), 'N/A')
-                                    ui.html(f'<div class="text-xs text-gray-500">{project_number}</div>')
-                                with ui.element('td').classes(f'px-6 py-4 whitespace-nowrap text-sm {text_classes} cursor-pointer').on('click', lambda pid=project_id: ui.navigate.to(f'/pmbok/{pid}')):
-                                    ui.html(row['Required Date'])
-                                with ui.element('td').classes(f'px-6 py-4 whitespace-nowrap text-sm {text_classes} cursor-pointer').on('click', lambda pid=project_id: ui.navigate.to(f'/pmbok/{pid}')):
-                                    ui.html(row['Staff Assigned'])
-                                with ui.element('td').classes('px-6 py-4 whitespace-nowrap'):
-                                    def update_status_handler(pid=project_id):
-                                        open_status_update_dialog(pid)
-                                    
-                                    # Make status button extra prominent for Not Assigned projects
-                                    if row['Status'] in ['Not Assigned', 'Unassigned', 'Pending Assignment']:
-                                        button_classes = 'px-2 py-1 text-xs font-bold rounded-full bg-red-600 text-white hover:bg-red-700 transition-colors border-0 shadow-lg'
-                                    else:
-                                        button_classes = f'px-2 py-1 text-xs font-semibold rounded-full bg-{color}-500 text-white hover:bg-{color}-600 transition-colors border-0'
-                                    
-                                    ui.button(f'✏️ {row["Status"]}', on_click=update_status_handler).classes(button_classes).props('flat dense')
-                                
-                                # Notes column with editable textarea and save button
-                                with ui.element('td').classes('px-6 py-4 whitespace-nowrap'):
-                                    current_notes = pmbok_viewer.get_project_notes(project_id)
-                                    
-                                    with ui.column().classes('w-full gap-1'):
-                                        # Create textarea for notes
-                                        notes_textarea = ui.textarea(
-                                            label='',
-                                            placeholder='Add notes...',
-                                            value=current_notes,
-                                        ).classes('w-full text-xs').props('dense outlined rows=3')
-                                        
-                                        # Add save button
-                                        def save_notes_click(pid=project_id, textarea=notes_textarea):
-                                            def on_save():
-                                                new_notes = textarea.value
-                                                success = pmbok_viewer.update_project_notes(pid, new_notes)
-                                                if success:
-                                                    print(f"✅ Notes saved for project {pid}: '{new_notes[:50]}...'")
-                                                    ui.notify(f'Notes saved for {row["Project_Name"][:30]}...', type='positive')
-                                                else:
-                                                    print(f"❌ Failed to save notes for project {pid}")
-                                                    ui.notify('Failed to save notes', type='negative')
-                                            return on_save
-                                        
-                                        ui.button('💾', on_click=save_notes_click()).classes('text-xs bg-blue-500 text-white px-2 py-1').props('dense')
-                                        
-                                        # Show hover tooltip for existing notes
-                                        if current_notes:
-                                            notes_textarea.tooltip(current_notes)
-                                
-                                # Coordinator Actions column with editable textarea and save button (bulleted list)
-                                with ui.element('td').classes('px-6 py-4 whitespace-nowrap'):
-                                    current_actions = pmbok_viewer.get_coordinator_actions(project_id)
-                                    
-                                    with ui.column().classes('w-full gap-1'):
-                                        # Create textarea for actions
-                                        actions_textarea = ui.textarea(
-                                            label='',
-                                            placeholder='Add action items...\nOne per line',
-                                            value=current_actions,
-                                        ).classes('w-full text-xs').props('dense outlined rows=3')
-                                        
-                                        # Add save button
-                                        def save_actions_click(pid=project_id, textarea=actions_textarea):
-                                            def on_save():
-                                                new_actions = textarea.value
-                                                success = pmbok_viewer.update_coordinator_actions(pid, new_actions)
-                                                if success:
-                                                    print(f"✅ Coordinator actions saved for project {pid}: '{new_actions[:50]}...'")
-                                                    ui.notify(f'Actions saved for {row["Project_Name"][:30]}...', type='positive')
-                                                else:
-                                                    print(f"❌ Failed to save coordinator actions for project {pid}")
-                                                    ui.notify('Failed to save actions', type='negative')
-                                            return on_save
-                                        
-                                        ui.button('💾', on_click=save_actions_click()).classes('text-xs bg-green-500 text-white px-2 py-1').props('dense')
-                                        
-                                        # Show hover tooltip for existing actions (formatted as bullets)
-                                        if current_actions:
-                                            display_actions = pmbok_viewer.format_actions_as_bullets(current_actions)
-                                            actions_textarea.tooltip(display_actions)
-    
-    def create_pmbok_project_card(project: Dict[str, Any]):
-        """Create enhanced PMBOK-aligned project card with team, dates, and status"""
-        project_id = project.get('Project_ID', '')
-        project_name = project.get('Project_Name', 'N/A')
-        project_number = project.get('Project_Number', 'N/A')
+            ui.label('Click on project name/date/people to view details • Click on status to update • Hover over notes to see full text • Click notes to edit them • Click Coordinator Actions to add action items (one per line)').classes('text-sm text-gray-600 text-center w-full mb-3 italic')
+            
+            # Per-column hooks for the editable Notes / Coordinator Actions cells
+            editor_fields = {
+                'notes': {
+                    'save': pmbok_viewer.update_project_notes,
+                    'saved_label': 'Notes',
+                },
+                'actions': {
+                    'save': pmbok_viewer.update_coordinator_actions,
+                    'saved_label': 'Actions',
+                },
+            }
+            
+            def save_cell(field, e):
+                """Save a notes/actions edit from the table's popup editor"""
+                spec = editor_fields[field]
+                project_id = e.args['project_id']
+                new_value = e.args['value'] or ''
+                row = portfolio_rows.get(project_id)
+                project_name = row['Project Name'] if row else str(project_id)
+                
+                if spec['save'](project_id, new_value):
+                    logger.debug("%s saved for project %s: '%.50s...'", spec['saved_label'], project_id, new_value)
+                    ui.notify(f"{spec['saved_label']} saved for {project_name[:30]}...", type='positive')
+                    _warn_if_save_fails()
+                    refresh_portfolio_row(project_id)
+                else:
+                    logger.warning("Failed to save %s for project %s", spec['saved_label'].lower(), project_id)
+                    ui.notify(f"Failed to save {spec['saved_label'].lower()}", type='negative')
+            
+            # One QTable for the whole portfolio: rows are data, and Quasar's virtual scroll only
+            # renders the rows in view
+            columns = [
+                {'name': 'name', 'label': 'Project Name', 'field': 'Project Name', 'align': 'left'},
+                {'name': 'due', 'label': 'Required Date', 'field': 'Required Date', 'align': 'left'},
+                {'name': 'staff', 'label': 'Staff Assigned', 'field': 'Staff Assigned', 'align': 'left'},
+                {'name': 'status', 'label': 'Status', 'field': 'Status', 'align': 'left'},
+                {'name': 'notes', 'label': 'Notes', 'field': 'notes', 'align': 'left'},
+                {'name': 'actions', 'label': 'Coordinator Actions', 'field': 'actions', 'align': 'left'},
+            ]
+            table = ui.table(columns=columns, rows=table_rows, row_key='project_id').classes(
+                'w-full bg-white shadow-sm rounded-lg').style(f'height: {TABLE_VIEWPORT_PX}px').props('virtual-scroll flat')
+            table.add_slot('body', r"""
+                <q-tr :props="props" :class="props.row.classes.tr">
+                    <q-td key="name" :props="props" :class="props.row.classes.name_cell"
+                          @click="$parent.$emit('open_project', props.row.project_id)">
+                        {{ props.row['Project Name'] }}
+                        <div class="text-xs text-gray-500">{{ props.row['Project Number'] }}</div>
+                    </q-td>
+                    <q-td key="due" :props="props" :class="props.row.classes.cell"
+                          @click="$parent.$emit('open_project', props.row.project_id)">
+                        {{ props.row['Required Date'] }}
+                    </q-td>
+                    <q-td key="staff" :props="props" :class="props.row.classes.cell"
+                          @click="$parent.$emit('open_project', props.row.project_id)">
+                        {{ props.row['Staff Assigned'] }}
+                    </q-td>
+                    <q-td key="status" :props="props">
+                        <q-btn flat dense no-caps :label="'✏️ ' + props.row.Status" :class="props.row.classes.status_button"
+                               @click="$parent.$emit('edit_status', props.row.project_id)" />
+                    </q-td>
+                    <q-td key="notes" :props="props" class="cursor-pointer">
+                        <span v-if="props.row.notes" class="text-xs text-gray-800 hover:underline">{{ props.row.notes_preview }}</span>
+                        <span v-else class="text-xs text-gray-400 italic hover:underline">Add notes...</span>
+                        <q-tooltip v-if="props.row.notes" class="whitespace-pre-line">{{ props.row.notes }}</q-tooltip>
+                        <q-popup-edit :model-value="props.row.notes" buttons v-slot="scope"
+                                      @save="(value) => $parent.$emit('save_notes', {project_id: props.row.project_id, value: value})">
+                            <q-input type="textarea" v-model="scope.value" dense outlined autofocus placeholder="Add notes..." @keyup.enter.stop />
+                        </q-popup-edit>
+                    </q-td>
+                    <q-td key="actions" :props="props" class="cursor-pointer">
+                        <span v-if="props.row.actions" class="text-xs text-gray-800 hover:underline">{{ props.row.actions_preview }}</span>
+                        <span v-else class="text-xs text-gray-400 italic hover:underline">Add action items...</span>
+                        <q-tooltip v-if="props.row.actions" class="whitespace-pre-line">{{ props.row.actions_bullets }}</q-tooltip>
+                        <q-popup-edit :model-value="props.row.actions" buttons v-slot="scope"
+                                      @save="(value) => $parent.$emit('save_actions', {project_id: props.row.project_id, value: value})">
+                            <q-input type="textarea" v-model="scope.value" dense outlined autofocus placeholder="Add action items... One per line" @keyup.enter.stop />
+                        </q-popup-edit>
+                    </q-td>
+                </q-tr>
+            """)
+            table.on('open_project', lambda e: ui.navigate.to(f'/pmbok/{e.args}'))
+            table.on('edit_status', lambda e: open_status_update_dialog(e.args))
+            table.on('save_notes', lambda e: save_cell('notes', e))
+            table.on('save_actions', lambda e: save_cell('actions', e))
+            portfolio_table['table'] = table
+
+    # Initial load, once the page is on screen
+    ui.timer(0, update_dashboard, once=True)
+
+
+def _warn_if_save_fails():
+    """Warn on this page if S3 writes are failing, now or once the queued save has had time to reach S3"""
+    def check():
+        if pmbok_viewer.overrides_save_state() == 'failed':
+            ui.notify('⚠️ Changes could not be written to S3 yet; they are kept and will be retried', type='warning')
+            return True
+        return False
+    # Already failing: say so straight away, since the caller may navigate off this page
+    if not check():
+        ui.timer(OVERRIDES_FLUSH_DELAY_S + 1.0, check, once=True)
+
+
+def _save_project_notes(project_id: str, textarea, source: str):
+    """Save the notes textarea for a project and report the result"""
+    if pmbok_viewer.update_project_notes(project_id, textarea.value):
+        ui.notify('✅ Notes saved successfully', type='positive')
+        _warn_if_save_fails()
+        logger.debug("Notes saved for project %s from %s", project_id, source)
+    else:
+        ui.notify('❌ Notes could not be written to S3; kept locally and retrying', type='negative')
+        logger.warning("Failed to save notes for project %s", project_id)
+
+
+def _save_coordinator_actions(project_id: str, textarea, source: str):
+    """Save the coordinator actions textarea for a project and report the result"""
+    if pmbok_viewer.update_coordinator_actions(project_id, textarea.value):
+        ui.notify('✅ Coordinator actions saved successfully', type='positive')
+        _warn_if_save_fails()
+        logger.debug("Coordinator actions saved for project %s from %s", project_id, source)
+    else:
+        ui.notify('❌ Coordinator actions could not be written to S3; kept locally and retrying', type='negative')
+        logger.warning("Failed to save coordinator actions for project %s", project_id)
+
+
+def _render_notes_card(project_id: str, source: str, card_classes: str, footer: str):
+    """Project Notes card: the current notes, an editor and a save button"""
+    current_notes = pmbok_viewer.get_project_notes(project_id)
+    
+    with ui.card().classes(card_classes):
+        ui.label('📋 Project Notes').classes(_CARD_TITLE_CLASSES)
         
-        # Get effective status and team information
-        effective_status = pmbok_viewer.get_project_effective_status(project)
-        team_members = pmbok_viewer.get_team_members_list(project)
-        days_until_due = pmbok_viewer.calculate_days_until_due(project)
-        due_status, due_color = pmbok_viewer.get_due_date_status(days_until_due)
+        if current_notes:
+            ui.label('Current Notes:').classes(_FIELD_LABEL_CLASSES)
+            ui.label(current_notes).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-blue-400 whitespace-pre-wrap')
         
-        # PMBOK Analysis
-        phase = pmbok_viewer.get_project_phase(project)
-        phase_name = pmbok_viewer.process_groups.get(phase, phase)
-        schedule_perf = pmbok_viewer.calculate_schedule_performance(project)
-        risk_analysis = pmbok_viewer.get_risk_level(project)
-        
-        # Card styling based on due date urgency
-        if days_until_due is not None and days_until_due <= 0:
-            border_color = 'border-red-500'
-            card_bg = 'bg-red-50'
-        elif days_until_due is not None and days_until_due <= 7:
-            border_color = 'border-yellow-500'
-            card_bg = 'bg-yellow-50'
-        else:
-            border_color = f'border-{schedule_perf["health"]}-400'
-            card_bg = 'bg-white'
+        ui.label('Edit Notes:').classes(_FIELD_LABEL_CLASSES)
         
-        with ui.card().classes(f'w-80 p-4 cursor-pointer hover:shadow-lg transition-shadow border-l-4 {border_color} {card_bg}'):
-            # Header with project info and status
-            with ui.row().classes('w-full justify-between items-start mb-3'):
-                with ui.column().classes('flex-grow'):
-                    ui.label(project_name).classes('text-lg font-bold text-gray-800 leading-tight')
-                    ui.label(project_number).classes('text-sm text-gray-600')
-                
-                with ui.column().classes('text-right'):
-                    # Status badge
-                    status_category = pmbok_viewer.get_project_status_category(project)
-                    status_color = pmbok_viewer.project_status_categories[status_category]['color']
-                    ui.badge(effective_status).classes(f'bg-{status_color}-500 text-white text-xs mb-1')
-                    
-                    # Phase badge
-                    ui.badge(phase_name).classes('bg-blue-500 text-white text-xs')
-            
-            # Due date information (prominent display)
-            with ui.row().classes('w-full items-center mb-3 p-2 bg-white rounded'):
-                ui.icon('event').classes(f'text-{due_color}-600 mr-2')
-                if days_until_due is not None:
-                    due_date_raw = project.get('Date_Required', '') or project.get('Required_Date', '')
-                    
-                    # Format the due date for display
-                    if isinstance(due_date_raw, (int, float)):
-                        from datetime import datetime
-                        try:
-                            formatted_date = datetime.fromtimestamp(due_date_raw / 1000).strftime('%Y-%m-%d')
-                        except:
-                            formatted_date = "Unknown"
-                    else:
-                        formatted_date = str(due_date_raw).split("T")[0] if due_date_raw else "Unknown"
-                    
-                    ui.label(f'Due: {formatted_date}').classes('text-sm text-gray-700 mr-2')
-                    ui.badge(due_status).classes(f'bg-{due_color}-500 text-white text-xs')
-                else:
-                    ui.label('Due: Not specified').classes('text-sm text-gray-500')
+        with ui.column().classes('w-full gap-3'):
+            notes_textarea = ui.textarea(
+                label='',
+                placeholder='Add or edit project notes here...',
+                value=current_notes,
+            ).classes('w-full').props('outlined rows=4')
             
-            # Team members section
-            with ui.row().classes('w-full items-start mb-3'):
-                ui.icon('people').classes('text-gray-600 mr-1 mt-0.5')
-                with ui.column().classes('flex-grow'):
-                    ui.label('Team:').classes('text-sm font-semibold text-gray-700 mb-1')
-                    for i, member in enumerate(team_members[:3]):  # Show max 3 members
-                        ui.label(f'• {member}').classes('text-xs text-gray-600')
-                    if len(team_members) > 3:
-                        ui.label(f'• ... +{len(team_members) - 3} more').classes('text-xs text-gray-500')
-            
-            # PMBOK metrics row
-            with ui.row().classes('w-full items-center mb-2 text-xs'):
-                with ui.column().classes('flex-1'):
-                    ui.label(f'SPI: {schedule_perf.get("spi", "N/A")}').classes('text-gray-600')
-                    ui.label(f'Risk: {risk_analysis["level"]}').classes(f'text-{risk_analysis["color"]}-600')
-                
-                with ui.column().classes('flex-1 text-right'):
-                    client = project.get('Client_Name', 'N/A')[:20]
-                    ui.label(f'Client: {client}').classes('text-gray-600')
-                    priority = project.get('Priority_Level', 'N/A')
-                    ui.label(f'Priority: {priority}').classes('text-gray-600')
-            
-            # Actions
-            with ui.row().classes('w-full gap-2 mt-3'):
-                ui.button('📋 Details', 
-                         on_click=lambda p_id=project_id: ui.navigate.to(f'/project/{p_id}')
-                         ).classes('flex-1 bg-blue-600 text-white text-sm')
-                ui.button('📊 PMBOK', 
-                         on_click=lambda p_id=project_id: ui.navigate.to(f'/pmbok/{p_id}')
-                         ).classes('flex-1 bg-green-600 text-white text-sm')
-                ui.button('✏️', 
-                         on_click=lambda p_id=project_id: ui.navigate.to(f'/edit-status/{p_id}')
-                         ).classes('bg-orange-600 text-white text-sm px-2')
-    
-    # Initial load
-    update_dashboard()
+            ui.button('💾', on_click=partial(_save_project_notes, project_id, notes_textarea, source)).classes(_SAVE_NOTES_BUTTON_CLASSES)
+        
+        ui.label(footer).classes('text-xs text-gray-500 mt-2 italic')
+
+
+def _render_actions_card(project_id: str, source: str, card_classes: str, footer: str):
+    """Coordinator Actions card: the current action items as bullets, an editor and a save button"""
+    current_actions = pmbok_viewer.get_coordinator_actions(project_id)
+    
+    with ui.card().classes(card_classes):
+        ui.label('🎯 Coordinator Actions').classes(_CARD_TITLE_CLASSES)
+        
+        if current_actions:
+            ui.label('Current Action Items:').classes(_FIELD_LABEL_CLASSES)
+            # Display as bulleted list
+            formatted_actions = pmbok_viewer.format_actions_as_bullets(current_actions)
+            ui.label(formatted_actions).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-green-400 whitespace-pre-wrap')
+        
+        ui.label('Edit Action Items:').classes(_FIELD_LABEL_CLASSES)
+        
+        with ui.column().classes('w-full gap-3'):
+            actions_textarea = ui.textarea(
+                label='',
+                placeholder='Add action items here...\nOne item per line\nThey will be displayed as bullets',
+                value=current_actions,
+            ).classes('w-full').props('outlined rows=6')
+            
+            ui.button('💾', on_click=partial(_save_coordinator_actions, project_id, actions_textarea, source)).classes(_SAVE_ACTIONS_BUTTON_CLASSES)
+        
+        ui.label(footer).classes('text-xs text-gray-500 mt-2 italic')
 
 
 @ui.page('/project/{project_id}')
-def project_detail(project_id: str):
+async def project_detail(project_id: str):
     """Basic project details view (redirects to PMBOK analysis)"""
     
-    # Refresh data to ensure we have latest
-    pmbok_viewer.refresh_data()
+    # Refresh data to ensure we have latest (off the event loop; it may wait on a running refresh)
+    await run.io_bound(pmbok_viewer.refresh_if_stale)
     project = pmbok_viewer.get_project_by_id(project_id)
     
     if not project:
@@ -1895,7 +2527,7 @@ def project_detail(project_id: str):
         with ui.row().classes('w-full gap-6 mb-6'):
             # Left column - Project Info
             with ui.card().classes('flex-1 p-6'):
-                ui.label('📋 Project Information').classes('text-xl font-bold mb-4 text-blue-700')
+                ui.label('📋 Project Information').classes(_CARD_TITLE_CLASSES)
                 
                 info_items = [
                     ('Client Name', project.get('Client_Name', 'N/A')),
@@ -1915,13 +2547,13 @@ def project_detail(project_id: str):
             
             # Right column - Team & Resources
             with ui.card().classes('flex-1 p-6'):
-                ui.label('👥 Team & Resources').classes('text-xl font-bold mb-4 text-blue-700')
+                ui.label('👥 Team & Resources').classes(_CARD_TITLE_CLASSES)
                 
                 # Team members
-                ui.label('Team Members:').classes('font-semibold text-gray-700 mb-2')
+                ui.label('Team Members:').classes(_FIELD_LABEL_CLASSES)
                 ui.label('• Cole Folkers (Coordinator)').classes('text-gray-900 ml-4')
                 
-                team_members = project.get('Team_Members', [])
+                team_members = project.get('Team_Members')
                 if team_members:
                     for member in team_members:
                         name = member.get('Resource_Name', 'Unknown')
@@ -1948,112 +2580,24 @@ def project_detail(project_id: str):
                     ui.label(f'Geospatial Type: {geospatial_type}').classes('text-gray-900 mt-1')
         
         # Project Description
-        if project.get('Project_Description'):
-            with ui.card().classes('w-full p-6 mb-6'):
-                ui.label('📝 Project Description').classes('text-xl font-bold mb-4 text-blue-700')
-                ui.label(project.get('Project_Description', '')).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
-        
-        # Project Notes Section
-        with ui.card().classes('w-full p-6 mb-6'):
-            ui.label('📋 Project Notes').classes('text-xl font-bold mb-4 text-blue-700')
-            
-            current_notes = pmbok_viewer.get_project_notes(project_id)
-            
-            def save_notes_from_detail():
-                def on_notes_change(e):
-                    new_notes = e.value
-                    success = pmbok_viewer.update_project_notes(project_id, new_notes)
-                    if success:
-                        ui.notify(f'✅ Notes saved successfully', type='positive')
-                        print(f"✅ Notes saved for project {project_id} from detail page")
-                    else:
-                        ui.notify(f'❌ Failed to save notes', type='negative')
-                        print(f"❌ Failed to save notes for project {project_id}")
-                return on_notes_change
-            
-            if current_notes:
-                ui.label('Current Notes:').classes('font-semibold text-gray-700 mb-2')
-                ui.label(current_notes).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-blue-400 whitespace-pre-wrap')
-            
-            ui.label('Edit Notes:').classes('font-semibold text-gray-700 mb-2')
-            
-            with ui.column().classes('w-full gap-3'):
-                notes_textarea_detail = ui.textarea(
-                    label='',
-                    placeholder='Add or edit project notes here...',
-                    value=current_notes,
-                ).classes('w-full').props('outlined rows=4')
-                
-                def save_notes_click_detail():
-                    def on_save():
-                        new_notes = notes_textarea_detail.value
-                        success = pmbok_viewer.update_project_notes(project_id, new_notes)
-                        if success:
-                            ui.notify(f'✅ Notes saved successfully', type='positive')
-                            print(f"✅ Notes saved for project {project_id} from detail page")
-                        else:
-                            ui.notify(f'❌ Failed to save notes', type='negative')
-                            print(f"❌ Failed to save notes for project {project_id}")
-                    return on_save
-                
-                ui.button('💾', on_click=save_notes_click_detail()).classes('bg-blue-500 text-white px-4 py-2 self-start')
-            
-            ui.label('Notes will appear in the main project list after saving.').classes('text-xs text-gray-500 mt-2 italic')
-        
-        # Coordinator Actions Section
-        with ui.card().classes('w-full p-6 mb-6'):
-            ui.label('🎯 Coordinator Actions').classes('text-xl font-bold mb-4 text-blue-700')
-            
-            current_actions = pmbok_viewer.get_coordinator_actions(project_id)
-            
-            def save_actions_from_detail():
-                def on_actions_change(e):
-                    new_actions = e.value
-                    success = pmbok_viewer.update_coordinator_actions(project_id, new_actions)
-                    if success:
-                        ui.notify(f'✅ Coordinator actions saved successfully', type='positive')
-                        print(f"✅ Coordinator actions saved for project {project_id} from detail page")
-                    else:
-                        ui.notify(f'❌ Failed to save coordinator actions', type='negative')
-                        print(f"❌ Failed to save coordinator actions for project {project_id}")
-                return on_actions_change
-            
-            if current_actions:
-                ui.label('Current Action Items:').classes('font-semibold text-gray-700 mb-2')
-                # Display as bulleted list
-                formatted_actions = pmbok_viewer.format_actions_as_bullets(current_actions)
-                ui.label(formatted_actions).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-green-400 whitespace-pre-wrap')
-            
-            ui.label('Edit Action Items:').classes('font-semibold text-gray-700 mb-2')
-            
-            with ui.column().classes('w-full gap-3'):
-                actions_textarea_detail = ui.textarea(
-                    label='',
-                    placeholder='Add action items here...\nOne item per line\nThey will be displayed as bullets',
-                    value=current_actions,
-                ).classes('w-full').props('outlined rows=6')
-                
-                def save_actions_click_detail():
-                    def on_save():
-                        new_actions = actions_textarea_detail.value
-                        success = pmbok_viewer.update_coordinator_actions(project_id, new_actions)
-                        if success:
-                            ui.notify(f'✅ Coordinator actions saved successfully', type='positive')
-                            print(f"✅ Coordinator actions saved for project {project_id} from detail page")
-                        else:
-                            ui.notify(f'❌ Failed to save coordinator actions', type='negative')
-                            print(f"❌ Failed to save coordinator actions for project {project_id}")
-                    return on_save
-                
-                ui.button('💾', on_click=save_actions_click_detail()).classes('bg-green-500 text-white px-4 py-2 self-start')
-            
-            ui.label('Action items will appear as bullets in the main project list after saving.').classes('text-xs text-gray-500 mt-2 italic')
+        description = project.get('Project_Description')
+        if description:
+            with ui.card().classes(_SECTION_CARD_CLASSES):
+                ui.label('📝 Project Description').classes(_CARD_TITLE_CLASSES)
+                ui.label(description).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
+        
+        # Project Notes and Coordinator Actions
+        _render_notes_card(project_id, 'detail page', _SECTION_CARD_CLASSES,
+                           'Notes will appear in the main project list after saving.')
+        _render_actions_card(project_id, 'detail page', _SECTION_CARD_CLASSES,
+                             'Action items will appear as bullets in the main project list after saving.')
         
         # Final Deliverables
-        if project.get('Final_Deliverables'):
-            with ui.card().classes('w-full p-6 mb-6'):
-                ui.label('🎯 Final Deliverables').classes('text-xl font-bold mb-4 text-blue-700')
-                ui.label(project.get('Final_Deliverables', '')).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
+        deliverables = project.get('Final_Deliverables')
+        if deliverables:
+            with ui.card().classes(_SECTION_CARD_CLASSES):
+                ui.label('🎯 Final Deliverables').classes(_CARD_TITLE_CLASSES)
+                ui.label(deliverables).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
         
         # Call-to-action for PMBOK analysis
         with ui.card().classes('w-full p-6 bg-green-50 border-l-4 border-green-500'):
@@ -2067,10 +2611,10 @@ def project_detail(project_id: str):
 
 
 @ui.page('/pmbok/{project_id}')
-def pmbok_project_view(project_id: str):
+async def pmbok_project_view(project_id: str):
     """PMBOK-focused project analysis view"""
     
-    pmbok_viewer.refresh_data()
+    await run.io_bound(pmbok_viewer.refresh_if_stale)
     project = pmbok_viewer.get_project_by_id(project_id)
     
     if not project:
@@ -2080,12 +2624,30 @@ def pmbok_project_view(project_id: str):
         return
     
     # PMBOK Analysis
-    phase = pmbok_viewer.get_project_phase(project)
+    analysis = pmbok_viewer.get_project_analysis(project)
+    phase = analysis['phase']
     phase_name = pmbok_viewer.process_groups.get(phase, phase)
-    schedule_perf = pmbok_viewer.calculate_schedule_performance(project)
-    risk_analysis = pmbok_viewer.get_risk_level(project)
+    schedule_perf = analysis['schedule_perf']
+    risk_analysis = analysis['risk']
+    schedule_rows, risk_rows = pmbok_viewer.get_analysis_rows(project)
     stakeholders = pmbok_viewer.get_stakeholder_analysis(project)
     
+    # Project fields the page shows, read once so the layout below only looks them up here
+    team_members = project.get('Team_Members') or ()
+    ctx = {
+        'name': project.get('Project_Name', 'N/A'),
+        'number': project.get('Project_Number', 'N/A'),
+        'priority': project.get('Priority_Level', 'N/A'),
+        'team_members': team_members,
+        'team_size_risk': 'Single Person' if not team_members else 'Multi-person',
+        'project_hours': project.get('Project_Hours'),
+        'description': project.get('Project_Description', ''),
+        'deliverables': project.get('Final_Deliverables', ''),
+        'geospatial_type': project.get('Geospatial_Type', ''),
+        'client_email': project.get('Client_Email', ''),
+        'ministry': project.get('Ministry', ''),
+    }
+    
     # Header
     with ui.row().classes('w-full max-w-6xl mx-auto p-4 items-center'):
         ui.button('← Back to Portfolio', on_click=lambda: ui.navigate.to('/')).classes('bg-blue-500 text-white mr-4')
@@ -2095,10 +2657,9 @@ def pmbok_project_view(project_id: str):
         
         # Project Overview
         with ui.card().classes('w-full p-6 mb-6 border-l-4 border-blue-500'):
-            ui.label(project.get('Project_Name', 'N/A')).classes('text-2xl font-bold text-blue-700 mb-2')
+            ui.label(ctx['name']).classes('text-2xl font-bold text-blue-700 mb-2')
             # Show Project Number
-            project_number = project.get('Project_Number', 'N/A')
-            ui.label(f'Project Number: {project_number}').classes('text-lg text-gray-600 mb-4')
+            ui.label(f"Project Number: {ctx['number']}").classes('text-lg text-gray-600 mb-4')
             
             with ui.row().classes('w-full gap-4'):
                 ui.badge(f'Process Group: {phase_name}').classes('bg-blue-500 text-white px-4 py-2')
@@ -2110,211 +2671,116 @@ def pmbok_project_view(project_id: str):
             
             # Schedule Management
             with ui.card().classes('flex-1 p-6'):
-                ui.label('📅 Schedule Management').classes('text-xl font-bold mb-4 text-blue-700')
-                
-                schedule_items = [
-                    ('Schedule Performance Index (SPI)', schedule_perf['spi']),
-                    ('Schedule Status', schedule_perf['status']),
-                    ('Variance (Days)', schedule_perf['variance_days']),
-                    ('Total Duration (Days)', schedule_perf.get('total_duration', 'N/A')),
-                    ('Elapsed Duration (Days)', schedule_perf.get('elapsed_duration', 'N/A')),
-                    ('Remaining Duration (Days)', schedule_perf.get('remaining_duration', 'N/A')),
-                ]
+                ui.label('📅 Schedule Management').classes(_CARD_TITLE_CLASSES)
                 
-                for label, value in schedule_items:
+                for label, value in schedule_rows:
                     with ui.row().classes('mb-2'):
                         ui.label(f'{label}:').classes('font-semibold text-gray-700 w-48')
-                        ui.label(str(value)).classes('text-gray-900')
+                        ui.label(value).classes('text-gray-900')
             
             # Risk Management
             with ui.card().classes('flex-1 p-6'):
-                ui.label('⚠️ Risk Management').classes('text-xl font-bold mb-4 text-blue-700')
+                ui.label('⚠️ Risk Management').classes(_CARD_TITLE_CLASSES)
                 
-                risk_items = [
-                    ('Overall Risk Level', risk_analysis['level']),
-                    ('Risk Score', f"{risk_analysis['score']}/10"),
-                    ('Schedule Risk', schedule_perf['health'].title()),
-                    ('Priority Level', project.get('Priority_Level', 'N/A')),
-                    ('Team Size Risk', 'Single Person' if len(project.get('Team_Members', [])) == 0 else 'Multi-person'),
-                ]
+                project_risk_rows = (
+                    ('Priority Level', ctx['priority']),
+                    ('Team Size Risk', ctx['team_size_risk']),
+                )
                 
-                for label, value in risk_items:
+                for label, value in itertools.chain(risk_rows, project_risk_rows):
                     with ui.row().classes('mb-2'):
                         ui.label(f'{label}:').classes('font-semibold text-gray-700 w-32')
                         ui.label(str(value)).classes('text-gray-900')
         
-        # Resource & Stakeholder Management
-        with ui.row().classes('w-full gap-6 mb-6'):
+        # Secondary knowledge areas start collapsed; each one's widgets are built the first time it is opened
+        def build_resources_and_stakeholders():
+            with ui.row().classes('w-full gap-6'):
             
-            # Resource Management
-            with ui.card().classes('flex-1 p-6'):
-                ui.label('👥 Resource Management').classes('text-xl font-bold mb-4 text-blue-700')
+                # Resource Management
+                with ui.card().classes('flex-1 p-6'):
+                    ui.label('👥 Resource Management').classes(_CARD_TITLE_CLASSES)
                 
-                ui.label('Project Team:').classes('font-semibold text-gray-700 mb-2')
-                ui.label('• Cole Folkers (Coordinator)').classes('text-gray-900 ml-4')
+                    ui.label('Project Team:').classes(_FIELD_LABEL_CLASSES)
+                    ui.label('• Cole Folkers (Coordinator)').classes('text-gray-900 ml-4')
                 
-                for member in project.get('Team_Members', []):
-                    name = member.get('Resource_Name', 'Unknown')
-                    team = member.get('Resource_Team', '')
-                    ui.label(f'• {name} (Team Member)').classes('text-gray-900 ml-4')
-                    if team:
-                        ui.label(f'  Team: {team}').classes('text-gray-600 ml-8 text-sm')
+                    for member in ctx['team_members']:
+                        name = member.get('Resource_Name', 'Unknown')
+                        team = member.get('Resource_Team', '')
+                        ui.label(f'• {name} (Team Member)').classes('text-gray-900 ml-4')
+                        if team:
+                            ui.label(f'  Team: {team}').classes('text-gray-600 ml-8 text-sm')
                 
-                # Project Hours if available
-                if project.get('Project_Hours'):
-                    ui.label(f'Allocated Hours: {project.get("Project_Hours")}').classes('text-gray-900 mt-4 font-medium')
+                    # Project Hours if available
+                    if ctx['project_hours']:
+                        ui.label(f"Allocated Hours: {ctx['project_hours']}").classes('text-gray-900 mt-4 font-medium')
             
-            # Stakeholder Management
-            with ui.card().classes('flex-1 p-6'):
-                ui.label('🤝 Stakeholder Management').classes('text-xl font-bold mb-4 text-blue-700')
+                # Stakeholder Management
+                with ui.card().classes('flex-1 p-6'):
+                    ui.label('🤝 Stakeholder Management').classes(_CARD_TITLE_CLASSES)
                 
-                ui.label('Primary Stakeholders:').classes('font-semibold text-gray-700 mb-2')
-                for stakeholder in stakeholders['primary']:
-                    ui.label(f'• {stakeholder["name"]} ({stakeholder["role"]})').classes('text-gray-900 ml-4 text-sm')
-                    ui.label(f'  Influence: {stakeholder["influence"]}, Interest: {stakeholder["interest"]}').classes('text-gray-600 ml-6 text-xs')
-        
-        # Quality & Communications Management
-        with ui.card().classes('w-full p-6 mb-6'):
-            ui.label('📋 Quality & Communications Management').classes('text-xl font-bold mb-4 text-blue-700')
-            
-            with ui.row().classes('w-full gap-8'):
-                with ui.column().classes('flex-1'):
-                    ui.label('Quality Criteria:').classes('font-semibold text-gray-700 mb-2')
-                    if project.get('Final_Deliverables'):
-                        ui.label('Defined deliverables and acceptance criteria').classes('text-green-600 ml-4')
-                    else:
-                        ui.label('No formal deliverables defined').classes('text-red-600 ml-4')
+                    ui.label('Primary Stakeholders:').classes(_FIELD_LABEL_CLASSES)
+                    # One markdown element for the whole list instead of two labels per stakeholder
+                    ui.markdown('\n'.join(
+                        f'- {escape(str(stakeholder["name"]))} ({escape(stakeholder["role"])})  \n'
+                        f'  <small>Influence: {stakeholder["influence"]}, Interest: {stakeholder["interest"]}</small>'
+                        for stakeholder in stakeholders['primary']
+                    )).classes('text-gray-900 ml-4 text-sm')
+
+        _lazy_expansion('👥 Resource & Stakeholder Management', build_resources_and_stakeholders).classes('w-full mb-6')
+        
+        def build_quality_and_communications():
+            with ui.card().classes('w-full p-6'):
+                with ui.row().classes('w-full gap-8'):
+                    with ui.column().classes('flex-1'):
+                        ui.label('Quality Criteria:').classes(_FIELD_LABEL_CLASSES)
+                        if ctx['deliverables']:
+                            ui.label('Defined deliverables and acceptance criteria').classes('text-green-600 ml-4')
+                        else:
+                            ui.label('No formal deliverables defined').classes('text-red-600 ml-4')
                     
-                    geospatial_type = project.get('Geospatial_Type', '')
-                    if geospatial_type:
-                        ui.label(f'Technical Requirements: {geospatial_type}').classes('text-gray-900 ml-4')
+                        if ctx['geospatial_type']:
+                            ui.label(f"Technical Requirements: {ctx['geospatial_type']}").classes('text-gray-900 ml-4')
                 
-                with ui.column().classes('flex-1'):
-                    ui.label('Communications Plan:').classes('font-semibold text-gray-700 mb-2')
-                    client_email = project.get('Client_Email', '')
-                    if client_email:
-                        ui.label(f'Primary Contact: {client_email}').classes('text-gray-900 ml-4')
+                    with ui.column().classes('flex-1'):
+                        ui.label('Communications Plan:').classes(_FIELD_LABEL_CLASSES)
+                        if ctx['client_email']:
+                            ui.label(f"Primary Contact: {ctx['client_email']}").classes('text-gray-900 ml-4')
                     
-                    ministry = project.get('Ministry', '')
-                    if ministry:
-                        ui.label(f'Organizational Unit: {ministry}').classes('text-gray-900 ml-4')
+                        if ctx['ministry']:
+                            ui.label(f"Organizational Unit: {ctx['ministry']}").classes('text-gray-900 ml-4')
+
+        _lazy_expansion('📋 Quality & Communications Management', build_quality_and_communications).classes('w-full mb-6')
         
-        # Scope & Integration Management
-        if project.get('Project_Description') or project.get('Final_Deliverables'):
-            with ui.card().classes('w-full p-6'):
-                ui.label('🎯 Scope & Integration Management').classes('text-xl font-bold mb-4 text-blue-700')
-                
-                if project.get('Project_Description'):
-                    ui.label('Project Scope:').classes('font-semibold text-gray-700 mb-2')
-                    ui.label(project.get('Project_Description', '')).classes('text-gray-800 whitespace-pre-wrap leading-relaxed mb-4')
-                
-                if project.get('Final_Deliverables'):
-                    ui.label('Deliverables & Work Breakdown:').classes('font-semibold text-gray-700 mb-2')
-                    ui.label(project.get('Final_Deliverables', '')).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
-        
-        # Project Notes Section (from main dashboard)
-        with ui.card().classes('w-full p-6 mt-6'):
-            ui.label('📋 Project Notes').classes('text-xl font-bold mb-4 text-blue-700')
-            
-            current_notes = pmbok_viewer.get_project_notes(project_id)
-            
-            def save_notes_from_pmbok():
-                def on_notes_change(e):
-                    new_notes = e.value
-                    success = pmbok_viewer.update_project_notes(project_id, new_notes)
-                    if success:
-                        ui.notify(f'✅ Notes saved successfully', type='positive')
-                        print(f"✅ Notes saved for project {project_id} from PMBOK page")
-                    else:
-                        ui.notify(f'❌ Failed to save notes', type='negative')
-                        print(f"❌ Failed to save notes for project {project_id}")
-                return on_notes_change
-            
-            if current_notes:
-                ui.label('Current Notes:').classes('font-semibold text-gray-700 mb-2')
-                ui.label(current_notes).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-blue-400 whitespace-pre-wrap')
-            
-            ui.label('Edit Notes:').classes('font-semibold text-gray-700 mb-2')
-            
-            with ui.column().classes('w-full gap-3'):
-                notes_textarea_pmbok = ui.textarea(
-                    label='',
-                    placeholder='Add or edit project notes here...',
-                    value=current_notes,
-                ).classes('w-full').props('outlined rows=4')
+        if ctx['description'] or ctx['deliverables']:
+            def build_scope_and_integration():
+                with ui.card().classes('w-full p-6'):
+                    if ctx['description']:
+                        ui.label('Project Scope:').classes(_FIELD_LABEL_CLASSES)
+                        ui.label(ctx['description']).classes('text-gray-800 whitespace-pre-wrap leading-relaxed mb-4')
                 
-                def save_notes_click_pmbok():
-                    def on_save():
-                        new_notes = notes_textarea_pmbok.value
-                        success = pmbok_viewer.update_project_notes(project_id, new_notes)
-                        if success:
-                            ui.notify(f'✅ Notes saved successfully', type='positive')
-                            print(f"✅ Notes saved for project {project_id} from PMBOK page")
-                        else:
-                            ui.notify(f'❌ Failed to save notes', type='negative')
-                            print(f"❌ Failed to save notes for project {project_id}")
-                    return on_save
-
-                ui.button('💾', on_click=save_notes_click_pmbok()).classes('bg-blue-500 text-white px-4 py-2 self-start')
+                    if ctx['deliverables']:
+                        ui.label('Deliverables & Work Breakdown:').classes(_FIELD_LABEL_CLASSES)
+                        ui.label(ctx['deliverables']).classes('text-gray-800 whitespace-pre-wrap leading-relaxed')
 
-            ui.label('Notes are synchronized with the main project list and detail pages.').classes('text-xs text-gray-500 mt-2 italic')
+            _lazy_expansion('🎯 Scope & Integration Management', build_scope_and_integration).classes('w-full mb-6')
         
-        # Coordinator Actions Section (from main dashboard)
-        with ui.card().classes('w-full p-6 mt-6'):
-            ui.label('🎯 Coordinator Actions').classes('text-xl font-bold mb-4 text-blue-700')
-            
-            current_actions = pmbok_viewer.get_coordinator_actions(project_id)
-            
-            def save_actions_from_pmbok():
-                def on_actions_change(e):
-                    new_actions = e.value
-                    success = pmbok_viewer.update_coordinator_actions(project_id, new_actions)
-                    if success:
-                        ui.notify(f'✅ Coordinator actions saved successfully', type='positive')
-                        print(f"✅ Coordinator actions saved for project {project_id} from PMBOK page")
-                    else:
-                        ui.notify(f'❌ Failed to save coordinator actions', type='negative')
-                        print(f"❌ Failed to save coordinator actions for project {project_id}")
-                return on_actions_change
-            
-            if current_actions:
-                ui.label('Current Action Items:').classes('font-semibold text-gray-700 mb-2')
-                # Display as bulleted list
-                formatted_actions = pmbok_viewer.format_actions_as_bullets(current_actions)
-                ui.label(formatted_actions).classes('text-gray-800 mb-4 p-3 bg-gray-50 rounded border-l-4 border-green-400 whitespace-pre-wrap')
-            
-            ui.label('Edit Action Items:').classes('font-semibold text-gray-700 mb-2')
-            
-            with ui.column().classes('w-full gap-3'):
-                actions_textarea_pmbok = ui.textarea(
-                    label='',
-                    placeholder='Add action items here...\nOne item per line\nThey will be displayed as bullets',
-                    value=current_actions,
-                ).classes('w-full').props('outlined rows=6')
-                
-                def save_actions_click_pmbok():
-                    def on_save():
-                        new_actions = actions_textarea_pmbok.value
-                        success = pmbok_viewer.update_coordinator_actions(project_id, new_actions)
-                        if success:
-                            ui.notify(f'✅ Coordinator actions saved successfully', type='positive')
-                            print(f"✅ Coordinator actions saved for project {project_id} from PMBOK page")
-                        else:
-                            ui.notify(f'❌ Failed to save coordinator actions', type='negative')
-                            print(f"❌ Failed to save coordinator actions for project {project_id}")
-                    return on_save
-                
-                ui.button('💾', on_click=save_actions_click_pmbok()).classes('bg-green-500 text-white px-4 py-2 self-start')
-            
-            ui.label('Action items are synchronized with the main project list and all detail pages.').classes('text-xs text-gray-500 mt-2 italic')
+        # Project Notes and Coordinator Actions are edited on the project detail page only
+        with ui.card().classes('w-full p-6 mt-6 bg-blue-50 border-l-4 border-blue-500'):
+            with ui.row().classes('w-full items-center justify-between'):
+                with ui.column():
+                    ui.label('📋 Notes & Coordinator Actions').classes('text-lg font-bold text-blue-700')
+                    ui.label('Project notes and action items are kept on the project details page.').classes('text-blue-600')
+                ui.button('✏️ Edit Notes & Actions →',
+                         on_click=lambda: ui.navigate.to(f'/project/{project_id}')
+                         ).classes('bg-blue-600 text-white px-6 py-3')
 
 
 @ui.page('/pmbok-report')
-def pmbok_portfolio_report():
+async def pmbok_portfolio_report():
     """Portfolio-level PMBOK report"""
     
-    pmbok_viewer.refresh_data()
-    metrics = pmbok_viewer.get_project_metrics()
+    await run.io_bound(pmbok_viewer.refresh_if_stale)
+    metrics = await run.io_bound(pmbok_viewer.get_project_metrics)
     
     with ui.row().classes('w-full max-w-6xl mx-auto p-4 items-center'):
         ui.button('← Back to Portfolio', on_click=lambda: ui.navigate.to('/')).classes('bg-blue-500 text-white mr-4')
@@ -2323,7 +2789,7 @@ def pmbok_portfolio_report():
     with ui.column().classes('w-full max-w-6xl mx-auto p-4'):
         
         # Executive Summary
-        with ui.card().classes('w-full p-6 mb-6'):
+        with ui.card().classes(_SECTION_CARD_CLASSES):
             ui.label('📈 Executive Summary').classes('text-2xl font-bold mb-4 text-blue-700')
             
             total = metrics.get('total_projects', 0)
@@ -2338,14 +2804,18 @@ def pmbok_portfolio_report():
             ui.label(f'Total Active Projects: {total}').classes('text-lg text-gray-700 mt-2')
             ui.label(f'Risk Distribution: {metrics.get("risk_distribution", {})}').classes('text-lg text-gray-700')
         
+        # Share of the portfolio per project, and the group names, for the breakdowns below
+        pct_per_project = 100 / total if total > 0 else 0
+        process_groups = pmbok_viewer.process_groups
+        
         # Process Groups Analysis
-        with ui.card().classes('w-full p-6 mb-6'):
+        with ui.card().classes(_SECTION_CARD_CLASSES):
             ui.label('🔄 PMBOK Process Groups Analysis').classes('text-2xl font-bold mb-4 text-blue-700')
             
             process_dist = metrics.get('process_distribution', {})
             for process_key, count in process_dist.items():
-                process_name = pmbok_viewer.process_groups.get(process_key, process_key)
-                percentage = (count / total * 100) if total > 0 else 0
+                process_name = process_groups.get(process_key, process_key)
+                percentage = count * pct_per_project
                 ui.label(f'{process_name}: {count} projects ({percentage:.1f}%)').classes('text-lg text-gray-700 mb-2')
         
         # Risk Analysis
@@ -2354,13 +2824,13 @@ def pmbok_portfolio_report():
             
             risk_dist = metrics.get('risk_distribution', {})
             for risk_level, count in risk_dist.items():
-                percentage = (count / total * 100) if total > 0 else 0
+                percentage = count * pct_per_project
                 color = 'red' if risk_level == 'High' else 'yellow' if risk_level == 'Medium' else 'green'
                 ui.label(f'{risk_level} Risk: {count} projects ({percentage:.1f}%)').classes(f'text-lg text-{color}-600 mb-2 font-medium')
 
 
 @ui.page('/note/{note_name}')
-def view_note(note_name: str):
+async def view_note(note_name: str):
     """View individual Dendron note content"""
     ui.page_title(f"Note: {note_name}")
     
@@ -2386,7 +2856,12 @@ def view_note(note_name: str):
         ui.button('← Back to GSS Support', on_click=lambda: ui.navigate.to('/dendron-integration')).classes('bg-blue-500 text-white')
         ui.button('Portfolio Overview', on_click=lambda: ui.navigate.to('/')).classes('bg-gray-500 text-white')
     
-    if not os.path.exists(note_file):
+    try:
+        st = os.stat(note_file)
+    except FileNotFoundError:
+        st = None
+    
+    if st is None:
         with ui.card().classes('w-full p-6 border-l-4 border-yellow-500'):
             ui.label('📝 Note Not Found').classes('text-2xl font-bold mb-4 text-yellow-700')
             ui.label(f'The note "{note_name}" does not exist yet.').classes('text-lg text-yellow-600')
@@ -2412,63 +2887,73 @@ def view_note(note_name: str):
     # Display note content
     with ui.card().classes('w-full p-6'):
         try:
-            with open(note_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Remove YAML frontmatter if present
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    content = parts[2].strip()
-            
-            # Convert internal Dendron links to clickable links
-            import re
-            def convert_dendron_links(text):
-                # Pattern for [[note.name|Display Name]] or [[note.name]]
-                pattern = r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]'
-                
-                def replace_link(match):
-                    note_ref = match.group(1)
-                    display_text = match.group(2) if match.group(2) else note_ref
-                    
-                    # If no explicit display text, show only the part after the last dot
-                    if not match.group(2) and '.' in display_text:
-                        display_text = display_text.split('.')[-1]
-                    
-                    # Convert to our note view URL
-                    if note_ref.startswith('WLRS.LUP.CRP.caribou-portal'):
-                        note_url = f"/note/{note_ref}"
-                        return f'[{display_text}]({note_url})'
-                    else:
-                        return f'**{display_text}**'  # Non-caribou notes as bold text
-                
-                return re.sub(pattern, replace_link, text)
+            # The stat above serves both the cache key and the file info below; the read runs off the event loop
+            processed_content = await run.io_bound(_render_note_markdown, note_file, st.st_mtime_ns, st.st_size)
             
-            processed_content = convert_dendron_links(content)
-            
-            # Display content as markdown
-            ui.markdown(processed_content).classes('prose max-w-none')
+            # Display content as markdown; "## " sections are only sent once opened
+            sections = _split_note_sections(processed_content)
+            if len(sections) == 1:
+                _note_markdown(processed_content)
+            else:
+                preamble = sections[0].strip()
+                if preamble:
+                    _note_markdown(preamble)
+                for i, section in enumerate(sections[1:]):
+                    heading, _, body = section.partition('\n')
+                    expansion = _lazy_expansion(
+                        heading[3:].strip(),
+                        lambda body=body: _note_markdown(body),
+                    ).classes('w-full')
+                    if i == 0 and not preamble:
+                        expansion.value = True
             
             # Show file info
-            try:
-                mtime = os.path.getmtime(note_file)
-                size = os.path.getsize(note_file)
-                from datetime import datetime
-                last_modified = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-                size_kb = size / 1024
-                
-                with ui.row().classes('gap-4 mt-6 pt-4 border-t'):
-                    ui.label(f'Last modified: {last_modified}').classes('text-sm text-gray-500')
-                    ui.label(f'Size: {size_kb:.1f} KB').classes('text-sm text-gray-500')
-            except:
-                pass
+            last_modified = datetime.fromtimestamp(st.st_mtime).isoformat(sep=' ', timespec='seconds')
+            size_kb = st.st_size / 1024
+            
+            with ui.row().classes('gap-4 mt-6 pt-4 border-t'):
+                ui.label(f'Last modified: {last_modified}').classes('text-sm text-gray-500')
+                ui.label(f'Size: {size_kb:.1f} KB').classes('text-sm text-gray-500')
                 
         except Exception as e:
             ui.label(f'Error reading note: {str(e)}').classes('text-red-600')
 
 
+async def _write_main_note(vault_path: str, done_message: str, fail_message: str):
+    """(Re)write the main Caribou Portal note and reload the page to show it"""
+    # The note embeds portfolio metrics, which may wait on a running refresh
+    note_path = await run.io_bound(pmbok_viewer.create_main_caribou_portal_note, vault_path)
+    if note_path:
+        ui.notify(done_message, type='positive')
+        ui.navigate.reload()  # Reload page to update display
+    else:
+        ui.notify(fail_message, type='negative')
+
+
+def _create_selected_project_note(selected_project, vault_path: str):
+    """Create the note for the project picked in the selector (notify only; the page does not list project notes)"""
+    if selected_project.value:
+        note_path = pmbok_viewer.create_dendron_project_note(selected_project.value, vault_path)
+        if note_path:
+            filename = os.path.basename(note_path)
+            ui.notify(f'✅ Created: {filename}', type='positive')
+        else:
+            ui.notify('❌ Failed to create note', type='negative')
+    else:
+        ui.notify('Please select a project first', type='warning')
+
+
+def _create_quick_note(project_id: str, project_number: str, vault_path: str):
+    """Create the note for one project from its quick-create button (notify only; the page does not list project notes)"""
+    note_path = pmbok_viewer.create_dendron_project_note(project_id, vault_path)
+    if note_path:
+        ui.notify(f'✅ Created note for {project_number}', type='positive')
+    else:
+        ui.notify(f'❌ Failed to create note for {project_number}', type='negative')
+
+
 @ui.page('/dendron-integration')
-def dendron_integration():
+async def dendron_integration():
     """GSS Caribou Support Information - Knowledge management system"""
     ui.page_title("GSS Caribou Support Information")
     
@@ -2504,121 +2989,50 @@ def dendron_integration():
     
     # Display main Caribou Portal note content
     main_note_path = os.path.join(dendron_status['vault_path'], 'notes', 'WLRS.LUP.CRP.caribou-portal.md')
-    main_note_exists = os.path.exists(main_note_path)
+    try:
+        main_note_stat = os.stat(main_note_path)
+    except FileNotFoundError:
+        main_note_stat = None
+    main_note_exists = main_note_stat is not None
     
     if main_note_exists:
-        with ui.card().classes('w-full p-6 mb-6'):
+        with ui.card().classes(_SECTION_CARD_CLASSES):
             ui.label('🏠 Main Caribou Portal Documentation').classes('text-2xl font-bold mb-4 text-blue-700')
             
             try:
-                # Read and display note content
-                with open(main_note_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Remove YAML frontmatter if present
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        content = parts[2].strip()
-                
-                # Convert internal Dendron links to clickable links
-                import re
-                def convert_dendron_links(text):
-                    # Pattern for [[note.name|Display Name]] or [[note.name]]
-                    pattern = r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]'
-                    
-                    def replace_link(match):
-                        note_ref = match.group(1)
-                        display_text = match.group(2) if match.group(2) else note_ref
-                        
-                        # If no explicit display text, show only the part after the last dot
-                        if not match.group(2) and '.' in display_text:
-                            display_text = display_text.split('.')[-1]
-                        
-                        # Convert to our note view URL
-                        if note_ref.startswith('WLRS.LUP.CRP.caribou-portal'):
-                            note_url = f"/note/{note_ref}"
-                            return f'[{display_text}]({note_url})'
-                        else:
-                            return f'**{display_text}**'  # Non-caribou notes as bold text
-                    
-                    return re.sub(pattern, replace_link, text)
-                
-                processed_content = convert_dendron_links(content)
+                # Read the note, drop frontmatter and convert Dendron links (cached until the file changes) off the event loop
+                processed_content = await run.io_bound(
+                    _render_note_markdown, main_note_path, main_note_stat.st_mtime_ns, main_note_stat.st_size
+                )
                 
                 # Display content as markdown
-                ui.markdown(processed_content).classes('prose max-w-none')
+                _note_markdown(processed_content)
                 
                 # Show last modified
-                try:
-                    mtime = os.path.getmtime(main_note_path)
-                    from datetime import datetime
-                    last_modified = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    ui.label(f'Last modified: {last_modified}').classes('text-sm text-gray-500 mt-4')
-                except:
-                    pass
+                last_modified = datetime.fromtimestamp(main_note_stat.st_mtime).isoformat(sep=' ', timespec='seconds')
+                ui.label(f'Last modified: {last_modified}').classes('text-sm text-gray-500 mt-4')
                     
             except Exception as e:
                 ui.label(f'Error reading main note: {str(e)}').classes('text-red-600')
                 
         # Update button for main note
         with ui.row().classes('w-full justify-center mb-6'):
-            def update_main_note():
-                note_path = pmbok_viewer.create_main_caribou_portal_note(dendron_status['vault_path'])
-                if note_path:
-                    ui.notify('✅ Updated main Caribou Portal note', type='positive')
-                    ui.navigate.reload()
-                else:
-                    ui.notify('❌ Failed to update main note', type='negative')
-            
-            ui.button('🔄 Update Main Note', on_click=update_main_note).classes('bg-blue-500 text-white')
+            ui.button('🔄 Update Main Note', on_click=partial(
+                _write_main_note, dendron_status['vault_path'],
+                '✅ Updated main Caribou Portal note', '❌ Failed to update main note',
+            )).classes('bg-blue-500 text-white')
     
     else:
         # Main note doesn't exist - show creation option
-        with ui.card().classes('w-full p-6 mb-6'):
+        with ui.card().classes(_SECTION_CARD_CLASSES):
             ui.label('🏠 Main Caribou Portal Note').classes('text-2xl font-bold mb-4 text-blue-700')
             ui.label('📝 Main note not found').classes('text-lg text-yellow-600 font-semibold mb-2')
             ui.label('Create the main WLRS.LUP.CRP.caribou-portal note to start organizing your project notes').classes('text-sm text-gray-600 mb-3')
             
-            def create_main_note():
-                note_path = pmbok_viewer.create_main_caribou_portal_note(dendron_status['vault_path'])
-                if note_path:
-                    ui.notify('✅ Created main Caribou Portal note', type='positive')
-                    ui.navigate.reload()  # Reload page to update display
-                else:
-                    ui.notify('❌ Failed to create main note', type='negative')
-            
-            ui.button('Create Main Note', on_click=create_main_note).classes('bg-green-500 text-white')
-    
-    # Search for existing WLRS.LUP.CRP.caribou-portal notes
-    notes_path = os.path.join(dendron_status['vault_path'], 'notes')
-    caribou_notes = []
-    
-    try:
-        pattern = os.path.join(notes_path, 'WLRS.LUP.CRP.caribou-portal*.md')
-        caribou_files = glob.glob(pattern)
-        
-        for file_path in caribou_files:
-            try:
-                filename = os.path.basename(file_path)
-                note_name = filename.replace('.md', '')
-                mtime = os.path.getmtime(file_path)
-                from datetime import datetime
-                last_modified = datetime.fromtimestamp(mtime)
-                
-                caribou_notes.append({
-                    'name': note_name,
-                    'path': file_path,
-                    'filename': filename,
-                    'modified': last_modified
-                })
-            except:
-                continue
-        
-        # Sort by modification time (newest first)
-        caribou_notes.sort(key=lambda x: x['modified'], reverse=True)
-    except Exception as e:
-        ui.notify(f'Error scanning notes: {str(e)}', type='warning')
+            ui.button('Create Main Note', on_click=partial(
+                _write_main_note, dendron_status['vault_path'],
+                '✅ Created main Caribou Portal note', '❌ Failed to create main note',
+            )).classes('bg-green-500 text-white')
     
     # Project note creation tools
     with ui.card().classes('w-full p-6'):
@@ -2626,8 +3040,10 @@ def dendron_integration():
         ui.label('Create individual project notes following the WLRS.LUP.CRP.caribou-portal.PROJECT_ID pattern').classes('text-sm text-gray-600 mb-4')
         
         # Project selector
-        project_options = {p.get('Project_ID', 'N/A'): f"{p.get('Project_ID', 'N/A')}: {p.get('Project_Name', 'Unnamed Project')}" 
-                         for p in pmbok_viewer.projects}
+        project_options = {}
+        for p in pmbok_viewer.projects:
+            pid = p.get('Project_ID', 'N/A')
+            project_options[pid] = f"{pid}: {p.get('Project_Name', 'Unnamed Project')}"
         
         with ui.row().classes('w-full items-center gap-4'):
             selected_project = ui.select(
@@ -2636,22 +3052,12 @@ def dendron_integration():
                 value=None
             ).classes('flex-grow')
             
-            def create_project_note():
-                if selected_project.value:
-                    note_path = pmbok_viewer.create_dendron_project_note(selected_project.value, dendron_status['vault_path'])
-                    if note_path:
-                        filename = os.path.basename(note_path)
-                        ui.notify(f'✅ Created: {filename}', type='positive')
-                        ui.navigate.reload()  # Reload to show new note
-                    else:
-                        ui.notify('❌ Failed to create note', type='negative')
-                else:
-                    ui.notify('Please select a project first', type='warning')
-            
-            ui.button('Create Project Note', on_click=create_project_note).classes('bg-green-500 text-white')
+            ui.button('Create Project Note', on_click=partial(
+                _create_selected_project_note, selected_project, dendron_status['vault_path'],
+            )).classes('bg-green-500 text-white')
         
         # Quick create buttons for active projects
-        active_projects = [p for p in pmbok_viewer.projects if pmbok_viewer.get_project_effective_status(p).lower() in ['in progress', 'active']]
+        active_projects = pmbok_viewer.get_active_projects()
         if active_projects:
             ui.label('Quick create notes for active projects:').classes('text-sm font-semibold mt-4 mb-2')
             with ui.row().classes('gap-2 flex-wrap'):
@@ -2660,419 +3066,15 @@ def dendron_integration():
                     project_name = project.get('Project_Name', 'Unnamed')[:20]
                     project_number = project.get('Project_Number', 'N/A')
                     
-                    def create_quick_note(pid=project_id, pname=project_name, pnumber=project_number):
-                        note_path = pmbok_viewer.create_dendron_project_note(pid, dendron_status['vault_path'])
-                        if note_path:
-                            ui.notify(f'✅ Created note for {pnumber}', type='positive')
-                            ui.navigate.reload()
-                        else:
-                            ui.notify(f'❌ Failed to create note for {pnumber}', type='negative')
-                    
-                    ui.button(f'{project_number}: {project_name}', on_click=create_quick_note).classes('bg-blue-400 text-white text-xs')
-
-
-
-# @ui.page('/engagement')
-# def engagement_page():
-#     """Team engagement analysis page"""
-#     ui.page_title("Team Engagement Analysis")
-    
-#     # Header
-#     with ui.row().classes('w-full'):
-#         with ui.card().classes('w-full'):
-#             ui.label('👥 Team Engagement Analysis').classes('text-3xl font-bold text-center')
-#             ui.label('CRP/Caribou Project Resource Allocation Summary').classes('text-lg text-center text-gray-600')
-    
-#     # Navigation buttons
-#     with ui.row().classes('w-full justify-center gap-4 mb-6'):
-#         ui.button('Portfolio Overview', on_click=lambda: ui.navigate.to('/')).classes('bg-blue-500 text-white')
-#         ui.button('Status Dashboard', on_click=lambda: ui.navigate.to('/status-dashboard')).classes('bg-purple-500 text-white')
-#         ui.button('PMBOK Analysis', on_click=lambda: ui.navigate.to('/pmbok-report')).classes('bg-green-500 text-white')
-    
-#     # Configuration validation
-#     try:
-#         from enhanced_get_team_engagement import TeamEngagementAnalyzer
-#         analyzer = TeamEngagementAnalyzer()
-#         config = analyzer.validate_configuration()
-        
-#         if not config['is_valid']:
-#             with ui.card().classes('w-full bg-yellow-50'):
-#                 ui.label('⚠️ Configuration Required').classes('text-xl font-bold text-yellow-600')
-#                 ui.label('Missing environment variables:').classes('text-yellow-700')
-#                 for var in config['missing_vars']:
-#                     ui.label(f'• {var}').classes('text-yellow-600 ml-4')
-#                 ui.label('Please check your .env file configuration.').classes('text-gray-600 mt-2')
-#                 ui.label('This feature requires ArcGIS Online access to analyze all CRP/Caribou projects.').classes('text-gray-600')
-#             return
-        
-#         if not config['client_available']:
-#             with ui.card().classes('w-full bg-red-50'):
-#                 ui.label('❌ ArcGIS Connection Failed').classes('text-xl font-bold text-red-600')
-#                 ui.label('Could not connect to ArcGIS Online.').classes('text-red-500')
-#                 ui.label('Please check your credentials and network connection.').classes('text-gray-600')
-#             return
-    
-#     except ImportError as e:
-#         with ui.card().classes('w-full bg-red-50'):
-#             ui.label('❌ Module Import Error').classes('text-xl font-bold text-red-600')
-#             ui.label(f'Could not import team engagement analyzer: {e}').classes('text-red-500')
-#             ui.label('Please ensure enhanced_get_team_engagement.py is available.').classes('text-gray-600')
-#         return
-    
-#     # Loading indicator
-#     loading_container = ui.row().classes('w-full justify-center')
-#     with loading_container:
-#         ui.spinner('dots', size='lg', color='primary')
-#         ui.label('Loading engagement data from ArcGIS...').classes('text-lg ml-4')
-    
-#     # Analyze engagement data
-#     try:
-#         print("Starting engagement analysis...")
-#         analysis_result = analyzer.analyze_engagement_data()
-        
-#         # Clear loading indicator
-#         loading_container.clear()
-        
-#         if analysis_result['error']:
-#             with ui.card().classes('w-full bg-red-50'):
-#                 ui.label('❌ Error Loading Data').classes('text-xl font-bold text-red-600')
-#                 ui.label(f'Error: {analysis_result["error"]}').classes('text-red-500')
-#                 ui.label('Please check your ArcGIS configuration and try again.').classes('text-gray-600')
-                
-#                 # Show debugging information
-#                 ui.label('Debugging Information:').classes('text-sm font-semibold text-gray-700 mt-4')
-#                 ui.label(f'GSS_PROJECTS_TABLE_URL: {os.getenv("GSS_PROJECTS_TABLE_URL", "Not set")[:100]}...').classes('text-xs text-gray-600')
-#                 ui.label(f'GSS_RESOURCES_TABLE_URL: {os.getenv("GSS_RESOURCES_TABLE_URL", "Not set")[:100]}...').classes('text-xs text-gray-600')
-#                 ui.label(f'ARCGIS_USERNAME: {"Set" if os.getenv("ARCGIS_USERNAME") else "Not set"}').classes('text-xs text-gray-600')
-#             return
-        
-#         engagement_data = analysis_result['engagement_summary']
-#         total_projects = analysis_result['total_projects']
-#         total_people = analysis_result['total_people']
-        
-#         # Show results
-#         with ui.row().classes('w-full'):
-#             with ui.column().classes('w-full'):
-                
-#                 # Summary metrics
-#                 with ui.row().classes('w-full justify-center gap-4 mb-6'):
-#                     with ui.card().classes('text-center bg-blue-50 p-4'):
-#                         ui.label(str(total_projects)).classes('text-3xl font-bold text-blue-600')
-#                         ui.label('Total CRP/Caribou Projects').classes('text-gray-600')
-                    
-#                     with ui.card().classes('text-center bg-green-50 p-4'):
-#                         ui.label(str(total_people)).classes('text-3xl font-bold text-green-600')
-#                         ui.label('People Engaged').classes('text-gray-600')
-                    
-#                     if total_people > 0:
-#                         avg_projects = round(total_projects / total_people, 1)
-#                         with ui.card().classes('text-center bg-orange-50 p-4'):
-#                             ui.label(str(avg_projects)).classes('text-3xl font-bold text-orange-600')
-#                             ui.label('Avg Projects per Person').classes('text-gray-600')
-                
-#                 # Show detailed analysis breakdown
-#                 with ui.card().classes('w-full mb-6 p-4 bg-blue-50 border-l-4 border-blue-400'):
-#                     ui.label('📊 Analysis Breakdown').classes('text-lg font-bold text-blue-800 mb-3')
-                    
-#                     # Calculate detailed statistics
-#                     actual_workers = {}
-#                     coordinator_fallbacks = {}
-#                     explicit_assignments = 0
-#                     coordinator_assignments = 0
-                    
-#                     for person, data in engagement_data.items():
-#                         has_actual_role = any(role != 'Coordinator (default)' for role in data.get('roles', []))
-#                         if has_actual_role:
-#                             actual_workers[person] = data
-#                         else:
-#                             coordinator_fallbacks[person] = data
-                        
-#                         # Count assignment types
-#                         for project in data.get('projects', []):
-#                             if project.get('role') == 'Coordinator (default)':
-#                                 coordinator_assignments += 1
-#                             else:
-#                                 explicit_assignments += 1
-                    
-#                     projects_with_assignments = len(set(project.get('project_id') for person_data in engagement_data.values() 
-#                                                       for project in person_data.get('projects', []) 
-#                                                       if project.get('role') != 'Coordinator (default)'))
-                    
-#                     with ui.grid(columns=2).classes('gap-4 w-full'):
-#                         with ui.column():
-#                             ui.label(f'• {total_projects} CRP/Caribou projects found (current and completed)').classes('text-sm text-blue-700')
-#                             ui.label(f'• {projects_with_assignments} projects with explicit team assignments').classes('text-sm text-blue-700')
-#                             ui.label(f'• {len(actual_workers)} people with assigned work roles').classes('text-sm text-blue-700')
-                        
-#                         with ui.column():
-#                             ui.label(f'• {explicit_assignments} actual resource assignments found').classes('text-sm text-blue-700')
-#                             ui.label(f'• {coordinator_assignments} projects using coordinator fallback').classes('text-sm text-blue-700')
-#                             ui.label(f'• {total_people} total people engaged across all projects').classes('text-sm text-blue-700')
-                
-#                 # Top engaged people (separated by assignment type)
-#                 if engagement_data:
-#                     # Show actual team members first
-#                     if actual_workers:
-#                         ui.label('🏆 Most Engaged Team Members (Assigned Roles)').classes('text-2xl font-bold mb-4')
-#                         actual_top_people = sorted(actual_workers.items(), key=lambda x: x[1]['total_projects'], reverse=True)[:5]
-                        
-#                         with ui.card().classes('w-full mb-6'):
-#                             for i, (person_name, person_data) in enumerate(actual_top_people, 1):
-#                                 actual_projects = len([p for p in person_data['projects'] if p.get('role') != 'Coordinator (default)'])
-#                                 actual_roles = [r for r in person_data['roles'] if r != 'Coordinator (default)']
-#                                 roles = ', '.join(actual_roles)
-                                
-#                                 # Color coding for workload levels
-#                                 if actual_projects >= 5:
-#                                     color_class = 'text-red-600'
-#                                     icon = '🔥'
-#                                 elif actual_projects >= 3:
-#                                     color_class = 'text-orange-600'
-#                                     icon = '⚡'
-#                                 else:
-#                                     color_class = 'text-green-600'
-#                                     icon = '✅'
-                                
-#                                 with ui.row().classes('items-center gap-4 p-2 border-b'):
-#                                     ui.label(f'{i}.').classes('text-lg font-bold w-8')
-#                                     ui.label(icon).classes('text-xl')
-#                                     ui.label(person_name).classes('text-lg font-semibold flex-grow')
-#                                     ui.label(f'{actual_projects} projects').classes(f'text-lg {color_class} font-bold')
-#                                     ui.label(f'({roles})').classes('text-sm text-gray-500')
-                    
-#                     # Show coordinator fallbacks if there are significant numbers
-#                     if coordinator_fallbacks and len(coordinator_fallbacks) > 3:
-#                         ui.label('📋 Top Project Coordinators (Fallback Assignment)').classes('text-xl font-bold mb-4 mt-6')
-#                         ui.label('These are coordinators for projects without explicit team assignments.').classes('text-sm text-gray-600 mb-4')
-                        
-#                         coordinator_top_people = sorted(coordinator_fallbacks.items(), key=lambda x: x[1]['total_projects'], reverse=True)[:5]
-                        
-#                         with ui.card().classes('w-full mb-6 bg-yellow-50'):
-#                             for i, (person_name, person_data) in enumerate(coordinator_top_people, 1):
-#                                 total_projects = person_data['total_projects']
-                                
-#                                 with ui.row().classes('items-center gap-4 p-2 border-b border-yellow-200'):
-#                                     ui.label(f'{i}.').classes('text-lg font-bold w-8')
-#                                     ui.label('📋').classes('text-xl')
-#                                     ui.label(person_name).classes('text-lg font-semibold flex-grow')
-#                                     ui.label(f'{total_projects} projects').classes('text-lg text-orange-600 font-bold')
-#                                     ui.label('(Coordinator)').classes('text-sm text-gray-500')
-                
-#                 # Engagement table
-#                 if engagement_data:
-#                     ui.label('📊 Complete Engagement Summary').classes('text-2xl font-bold mb-4 mt-8')
-                    
-#                     # Sort people by total projects (descending)
-#                     sorted_people = sorted(engagement_data.items(), 
-#                                          key=lambda x: x[1]['total_projects'], 
-#                                          reverse=True)
-                    
-#                     with ui.card().classes('w-full'):
-#                         with ui.element('div').classes('overflow-x-auto'):
-#                             with ui.element('table').classes('min-w-full divide-y divide-gray-200'):
-#                                 # Header
-#                                 with ui.element('thead').classes('bg-gray-50'):
-#                                     with ui.element('tr'):
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Person')
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Total Projects')
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('As Coordinator')
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('As Team Member')
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Roles')
-#                                         ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Projects')
-                                
-#                                 # Body
-#                                 with ui.element('tbody').classes('bg-white divide-y divide-gray-200'):
-#                                     for person_name, person_data in sorted_people:
-#                                         total_projects = person_data['total_projects']
-#                                         coord_projects = person_data['coordinator_projects']
-#                                         team_projects = person_data['team_member_projects']
-#                                         roles = ', '.join(person_data['roles'])
-                                        
-#                                         # Color coding based on workload
-#                                         if total_projects >= 5:
-#                                             row_class = 'bg-red-50'
-#                                         elif total_projects >= 3:
-#                                             row_class = 'bg-yellow-50'
-#                                         else:
-#                                             row_class = 'bg-white'
-                                        
-#                                         with ui.element('tr').classes(row_class):
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900'):
-#                                                 ui.label(person_name)
-                                            
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                 ui.label(str(total_projects)).classes('font-semibold')
-                                            
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                 ui.label(str(coord_projects))
-                                            
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                 ui.label(str(team_projects))
-                                            
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                 ui.label(roles)
-                                            
-#                                             with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                 # Show project list (truncated)
-#                                                 project_list = []
-#                                                 for proj in person_data['projects'][:3]:  # Show first 3
-#                                                     project_list.append(f"{proj['project_number']} ({proj['role']})")
-                                                
-#                                                 display_text = ', '.join(project_list)
-#                                                 if len(person_data['projects']) > 3:
-#                                                     display_text += f" +{len(person_data['projects']) - 3} more"
-                                                
-#                                                 ui.label(display_text)
-#                 else:
-#                     with ui.card().classes('w-full bg-gray-50'):
-#                         ui.label('No engagement data found').classes('text-lg text-gray-600')
-#                         ui.label(f'Found {total_projects} projects but no resource assignments').classes('text-gray-500')
-                
-#                 # Analytics section
-#                 if engagement_data:
-#                     # Client engagement analysis
-#                     ui.label('👥 Client Engagement Analysis').classes('text-2xl font-bold mb-4 mt-8')
-                    
-#                     try:
-#                         # Get client engagement data
-#                         client_result = analyzer.analyze_client_engagement()
-                        
-#                         if client_result.get('error'):
-#                             with ui.card().classes('w-full bg-red-50'):
-#                                 ui.label('Error loading client data').classes('text-lg text-red-600')
-#                                 ui.label(client_result['error']).classes('text-red-500')
-#                         else:
-#                             client_data = client_result.get('client_summary', {})
-#                             total_clients = client_result.get('total_clients', 0)
-                            
-#                             with ui.card().classes('w-full mb-6'):
-#                                 ui.label(f'📊 Client Summary: {total_clients} clients have submitted {total_projects} CRP/Caribou projects').classes('text-lg font-semibold mb-4')
-                                
-#                                 if client_data:
-#                                     # Top clients table
-#                                     top_clients = analyzer.get_top_clients(client_data, 10)
-                                    
-#                                     with ui.element('div').classes('overflow-x-auto'):
-#                                         with ui.element('table').classes('min-w-full divide-y divide-gray-200'):
-#                                             # Header
-#                                             with ui.element('thead').classes('bg-gray-50'):
-#                                                 with ui.element('tr'):
-#                                                     ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Client Name')
-#                                                     ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Total Projects')
-#                                                     ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Status Breakdown')
-#                                                     ui.element('th').classes('px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider').add('Recent Projects')
-                                            
-#                                             # Body
-#                                             with ui.element('tbody').classes('bg-white divide-y divide-gray-200'):
-#                                                 for client_name, client_data_item in top_clients:
-#                                                     total_projects = client_data_item['total_projects']
-                                                    
-#                                                     # Color coding based on project count
-#                                                     if total_projects >= 8:
-#                                                         row_class = 'bg-green-50'
-#                                                     elif total_projects >= 5:
-#                                                         row_class = 'bg-blue-50'
-#                                                     elif total_projects >= 3:
-#                                                         row_class = 'bg-yellow-50'
-#                                                     else:
-#                                                         row_class = 'bg-white'
-                                                    
-#                                                     with ui.element('tr').classes(row_class):
-#                                                         with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900'):
-#                                                             ui.label(client_name)
-                                                        
-#                                                         with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                             ui.label(str(total_projects)).classes('font-semibold')
-                                                        
-#                                                         with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                             # Status breakdown
-#                                                             statuses = client_data_item.get('project_statuses', {})
-#                                                             status_parts = []
-#                                                             for status, count in statuses.items():
-#                                                                 status_parts.append(f"{status}: {count}")
-#                                                             ui.label(', '.join(status_parts))
-                                                        
-#                                                         with ui.element('td').classes('px-6 py-4 whitespace-nowrap text-sm text-gray-500'):
-#                                                             # Recent projects (show first 3)
-#                                                             projects = client_data_item.get('projects', [])
-#                                                             recent_projects = []
-#                                                             for proj in projects[:3]:
-#                                                                 recent_projects.append(f"{proj.get('number', 'N/A')}")
-                                                            
-#                                                             display_text = ', '.join(recent_projects)
-#                                                             if len(projects) > 3:
-#                                                                 display_text += f" +{len(projects) - 3} more"
-                                                            
-#                                                             ui.label(display_text)
-                    
-#                     except Exception as e:
-#                         with ui.card().classes('w-full bg-red-50'):
-#                             ui.label('Error loading client analysis').classes('text-lg text-red-600')
-#                             ui.label(str(e)).classes('text-red-500')
-                    
-#                     # Workload distribution
-#                     ui.label('📈 Workload Distribution').classes('text-2xl font-bold mb-4 mt-8')
-#                     workload_counts = analyzer.get_workload_distribution(engagement_data)
-                    
-#                     with ui.card().classes('w-full'):
-#                         ui.label('People by Project Count').classes('text-lg font-semibold mb-4')
-                        
-#                         for category in ['1 project', '2 projects', '3 projects', '4 projects', '5+ projects']:
-#                             count = workload_counts.get(category, 0)
-#                             if count > 0:
-#                                 with ui.row().classes('items-center gap-4 mb-2'):
-#                                     ui.label(category).classes('w-24')
-                                    
-#                                     # Simple bar chart
-#                                     max_width = max(workload_counts.values()) if workload_counts else 1
-#                                     bar_width = (count / max_width) * 200  # Max 200px wide
-                                    
-#                                     with ui.element('div').classes(f'bg-blue-500 h-6 rounded').style(f'width: {bar_width}px'):
-#                                         pass
-                                    
-#                                     ui.label(f'{count} people').classes('ml-2')
-                    
-#                     # Role distribution
-#                     ui.label('🎭 Role Distribution').classes('text-2xl font-bold mb-4 mt-8')
-#                     role_stats = analyzer.get_role_distribution(engagement_data)
-                    
-#                     with ui.card().classes('w-full'):
-#                         with ui.row().classes('justify-center gap-8'):
-#                             for role, count in role_stats.items():
-#                                 if count > 0:
-#                                     with ui.card().classes('text-center bg-gray-50 p-4'):
-#                                         ui.label(str(count)).classes('text-2xl font-bold text-blue-600')
-#                                         ui.label(f'{role} Only' if role != 'Both' else 'Both Roles').classes('text-gray-600')
-                
-#                 # Action buttons
-#                 with ui.row().classes('w-full justify-center mt-8 gap-4'):
-#                     def refresh_engagement():
-#                         ui.navigate.reload()
-                    
-#                     def test_analyzer():
-#                         # Run the standalone test
-#                         from enhanced_get_team_engagement import main as test_main
-#                         test_main()
-#                         ui.notify('Test completed! Check terminal output.', type='positive')
-                    
-#                     ui.button('🔄 Refresh Data', on_click=refresh_engagement).classes('bg-blue-500 text-white px-6 py-3')
-#                     ui.button('🧪 Test Analyzer', on_click=test_analyzer).classes('bg-gray-500 text-white px-6 py-3')
-        
-#     except Exception as e:
-#         loading_container.clear()
-#         with ui.card().classes('w-full bg-red-50'):
-#             ui.label('❌ Error Loading Engagement Data').classes('text-xl font-bold text-red-600')
-#             ui.label(f'Error: {str(e)}').classes('text-red-500')
-#             ui.label('Please check your ArcGIS configuration and try again.').classes('text-gray-600')
-            
-#             # Show more debugging info
-#             import traceback
-#             ui.label('Technical Details:').classes('text-sm font-semibold text-gray-700 mt-4')
-#             with ui.element('pre').classes('text-xs text-gray-600 bg-gray-100 p-2 rounded overflow-auto max-h-40'):
-#                 ui.label(traceback.format_exc())
+                    ui.button(f'{project_number}: {project_name}', on_click=partial(
+                        _create_quick_note, project_id, project_number, dendron_status['vault_path'],
+                    )).classes('bg-blue-400 text-white text-xs')
 
 
 if __name__ in {"__main__", "__mp_main__"}:
+    # Debug output is off unless LOG_LEVEL=DEBUG
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'WARNING').upper())
+    
     print("🚀 Starting PMBOK-Aligned Caribou Portal...")
     print("📊 Loading project portfolio...")
     
@@ -3080,11 +3082,17 @@ if __name__ in {"__main__", "__mp_main__"}:
     #     print("❌ JSON file not found. Please run enhanced_get_projects_s3.py first.")
     #     exit(1)
     
-    count = pmbok_viewer.refresh_data()
-    metrics = pmbok_viewer.get_project_metrics()
+    # The viewer already loaded the portfolio from S3 when it was created; warm the metrics cache
+    # once the server has started (only the serving process runs startup handlers, not the reload supervisor)
+    def warm_portfolio():
+        metrics = pmbok_viewer.get_project_metrics()
+        print(f"✅ Portfolio loaded: {len(pmbok_viewer.projects)} projects")
+        print(f"📈 Health: {metrics.get('on_track_count', 0)} on track, {metrics.get('at_risk_count', 0)} at risk, {metrics.get('overdue_count', 0)} overdue")
+    
+    async def warm_portfolio_on_startup():
+        await run.io_bound(warm_portfolio)
+    app.on_startup(warm_portfolio_on_startup)
     
-    print(f"✅ Portfolio loaded: {count} projects")
-    print(f"📈 Health: {metrics.get('on_track_count', 0)} on track, {metrics.get('at_risk_count', 0)} at risk, {metrics.get('overdue_count', 0)} overdue")
     print("🌐 Starting PMBOK dashboard...")
     print("📱 Portfolio Dashboard: http://localhost:8080")
     print("📊 PMBOK Report: http://localhost:8080/pmbok-report")
@@ -3095,6 +3103,7 @@ if __name__ in {"__main__", "__mp_main__"}:
         host='0.0.0.0',
         port=8080,
         title='PMBOK Caribou Portal - Project Portfolio Management',
-        reload=True,
+        # The file-watching reloader is for development only; set CARIBOU_RELOAD=1 to enable it
+        reload=os.getenv('CARIBOU_RELOAD') == '1',
         show=False
     )